@@ -474,7 +474,7 @@ def _filter_by_keywords(
             if q:
                 # Include all leaf parts
                 matched_labels[qid] = {
-                    part.label for part in q.question_node.iter_all()
+                    part.label for part in q.question_node.all_parts()
                     if part.is_leaf
                 }
         else:
@@ -482,7 +482,7 @@ def _filter_by_keywords(
             q = next((q for q in questions if q.id == qid), None)
             if q:
                 matched_labels[qid].update(
-                    part.label for part in q.question_node.iter_all()
+                    part.label for part in q.question_node.all_parts()
                     if part.is_leaf
                 )
     
@@ -173,7 +173,7 @@ class KeywordIndex:
         
         # Also try to get text from parts themselves
         if hasattr(question, 'question_node'):
-            for part in question.question_node.iter_all():
+            for part in question.question_node.all_parts():
                 label = part.label
                 if label and label not in part_texts:
                     # Try to get any text associated with the part
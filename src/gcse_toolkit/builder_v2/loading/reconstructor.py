@@ -306,13 +306,12 @@ def validate_part_tree(root: Part) -> List[str]:
             if part.bounds.bottom > parent_bounds.bottom:
                 warnings.append(f"{part.label} bottom {part.bounds.bottom} below parent {parent_bounds.bottom}")
         
-        # Check sibling overlap
-        for i, child in enumerate(part.children):
-            for j, other in enumerate(part.children):
-                if i >= j:
-                    continue
-                if child.bounds.overlaps(other.bounds):
-                    warnings.append(f"Overlapping siblings: {child.label} and {other.label}")
+        # Check sibling overlap (children are sorted by top, so only
+        # neighbours can overlap)
+        children = part.children
+        for child, other in zip(children, children[1:]):
+            if child.bounds.overlaps(other.bounds):
+                warnings.append(f"Overlapping siblings: {child.label} and {other.label}")
         
         # Recurse
         for child in part.children:
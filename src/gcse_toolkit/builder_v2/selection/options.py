@@ -22,6 +22,7 @@ Used By:
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import combinations
@@ -66,6 +67,11 @@ class QuestionOptions:
         """Minimum marks (smallest option)."""
         return self.options[-1].marks if self.options else 0
     
+    @cached_property
+    def _mark_keys(self) -> tuple[int, ...]:
+        """Negated option marks (ascending), for bisecting the sorted options."""
+        return tuple(-option.marks for option in self.options)
+    
     @property
     def option_count(self) -> int:
         """Number of valid options."""
@@ -82,9 +88,11 @@ class QuestionOptions:
         Yields:
             SelectionPlan objects within range
         """
-        for option in self.options:
-            if min_marks <= option.marks <= max_marks:
-                yield option
+        # Options are sorted by marks desc, so the range is one contiguous slice
+        keys = self._mark_keys
+        lo = bisect_left(keys, -max_marks)
+        hi = bisect_right(keys, -min_marks)
+        return iter(self.options[lo:hi])
     
     def best_option_for_marks(self, target: int) -> SelectionPlan | None:
         """
@@ -96,10 +104,9 @@ class QuestionOptions:
         Returns:
             Best matching SelectionPlan or None
         """
-        for option in self.options:  # Already sorted desc
-            if option.marks <= target:
-                return option
-        return None
+        # Already sorted desc: first option at or under target
+        idx = bisect_left(self._mark_keys, -target)
+        return self.options[idx] if idx < len(self.options) else None
 
 
 from .part_mode import PartMode
@@ -32,7 +32,7 @@ from __future__ import annotations
 import logging
 import random
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set
 
 from gcse_toolkit.core.models import Question
 from gcse_toolkit.core.models.selection import SelectionPlan, SelectionResult
@@ -44,29 +44,72 @@ from .part_mode import PartMode
 logger = logging.getLogger(__name__)
 
 
-def _filter_topic_from_tail(question: Question, topic_set: set) -> set:
+def _effective_leaf_topics(question: Question) -> tuple[str, ...]:
+    """Effective topic of each leaf (leaf topic, else question topic)."""
+    question_topic = question.topic
+    return tuple(leaf.topic or question_topic for leaf in question.leaf_parts)
+
+
+def _filter_topic_from_tail(
+    question: Question,
+    topic_set: set,
+    leaf_topics: Optional[tuple[str, ...]] = None,
+) -> set:
     """
     Remove mismatched topic children from tail only.
     
     Iterates from end backwards, removing mismatched parts until hitting a match.
     Example: [a:A, b:B, c:A, d:B, e:B, f:B] with topics={A} -> {a, b, c}
-    """
-    leaves = list(question.leaf_parts)
-    
-    # Find last index where topic matches (scanning from end)
-    last_match_idx = len(leaves) - 1
-    while last_match_idx >= 0:
-        leaf = leaves[last_match_idx]
-        effective_topic = leaf.topic or question.topic
-        if effective_topic in topic_set:
-            break
-        last_match_idx -= 1
-    
-    if last_match_idx < 0:
-        return None  # No matches at all
     
-    # Keep all parts up to and including last_match_idx
-    return {leaves[i].label for i in range(last_match_idx + 1)}
+    Args:
+        question: Question to filter
+        topic_set: Requested topics
+        leaf_topics: Precomputed effective leaf topics (computed if omitted)
+    """
+    if leaf_topics is None:
+        leaf_topics = _effective_leaf_topics(question)
+
+    # Single reverse pass: find last index where topic matches
+    for last_match_idx in range(len(leaf_topics) - 1, -1, -1):
+        if leaf_topics[last_match_idx] in topic_set:
+            # Keep all parts up to and including last_match_idx
+            return {leaf.label for leaf in question.leaf_parts[:last_match_idx + 1]}
+
+    return None  # No matches at all
+
+
+def _best_topic_option(
+    marks: Sequence[float],
+    is_full: Sequence[bool],
+    target: float,
+    jitter: Sequence[float],
+) -> int:
+    """
+    Score topic-covering options and return the index of the best one.
+
+    Score is proximity to the per-topic budget (0-10), plus a bonus for
+    full questions (5), plus jitter. Ties keep the earliest index.
+
+    Args:
+        marks: Marks of each candidate option
+        is_full: Whether each candidate is a full question
+        target: Budget-aware per-topic mark target
+        jitter: Pre-drawn random jitter per candidate
+
+    Returns:
+        Index of the best option, or -1 if there are no candidates
+    """
+    best_idx = -1
+    best_score = -1.0
+    for i in range(len(marks)):
+        score = max(0.0, 10.0 - abs(marks[i] - target))
+        if is_full[i]:
+            score += 5.0
+        score += jitter[i]
+        if score > best_score:
+            best_score = score
+            best_idx = i
+    return best_idx
 
 
 class SelectionError(Exception):
@@ -134,7 +177,7 @@ class Selector:
     _question_options: List[QuestionOptions] = field(init=False)
     _selected: List[SelectionPlan] = field(init=False, default_factory=list)
     _used_question_ids: Set[str] = field(init=False, default_factory=set)
-    _covered_topics: Set[str] = field(init=False, default_factory=set)
+    _covered_mask: int = field(init=False, default=0)  # Bitmask over _topic_bits
     _current_marks: int = field(init=False, default=0)
     _size_preference: float = field(init=False, default=0.0)  # -1 to +1: favor small vs large
     
@@ -143,12 +186,37 @@ class Selector:
     _keyword_marks: int = field(init=False, default=0)
     _keyword_parts_count: int = field(init=False, default=0)
     
+    # Config-derived question ID sets (constant across retries)
+    _pinned_qids: frozenset[str] = field(init=False, default=frozenset())
+    _matched_qids: frozenset[str] = field(init=False, default=frozenset())
+    _intended_qids: frozenset[str] = field(init=False, default=frozenset())
+    
+    # Requested topic -> bit; covered topics are tracked as an int bitmask
+    _topic_bits: Dict[str, int] = field(init=False, default_factory=dict)
+    _requested_mask: int = field(init=False, default=0)
+    
+    # Per-question topic indexes keyed by id(question), reused across retries
+    _leaf_topic_cache: Dict[int, tuple[str, ...]] = field(init=False, default_factory=dict)
+    _part_topic_cache: Dict[int, frozenset[str]] = field(init=False, default_factory=dict)
+    
     def __post_init__(self) -> None:
         """Initialize internal state."""
+        self._pinned_qids = frozenset(self.config.pinned_question_ids)
+        self._matched_qids = frozenset(self.config.keyword_matched_labels)
+        # Questions with ANY intent: pinned, part-pinned, or keyword-matched
+        self._intended_qids = (
+            self._pinned_qids
+            | {p.split("::")[0] for p in self.config.pinned_part_labels if "::" in p}
+            | self._matched_qids
+        )
+        self._topic_bits = {
+            topic: 1 << i for i, topic in enumerate(sorted(self.config.topic_set))
+        }
+        self._requested_mask = (1 << len(self._topic_bits)) - 1
         self._rng = random.Random(self.config.seed)
         self._selected = []
         self._used_question_ids = set()
-        self._covered_topics = set()
+        self._covered_mask = 0
         self._current_marks = 0
         # Per-run size preference: -1 (favor small) to +1 (favor large)
         # This creates variety in whether we get few large or many small questions
@@ -195,7 +263,7 @@ class Selector:
         self._rng = random.Random(initial_seed + attempt)
         self._selected = []
         self._used_question_ids = set()
-        self._covered_topics = set()
+        self._covered_mask = 0
         self._current_marks = 0
         self._size_preference = self._rng.uniform(-1.0, 1.0)
         self._pinned_marks = 0
@@ -253,24 +321,16 @@ class Selector:
             # OR if question is pinned or keyword-matched (bypass topic filter)
             filtered = []
             
-            # Pre-calculate pinned/matched IDs for fast lookup
-            special_ids = self.config.pinned_question_ids | set(self.config.keyword_matched_labels.keys())
-            for pin in self.config.pinned_part_labels:
-                if "::" in pin:
-                    special_ids.add(pin.split("::")[0])
+            # Pinned/matched IDs precomputed once in __post_init__
+            special_ids = self._intended_qids
 
             for q in self.questions:
                 if q.id in special_ids:
                     filtered.append(q)
                     continue
-                if q.topic in topic_set:
+                # Question topic or any part topic
+                if not self._part_topics(q).isdisjoint(topic_set):
                     filtered.append(q)
-                    continue
-                # Check parts
-                for part in q.all_parts:
-                    if part.topic and part.topic in topic_set:
-                        filtered.append(q)
-                        break
             self._filtered_questions = filtered
         
         logger.debug(
@@ -284,79 +344,98 @@ class Selector:
     
     def _generate_all_options(self) -> None:
         """Generate options for all filtered questions."""
-        from .part_mode import PartMode
+        # Per-question work is independent; loop invariants are resolved once
+        do_greedy = self.config.allow_greedy_fill
+        if do_greedy is None:
+            do_greedy = not self.config.keyword_mode
+        topic_set = self.config.topic_set if self.config.topics else None
+
         self._question_options = []
         for q in self._filtered_questions:
-            # In keyword mode, restrict options to matched labels
-            if self.config.keyword_mode:
-                matched_labels = self.config.keyword_matched_labels.get(q.id, set())
-                # Add any pinned part labels for this question
-                pinned_for_q = {
-                    label.split("::")[-1]  # Extract label from "qid::label"
-                    for label in self.config.pinned_part_labels
-                    if label.startswith(f"{q.id}::")
-                }
-                # Check if FULL question is pinned
-                is_full_pinned = q.id in self.config.pinned_question_ids
-                
-                # Combine matched and pinned labels
-                allowed_labels = matched_labels | pinned_for_q
-                
-                # If neither pinned nor matched, this question generates NO options in keyword mode
-                # Unless we are explicitly allowing greedy fill from the general pool
-                do_greedy = self.config.allow_greedy_fill
-                if do_greedy is None:
-                    do_greedy = not self.config.keyword_mode
-                
-                if not allowed_labels and not is_full_pinned and not do_greedy:
-                    continue
+            opts = self._generate_question_options(q, do_greedy, topic_set)
+            if opts is not None:
+                self._question_options.append(opts)
+        
+        logger.debug(
+            f"Generated options for {len(self._question_options)} questions"
+        )
 
-                # Expand allowed labels to include children if a parent was pinned/matched
-                # This handles non-leaf pinning (e.g. pinning "1(a)" includes "1(a)(i)")
-                expanded_labels = set(allowed_labels)
-                for label in allowed_labels:
-                    node = q.get_part(label)
-                    if node:
-                        # iter_all yields the node itself then all descendants
-                        for p in node.iter_all():
-                            expanded_labels.add(p.label)
-                
-                opts = generate_options(
-                    q,
-                    part_mode=PartMode.SKIP,  # Keyword Mode always uses SKIP logic
-                    allowed_labels=expanded_labels if expanded_labels else None,
-                )
-            else:
-                # Topic filtering respects part_mode
+    def _generate_question_options(
+        self, q: Question, do_greedy: bool, topic_set: Optional[Set[str]]
+    ) -> Optional[QuestionOptions]:
+        """
+        Generate options for a single question.
+
+        Args:
+            q: Question to generate options for
+            do_greedy: Whether greedy fill from the general pool is allowed
+            topic_set: Requested topics, or None if no topic filter
+
+        Returns:
+            QuestionOptions, or None if the question should be skipped
+        """
+        # In keyword mode, restrict options to matched labels
+        if self.config.keyword_mode:
+            matched_labels = self.config.keyword_matched_labels.get(q.id, set())
+            # Add any pinned part labels for this question
+            pinned_for_q = {
+                label.split("::")[-1]  # Extract label from "qid::label"
+                for label in self.config.pinned_part_labels
+                if label.startswith(f"{q.id}::")
+            }
+            # Check if FULL question is pinned
+            is_full_pinned = q.id in self._pinned_qids
+            
+            # Combine matched and pinned labels
+            allowed_labels = matched_labels | pinned_for_q
+            
+            # If neither pinned nor matched, this question generates NO options in keyword mode
+            # Unless we are explicitly allowing greedy fill from the general pool
+            if not allowed_labels and not is_full_pinned and not do_greedy:
+                return None
+
+            # Expand allowed labels to include children if a parent was pinned/matched
+            # This handles non-leaf pinning (e.g. pinning "1(a)" includes "1(a)(i)")
+            expanded_labels = set(allowed_labels)
+            for label in allowed_labels:
+                node = q.get_part(label)
+                if node:
+                    # all_parts() returns the node itself then all descendants
+                    for p in node.all_parts():
+                        expanded_labels.add(p.label)
+            
+            return generate_options(
+                q,
+                part_mode=PartMode.SKIP,  # Keyword Mode always uses SKIP logic
+                allowed_labels=expanded_labels if expanded_labels else None,
+            )
+
+        # Topic filtering respects part_mode
+        allowed_labels = None
+        if topic_set is not None:
+            if self.config.part_mode == PartMode.ALL:
+                # ALL: No child filtering - question already passed topic filter
                 allowed_labels = None
-                if self.config.topics:
-                    topic_set = self.config.topic_set
-                    
-                    if self.config.part_mode == PartMode.ALL:
-                        # ALL: No child filtering - question already passed topic filter
-                        allowed_labels = None
-                    elif self.config.part_mode == PartMode.PRUNE:
-                        # PRUNE: Remove mismatched from tail only (contiguous)
-                        allowed_labels = _filter_topic_from_tail(q, topic_set)
-                        # If nothing in the question matches the requested topics, skip it
-                        if allowed_labels is None:
-                            continue
-                    else:  # SKIP
-                        # SKIP: Remove all mismatched from anywhere
-                        allowed_labels = {
-                            leaf.label for leaf in q.leaf_parts
-                            if (leaf.topic or q.topic) in topic_set
-                        }
-                
-                opts = generate_options(
-                    q,
-                    part_mode=self.config.part_mode,
-                    allowed_labels=allowed_labels,
+            elif self.config.part_mode == PartMode.PRUNE:
+                # PRUNE: Remove mismatched from tail only (contiguous)
+                allowed_labels = _filter_topic_from_tail(
+                    q, topic_set, self._leaf_topics(q)
                 )
-            self._question_options.append(opts)
+                # If nothing in the question matches the requested topics, skip it
+                if allowed_labels is None:
+                    return None
+            else:  # SKIP
+                # SKIP: Remove all mismatched from anywhere
+                allowed_labels = {
+                    leaf.label
+                    for leaf, topic in zip(q.leaf_parts, self._leaf_topics(q))
+                    if topic in topic_set
+                }
         
-        logger.debug(
-            f"Generated options for {len(self._question_options)} questions"
+        return generate_options(
+            q,
+            part_mode=self.config.part_mode,
+            allowed_labels=allowed_labels,
         )
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -377,13 +456,7 @@ class Selector:
         candidates_by_topic: dict[str, List[QuestionOptions]] = {}
         
         for opts in self._question_options:
-            q = opts.question
-            topics_in_q = set()
-            if q.topic in required_topics:
-                topics_in_q.add(q.topic)
-            for part in q.all_parts:
-                if part.topic and part.topic in required_topics:
-                    topics_in_q.add(part.topic)
+            topics_in_q = self._part_topics(opts.question) & required_topics
             
             for t in topics_in_q:
                 candidates_by_topic.setdefault(t, []).append(opts)
@@ -396,7 +469,7 @@ class Selector:
         self._rng.shuffle(sorted_topics)
         
         for topic in sorted_topics:
-            if topic in self._covered_topics:
+            if self._covered_mask & self._topic_bits[topic]:
                 continue
             
             candidates = candidates_by_topic.get(topic, [])
@@ -427,10 +500,14 @@ class Selector:
         # Shuffle available candidates to avoid bias
         self._rng.shuffle(available)
         
+        # Budget-aware scoring: favor options close to (remaining_marks / remaining_topics)
+        remaining_topics = (self._requested_mask & ~self._covered_mask).bit_count()
+        target_per_topic = remaining_marks / max(1, remaining_topics)
+
         # Find best option that fits remaining budget AND covers the topic
-        best_option: Optional[SelectionPlan] = None
-        best_score = -1
-        
+        # Collect flat arrays of candidates, then score in a single pass
+        covering: List[SelectionPlan] = []
+
         for opts in available:
             # We need an option that actually includes the target topic!
             # Search through possible options for this question
@@ -439,11 +516,6 @@ class Selector:
                 # Even if it exceeds budget, we might need a small option if forced
                 potential_options = [opts.options[-1]] if opts.options else []
 
-            # Pick the best among options that cover the topic
-            # Budget-aware scoring: favor options close to (remaining_marks / remaining_topics)
-            remaining_topics = len(self.config.topic_set - self._covered_topics)
-            target_per_topic = remaining_marks / max(1, remaining_topics)
-            
             # Filter potential options to only those that actually include target_topic
             topic_covering_options = []
             for option in potential_options:
@@ -454,29 +526,20 @@ class Selector:
                         topic_covering_options.append(option)
                         break
             
-            if not topic_covering_options:
-                continue
-                
-            # Score each topic-covering option
-            for option in topic_covering_options:
-                # 1. Proximity to budget-aware target (0-10 scale)
-                # Lower difference = higher score
-                diff = abs(option.marks - target_per_topic)
-                proximity_score = max(0, 10 - diff)
-                
-                # 2. Preference for full questions
-                full_bonus = 5.0 if option.is_full_question else 0
-                
-                # 3. Deterministic Jitter (using self._rng)
-                jitter = self._rng.random() * 5.0
-                
-                score = proximity_score + full_bonus + jitter
-                
-                if score > best_score:
-                    best_score = score
-                    best_option = option
-        
-        return best_option
+            covering.extend(topic_covering_options)
+
+        if not covering:
+            return None
+
+        # Deterministic jitter drawn in candidate order (using self._rng)
+        jitter = [self._rng.random() * 5.0 for _ in covering]
+        best_idx = _best_topic_option(
+            [option.marks for option in covering],
+            [option.is_full_question for option in covering],
+            target_per_topic,
+            jitter,
+        )
+        return covering[best_idx] if best_idx >= 0 else None
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 3.5: Pinned Questions (Keyword Mode)
@@ -491,20 +554,14 @@ class Selector:
         2. Combine labels for that question.
         3. Force Phase 1 & 2 (Pins), then fill Phase 3 (Keywords) while budget allows.
         """
-        # Step 1: Collect all "Intended" questions to avoid pin/keyword blocking
-        intended_qids = (
-            set(self.config.pinned_question_ids) |
-            {p.split("::")[0] for p in self.config.pinned_part_labels if "::" in p} |
-            set(self.config.keyword_matched_labels.keys())
-        )
-        
+        # Step 1: All "Intended" questions (precomputed) to avoid pin/keyword blocking
         # Step 2: Handle Explicit Pins (Phase 1 & 2)
         # Pins are processed first and always FORCED (even if they exceed budget)
-        for qid in intended_qids:
+        for qid in self._intended_qids:
             if qid in self._used_question_ids:
                 continue
             
-            is_q_pinned = qid in self.config.pinned_question_ids
+            is_q_pinned = qid in self._pinned_qids
             pinned_labels = {
                 pin.split("::")[-1] for pin in self.config.pinned_part_labels 
                 if pin.startswith(f"{qid}::")
@@ -567,11 +624,11 @@ class Selector:
                 # Expand to include leaf children (for non-leaf pins)
                 part = opts.question.get_part(label)
                 if part:
-                    for child in part.iter_all():
+                    for child in part.all_parts():
                         if child.is_leaf:
                             pinned_labels_for_q.add(child.label)
         
-        is_full_q_pinned = qid in self.config.pinned_question_ids
+        is_full_q_pinned = qid in self._pinned_qids
         
         option = None
         remaining = self.config.target_marks - self._current_marks
@@ -607,9 +664,9 @@ class Selector:
             origin = "keyword" if is_keyword else ("pinned" if force else "normal")
             self._add_selection(option, origin=origin)
             if force:
-                logger.debug(f"Selected pinned question: {qid}")
+                logger.debug("Selected pinned question: %s", qid)
             else:
-                logger.debug(f"Selected keyword-matched question: {qid}")
+                logger.debug("Selected keyword-matched question: %s", qid)
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 4: Greedy Fill
@@ -626,50 +683,55 @@ class Selector:
         
         Never exceeds target + tolerance.
         """
-        max_allowed = self.config.target_marks + self.config.tolerance
+        # Loop invariants bound to locals once (config is immutable)
+        target_marks = self.config.target_marks
+        max_allowed = target_marks + self.config.tolerance
+        max_questions = self.config.max_questions
+        size_preference = self._size_preference
+        used_ids = self._used_question_ids
+        selected = self._selected
+        rng = self._rng
         
         # Shuffle once for seed-based variety
         candidates = list(self._question_options)
-        self._rng.shuffle(candidates)
+        rng.shuffle(candidates)
         
         for opts in candidates:
             # Stop if we've reached or exceeded target
-            if self._current_marks >= self.config.target_marks:
+            current_marks = self._current_marks
+            if current_marks >= target_marks:
                 break
             
             # Skip already-used questions
-            if opts.question.id in self._used_question_ids:
+            if opts.question.id in used_ids:
                 continue
             
             # Check question count limit
-            if (
-                self.config.max_questions is not None
-                and len(self._selected) >= self.config.max_questions
-            ):
+            if max_questions is not None and len(selected) >= max_questions:
                 break
             
             # Find fitting options (within tolerance limit)
-            remaining = max_allowed - self._current_marks
+            remaining = max_allowed - current_marks
             fitting = list(opts.options_in_range(1, remaining))
             
             if not fitting:
                 continue
             
             # SIZE PREFERENCE: Bias selection based on per-run preference
-            # _size_preference: -1.0 to +1.0 (favor small to favor large)
+            # size_preference: -1.0 to +1.0 (favor small to favor large)
             if len(fitting) == 1:
                 option = fitting[0]
-            elif self._size_preference > 0.3:
+            elif size_preference > 0.3:
                 # Favor large: pick from largest options (fitting is sorted desc by marks)
                 pool = fitting[:min(3, len(fitting))]
-                option = self._rng.choice(pool)
-            elif self._size_preference < -0.3:
+                option = rng.choice(pool)
+            elif size_preference < -0.3:
                 # Favor small: pick from smallest options
                 pool = fitting[-min(3, len(fitting)):]
-                option = self._rng.choice(pool)
+                option = rng.choice(pool)
             else:
                 # Neutral: pick randomly from all fitting options
-                option = self._rng.choice(fitting)
+                option = rng.choice(fitting)
             
             # Add this option
             self._add_selection(option, origin="normal")
@@ -711,7 +773,7 @@ class Selector:
                     if plan.question.id == qid:
                         part = plan.question.get_part(label)
                         if part:
-                            for child in part.iter_all():
+                            for child in part.all_parts():
                                 if child.is_leaf:
                                     protected_labels.add(f"{qid}::{child.label}")
                         break
@@ -801,6 +863,24 @@ class Selector:
     # Helpers
     # ─────────────────────────────────────────────────────────────────────────
     
+    def _leaf_topics(self, question: Question) -> tuple[str, ...]:
+        """Cached effective topic per leaf, aligned with question.leaf_parts."""
+        key = id(question)
+        topics = self._leaf_topic_cache.get(key)
+        if topics is None:
+            topics = self._leaf_topic_cache[key] = _effective_leaf_topics(question)
+        return topics
+    
+    def _part_topics(self, question: Question) -> frozenset[str]:
+        """Cached set of the question topic plus every explicit part topic."""
+        key = id(question)
+        topics = self._part_topic_cache.get(key)
+        if topics is None:
+            found = {part.topic for part in question.all_parts if part.topic}
+            found.add(question.topic)
+            topics = self._part_topic_cache[key] = frozenset(found)
+        return topics
+    
     def _add_selection(self, plan: SelectionPlan, *, origin: str = "normal") -> None:
         """Add a plan to the selection and track covered topics."""
         self._selected.append(plan)
@@ -813,18 +893,20 @@ class Selector:
         elif origin == "pinned":
             self._pinned_marks += plan.marks
         
-        # Add all covered topics from INCLUDED parts
+        # Add all covered requested topics from INCLUDED parts
         # A topic is covered if an included leaf has it, OR if a leaf inherits it
-        for leaf in plan.included_leaves:
-            effective_topic = leaf.topic or plan.question.topic
-            if effective_topic:
-                self._covered_topics.add(effective_topic)
+        topic_bits = self._topic_bits
+        if topic_bits:
+            question_topic = plan.question.topic
+            for leaf in plan.included_leaves:
+                self._covered_mask |= topic_bits.get(leaf.topic or question_topic, 0)
         
         self._current_marks += plan.marks
         
+        # Lazy %-formatting: no string is built when DEBUG is off
         logger.debug(
-            f"Selected {plan.question.id}: {plan.marks} marks "
-            f"(total: {self._current_marks})"
+            "Selected %s: %d marks (total: %d)",
+            plan.question.id, plan.marks, self._current_marks,
         )
     
     def _build_result(self) -> SelectionResult:
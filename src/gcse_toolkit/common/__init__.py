@@ -18,6 +18,7 @@ from .topics import (
     normalise_sub_topic,
     sub_topic_parents,
     iter_all_sub_topics,
+    clear_topic_caches,
     FALLBACK_SUB_TOPIC,
 )
 
@@ -37,6 +38,7 @@ __all__ = [
     "normalise_sub_topic",
     "sub_topic_parents",
     "iter_all_sub_topics",
+    "clear_topic_caches",
     "FALLBACK_SUB_TOPIC",
     # legacy module references
     "bbox_utils",
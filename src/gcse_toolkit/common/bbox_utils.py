@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Tuple
 
 import fitz  # type: ignore
+import numpy as np
 
 
 def bbox_to_pixels(
@@ -58,3 +59,46 @@ def bbox_to_pixels(
         py1 = py0 + 1
         
     return [px0, py0, px1, py1]
+
+
+def bbox_array_to_pixels(
+    bboxes: np.ndarray,
+    clip: fitz.Rect,
+    scale: float,
+    trim_offset: Tuple[int, int],
+    offset_y: int = 0,
+) -> np.ndarray:
+    """Convert many PDF bounding boxes to pixel coordinates at once.
+    
+    Vectorized equivalent of :func:`bbox_to_pixels` for an ``(N, 4)`` array
+    of boxes. Rounding matches Python's ``round`` (half to even).
+    
+    Args:
+        bboxes: Array of shape (N, 4) with rows (x0, y0, x1, y1) in PDF coordinates.
+        clip: Clipping rectangle that defines the extracted region.
+        scale: Scale factor from PDF to pixel coordinates (typically DPI/72.0).
+        trim_offset: Whitespace trim offset as (offset_x, offset_y) in pixels.
+        offset_y: Additional vertical offset for multi-page stitching (default: 0).
+        
+    Returns:
+        int32 array of shape (N, 4) with rows [px0, py0, px1, py1],
+        ensuring px1 > px0 and py1 > py0.
+        
+    Example:
+        >>> boxes = np.array([[100.0, 200.0, 150.0, 220.0]])
+        >>> bbox_array_to_pixels(boxes, fitz.Rect(0, 0, 595, 842), 2.5, (5, 10))
+        array([[245, 490, 370, 540]], dtype=int32)
+    """
+    trim_x, trim_y = trim_offset
+    origin = np.array([clip.x0, clip.y0, clip.x0, clip.y0], dtype=np.float64)
+    shift = np.array(
+        [trim_x, trim_y - offset_y, trim_x, trim_y - offset_y], dtype=np.int32
+    )
+    
+    arr = np.rint((np.asarray(bboxes, dtype=np.float64).reshape(-1, 4) - origin) * scale)
+    pixels = arr.astype(np.int32) - shift
+    
+    # Ensure valid bounding boxes (x1 > x0, y1 > y0)
+    np.maximum(pixels[:, 2], pixels[:, 0] + 1, out=pixels[:, 2])
+    np.maximum(pixels[:, 3], pixels[:, 1] + 1, out=pixels[:, 3])
+    return pixels
@@ -7,8 +7,12 @@ file path operations across the toolkit.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
+_PAPER_PREFIX_RE = re.compile(r"^(.+?)_(?:qp|ms)_")
+_CLEAN_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 def extract_paper_prefix(filename: str | Path) -> str:
     """Extract the standard prefix from an exam paper filename.
@@ -30,11 +34,18 @@ def extract_paper_prefix(filename: str | Path) -> str:
         >>> extract_paper_prefix(Path("/data/0470_m20_qp_11.pdf"))
         '0470_m20'
     """
-    if isinstance(filename, Path):
-        filename = filename.name
-    
+    # Fast path: plain strings skip the Path dispatch entirely
+    if type(filename) is str:
+        return _extract_prefix_from_name(filename)
+    name = getattr(filename, "name", None)
+    return _extract_prefix_from_name(name if name is not None else str(filename))
+
+
+@lru_cache(maxsize=2048)
+def _extract_prefix_from_name(filename: str) -> str:
+    """Cached prefix extraction for a bare filename string."""
     # Match pattern before _qp_ or _ms_
-    match = re.match(r"^(.+?)_(?:qp|ms)_", filename)
+    match = _PAPER_PREFIX_RE.match(filename)
     if match:
         return match.group(1)
     
@@ -42,7 +53,8 @@ def extract_paper_prefix(filename: str | Path) -> str:
     return Path(filename).stem
 
 
-def part_tokens(label: str) -> list[str]:
+@lru_cache(maxsize=2048)
+def part_tokens(label: str) -> tuple[str, ...]:
     """Parse a question label into hierarchical tokens.
     
     Extracts the question number and sub-part identifiers from a question label.
@@ -52,26 +64,40 @@ def part_tokens(label: str) -> list[str]:
         label: Question label like "q3", "q5(a)", or "q1(a)(ii)".
         
     Returns:
-        List of tokens representing the hierarchy, e.g. ["3", "a", "ii"].
+        Tuple of tokens representing the hierarchy, e.g. ("3", "a", "ii").
+        Results are cached, so a tuple is returned rather than a list.
         
     Examples:
         >>> part_tokens("q3")
-        ['3']
+        ('3',)
         >>> part_tokens("q5(a)")
-        ['5', 'a']
+        ('5', 'a')
         >>> part_tokens("q1(a)(ii)")
-        ['1', 'a', 'ii']
+        ('1', 'a', 'ii')
     """
+    # Single-pass scanner for q<digits>(<alnum>)(<alnum>)...
     tokens: list[str] = []
-    m = re.match(r"q(\d+)", label, re.IGNORECASE)
-    remainder = label
-    if m:
-        tokens.append(m.group(1))
-        remainder = remainder[m.end():]
-    for piece in re.findall(r"\(([A-Za-z0-9]+)\)", remainder):
-        tokens.append(piece.lower())
+    n = len(label)
+    i = 0
+    if n and label[0] in "qQ":
+        j = 1
+        while j < n and label[j].isdecimal():
+            j += 1
+        if j > 1:
+            tokens.append(label[1:j])
+            i = j
+    while i < n:
+        if label[i] == "(":
+            j = i + 1
+            while j < n and label[j].isascii() and label[j].isalnum():
+                j += 1
+            if j > i + 1 and j < n and label[j] == ")":
+                tokens.append(label[i + 1:j].lower())
+                i = j + 1
+                continue
+        i += 1
     if not tokens:
-        cleaned = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+        cleaned = _CLEAN_RE.sub("_", label).strip("_")
         if cleaned:
             tokens.append(cleaned.lower())
-    return tokens
+    return tuple(tokens)
@@ -3,6 +3,9 @@
 This module contains all hardcoded thresholds, ratios, and magic numbers
 used throughout the extraction and building process. Having these in one
 place makes tuning easier and documents why each value was chosen.
+
+The threshold classes are frozen and slotted: values are constants for the
+lifetime of the process and are read in hot loops.
 """
 
 from __future__ import annotations
@@ -10,7 +13,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImageProcessingThresholds:
     """Thresholds for image processing and trimming."""
     
@@ -37,14 +40,14 @@ class ImageProcessingThresholds:
     sidebar_max_ratio: float = 0.072  # Maximum sidebar when widened
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextDetectionThresholds:
     """Thresholds for text-based detection and classification."""
     
     decorative_line_length: int = 20  # Chars needed for decorative line detection
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutThresholds:
     """Thresholds for layout and cropping decisions."""
     
@@ -61,7 +64,7 @@ class LayoutThresholds:
     final_trim_col_extend_px: int = 2  # Column extension when trimming
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectionThresholds:
     """Thresholds for question selection algorithm."""
     
@@ -96,7 +99,7 @@ class SelectionThresholds:
     underrepresented_moderate_bonus: int = -5  # Moderate preference
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextLayoutThresholds:
     """Thresholds for text layout and sidebar/footer logic."""
 
@@ -119,7 +122,7 @@ class TextLayoutThresholds:
     excerpt_max_chars: int = 800  # Max characters for text excerpt
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectionDetectionThresholds:
     """Thresholds for section label detection and spacing."""
 
@@ -130,7 +133,7 @@ class SectionDetectionThresholds:
     section_bucket_height_px: int = 10  # Bucket height for alignment
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarkSchemeThresholds:
     """Thresholds for mark scheme processing."""
 
@@ -138,7 +141,7 @@ class MarkSchemeThresholds:
     trim_threshold: int = 240  # Threshold for mark scheme trim
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutRenderThresholds:
     """Thresholds for rendering layout and numbering."""
 
@@ -165,7 +168,7 @@ class LayoutRenderThresholds:
     fallback_box_y_ratio: float = 0.015
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RenderValidationThresholds:
     """Thresholds for rendering validation and labeling."""
 
@@ -12,6 +12,7 @@ Key Functions:
     - topic_sub_topics(): Get all sub-topics for each topic
     - classify_sub_topics(): Classify text into sub-topics by pattern matching
     - topic_patterns_from_subtopics(): Get regex patterns for topic matching
+    - clear_topic_caches(): Drop cached per-exam mappings (e.g. after plugin changes)
 
 Dependencies:
     - gcse_toolkit.plugins: Plugin registry for subtopics path resolution
@@ -26,11 +27,19 @@ from __future__ import annotations
 
 import json
 import re
-from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+import sys
+from collections import defaultdict
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 from gcse_toolkit.plugins import MissingResourcesError, resolve_subtopics_path
 
+try:
+    import orjson  # Optional: faster JSON decoding straight from bytes
+except ImportError:
+    orjson = None
+
 
 __all__ = [
     "normalise_topic_label",
@@ -42,15 +51,20 @@ __all__ = [
     "topic_patterns_from_subtopics",
     "sub_topic_parents",
     "iter_all_sub_topics",
+    "clear_topic_caches",
     "FALLBACK_SUB_TOPIC",
 ]
 
 
 _TOPIC_PREFIX_RE = re.compile(r"^\s*(\d+)[\.)\]]\s*(.*)$")
 _TOPIC_SLUG_RE = re.compile(r"^\s*\d+[\.)\]]\s*")
-FALLBACK_SUB_TOPIC = "Subtopic not found"
+_BACKREF_RE = re.compile(r"\\[1-9]")
+# Global inline flags such as "(?x)" (scoped "(?x:...)" groups are fine)
+_INLINE_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+FALLBACK_SUB_TOPIC = sys.intern("Subtopic not found")
 
 
+@lru_cache(maxsize=4096)
 def normalise_topic_label(value: Optional[str]) -> str:
     """
     Normalize a topic label to standard format "NN. Topic Name".
@@ -72,14 +86,15 @@ def normalise_topic_label(value: Optional[str]) -> str:
         return "00. Unknown"
     match = _TOPIC_PREFIX_RE.match(value)
     if not match:
-        return value.strip()
+        return sys.intern(value.strip())
     number = int(match.group(1))
     remainder = match.group(2).strip()
     if remainder:
-        return f"{number:02d}. {remainder}"
-    return f"{number:02d}."
+        return sys.intern(f"{number:02d}. {remainder}")
+    return sys.intern(f"{number:02d}.")
 
 
+@lru_cache(maxsize=4096)
 def normalise_sub_topic(value: Optional[str]) -> str:
     """
     Normalize a sub-topic name for comparison.
@@ -92,10 +107,10 @@ def normalise_sub_topic(value: Optional[str]) -> str:
     """
     if not value:
         return ""
-    return value.strip().lower()
+    return sys.intern(value.strip().lower())
 
 
-@lru_cache(maxsize=None)
+@cache
 def _raw_mapping(exam_code: Optional[str]) -> Dict[str, Dict[str, object]]:
     """Load raw subtopics mapping from plugin configuration."""
     try:
@@ -103,22 +118,32 @@ def _raw_mapping(exam_code: Optional[str]) -> Dict[str, Dict[str, object]]:
     except MissingResourcesError:
         return {}
     try:
-        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except FileNotFoundError:
         return {}
     try:
-        payload = json.loads(text)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        payload = orjson.loads(data) if orjson is not None else json.loads(data)
     except json.JSONDecodeError:
         return {}
     return payload
 
 
-@lru_cache(maxsize=None)
-def _compiled_mapping(exam_code: Optional[str]) -> Dict[str, List[Tuple[str, List[re.Pattern]]]]:
-    """Compile regex patterns from subtopics configuration."""
+class _CompiledMapping(NamedTuple):
+    """Compiled subtopics configuration for one exam."""
+    
+    entries: Dict[str, List[Tuple[str, List[re.Pattern]]]]  # topic -> [(sub_topic, patterns)]
+    slug_index: Dict[str, str]  # topic slug -> canonical topic label
+
+
+@cache
+def _compiled_mapping(exam_code: Optional[str]) -> _CompiledMapping:
+    """Compile regex patterns and the topic slug index from subtopics configuration."""
     compiled: Dict[str, List[Tuple[str, List[re.Pattern]]]] = {}
+    slug_index: Dict[str, str] = {}
     for topic, payload in _raw_mapping(exam_code).items():
         norm_topic = normalise_topic_label(topic)
+        slug_index.setdefault(_topic_slug(norm_topic), norm_topic)
         entries: List[Tuple[str, List[re.Pattern]]] = []
         for item in payload.get("sub_topics", []):  # type: ignore[assignment]
             name = str(item.get("name") or "").strip()
@@ -132,11 +157,70 @@ def _compiled_mapping(exam_code: Optional[str]) -> Dict[str, List[Tuple[str, Lis
                     continue
             entries.append((name, patterns))
         compiled[norm_topic] = entries
-    return compiled
+    return _CompiledMapping(entries=compiled, slug_index=slug_index)
 
 
-@lru_cache(maxsize=None)
-def topic_patterns_from_subtopics(exam_code: Optional[str]) -> Dict[str, List]:
+def _alternation(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Combine patterns into one ``(?:p1)|(?:p2)|...`` alternation.
+    
+    A single search over the alternation matches exactly when any
+    individual pattern would, and its match starts at the leftmost
+    position any of them matches. Returns None if the patterns cannot be
+    combined safely (e.g. inline global flags or numbered backreferences).
+    """
+    # Numbered backreferences would point at the wrong group once combined.
+    # Global inline flags are rejected up front: Python 3.11+ raises on them
+    # mid-pattern, but 3.10 only warns and applies them to every alternative.
+    if any(
+        _BACKREF_RE.search(pattern.pattern) or _INLINE_FLAGS_RE.search(pattern.pattern)
+        for pattern in patterns
+    ):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+            re.IGNORECASE,
+        )
+    except re.error:
+        return None
+
+
+def _fuse_patterns(patterns: List[re.Pattern]) -> Tuple[re.Pattern, ...]:
+    """Fuse a sub-topic's patterns into one alternation where possible."""
+    if len(patterns) < 2:
+        return tuple(patterns)
+    fused = _alternation(patterns)
+    return (fused,) if fused is not None else tuple(patterns)
+
+
+@cache
+def _fused_mapping(exam_code: Optional[str]) -> Dict[str, Tuple[Tuple[str, Tuple[re.Pattern, ...]], ...]]:
+    """Per-topic sub-topic entries with each sub-topic's patterns fused."""
+    return {
+        topic: tuple((name, _fuse_patterns(patterns)) for name, patterns in entries)
+        for topic, entries in _compiled_mapping(exam_code).entries.items()
+    }
+
+
+@cache
+def _topic_gates(exam_code: Optional[str]) -> Dict[str, Optional[re.Pattern]]:
+    """
+    Per-topic alternation of every sub-topic pattern.
+    
+    One scan with the gate tells classify_sub_topics whether any
+    sub-topic can match at all, and where the earliest match starts.
+    None means no gate is available for that topic.
+    """
+    gates: Dict[str, Optional[re.Pattern]] = {}
+    for topic, entries in _compiled_mapping(exam_code).entries.items():
+        patterns = [pattern for _name, pats in entries for pattern in pats]
+        gates[topic] = _alternation(patterns) if patterns else None
+    return gates
+
+
+@cache
+def topic_patterns_from_subtopics(exam_code: Optional[str]) -> Mapping[str, Tuple]:
     """
     Aggregate topic-level regex patterns from both top-level and sub-topic patterns.
     
@@ -144,10 +228,20 @@ def topic_patterns_from_subtopics(exam_code: Optional[str]) -> Dict[str, List]:
         exam_code: Exam code to load patterns for.
         
     Returns:
-        Dict mapping normalized topic labels to lists of pattern objects.
+        Read-only mapping of normalized topic labels to tuples of pattern objects.
         Pattern objects can be strings (legacy) or dicts with 'pattern' and 'weight' keys.
+        The result is cached and shared, so it is immutable.
     """
-    aggregated: Dict[str, List] = {}
+    aggregated: defaultdict[str, list] = defaultdict(list)
+    seen: defaultdict[str, set] = defaultdict(set)
+
+    def _add(topic: str, pattern: object) -> None:
+        # Dedupe inline on the pattern string (dict patterns keyed by 'pattern')
+        pat_key = pattern.get("pattern") if isinstance(pattern, dict) else pattern
+        topic_seen = seen[topic]
+        if pat_key not in topic_seen:
+            topic_seen.add(pat_key)
+            aggregated[topic].append(pattern)
     
     # 1. Extract from Direct Top-Level Patterns (v3 style with weights)
     raw = _raw_mapping(exam_code)
@@ -155,33 +249,18 @@ def topic_patterns_from_subtopics(exam_code: Optional[str]) -> Dict[str, List]:
         norm_topic = normalise_topic_label(topic)
         # Ensure payload is a dict
         if isinstance(payload, dict):
-            top_pats = payload.get("patterns", [])
-            if top_pats:
-                # Pass patterns through as-is (dicts or strings)
-                # classification._compile_patterns_with_weights handles both
-                aggregated.setdefault(norm_topic, []).extend(top_pats)
+            # Pass patterns through as-is (dicts or strings)
+            # classification._compile_patterns_with_weights handles both
+            for pattern in payload.get("patterns", []):
+                _add(norm_topic, pattern)
 
     # 2. Extract from Sub-topics (legacy / v2 style)
-    for topic, entries in _compiled_mapping(exam_code).items():
+    for topic, entries in _compiled_mapping(exam_code).entries.items():
         for _name, compiled_list in entries:
-            if compiled_list:
-                aggregated.setdefault(topic, []).extend(p.pattern for p in compiled_list)
-                
-    # Dedupe patterns - need to handle both strings and dicts
-    final_output = {}
-    for topic, pats in aggregated.items():
-        if pats:
-            seen = set()
-            unique_pats = []
-            for p in pats:
-                # For deduplication, extract the pattern string
-                pat_key = p.get("pattern") if isinstance(p, dict) else p
-                if pat_key not in seen:
-                    seen.add(pat_key)
-                    unique_pats.append(p)
-            final_output[topic] = unique_pats
+            for compiled in compiled_list:
+                _add(topic, compiled.pattern)
             
-    return final_output
+    return MappingProxyType({topic: tuple(pats) for topic, pats in aggregated.items()})
 
 
 def _topic_slug(value: str) -> str:
@@ -190,16 +269,12 @@ def _topic_slug(value: str) -> str:
     return re.sub(r"\s+", " ", cleaned)
 
 
-@lru_cache(maxsize=None)
 def _topic_slug_index(exam_code: Optional[str]) -> Dict[str, str]:
-    """Build index mapping topic slugs to canonical topic labels."""
-    mapping: Dict[str, str] = {}
-    for topic in _compiled_mapping(exam_code).keys():
-        slug = _topic_slug(topic)
-        mapping.setdefault(slug, topic)
-    return mapping
+    """Index mapping topic slugs to canonical topic labels (built with the compiled mapping)."""
+    return _compiled_mapping(exam_code).slug_index
 
 
+@lru_cache(maxsize=2048)
 def resolve_topic_label(value: Optional[str], exam_code: Optional[str] = None) -> str:
     """
     Resolve a topic label to its canonical form.
@@ -221,21 +296,22 @@ def resolve_topic_label(value: Optional[str], exam_code: Optional[str] = None) -
     if not value:
         return normalise_topic_label(value)
     candidate = normalise_topic_label(value)
-    if candidate in _compiled_mapping(exam_code):
+    if candidate in _compiled_mapping(exam_code).entries:
         return candidate
     slug = _topic_slug(candidate)
     return _topic_slug_index(exam_code).get(slug, candidate)
 
 
-@lru_cache(maxsize=None)
-def _sub_topic_index(exam_code: Optional[str]) -> Dict[str, Set[str]]:
+@cache
+def _sub_topic_index(exam_code: Optional[str]) -> Dict[str, FrozenSet[str]]:
     """Build index mapping sub-topic names to parent topic labels."""
     index: Dict[str, Set[str]] = {}
-    for topic, entries in _compiled_mapping(exam_code).items():
+    for topic, entries in _compiled_mapping(exam_code).entries.items():
         for name, _patterns in entries:
             index.setdefault(normalise_sub_topic(name), set()).add(topic)
         index.setdefault(normalise_sub_topic(FALLBACK_SUB_TOPIC), set()).add(topic)
-    return index
+    # Frozen so the cached sets can be handed out without copying
+    return {name: frozenset(parents) for name, parents in index.items()}
 
 
 def classify_sub_topics(
@@ -255,15 +331,26 @@ def classify_sub_topics(
         List of matching sub-topic names. Returns [FALLBACK_SUB_TOPIC]
         if no patterns match.
     """
+    # Fast path: nothing to classify, skip topic resolution and string joins
+    if not any(texts):
+        return [FALLBACK_SUB_TOPIC]
     norm_topic = resolve_topic_label(main_topic, exam_code)
-    entries = _compiled_mapping(exam_code).get(norm_topic, [])
-    combined_text = " ".join(t for t in texts if t).strip()
+    entries = _fused_mapping(exam_code).get(norm_topic, ())
+    combined_text = " ".join(filter(None, texts)).strip()
     matches: List[str] = []
     if combined_text and entries:
-        for name, patterns in entries:
-            if any(pattern.search(combined_text) for pattern in patterns):
-                if name not in matches:
-                    matches.append(name)
+        # Single scan across all sub-topics: bail out if nothing can match,
+        # otherwise no sub-topic can match before the gate's match start
+        start = 0
+        gate = _topic_gates(exam_code).get(norm_topic)
+        if gate is not None:
+            first = gate.search(combined_text)
+            start = first.start() if first else -1
+        if start >= 0:
+            for name, patterns in entries:
+                if any(pattern.search(combined_text, start) for pattern in patterns):
+                    if name not in matches:
+                        matches.append(name)
     if not matches:
         matches.append(FALLBACK_SUB_TOPIC)
     return matches
@@ -293,7 +380,7 @@ def canonical_sub_topic_label(
         return None
     topic = resolve_topic_label(main_topic, exam_code) if main_topic else None
     if topic:
-        canonical_entries = _compiled_mapping(exam_code).get(topic, [])
+        canonical_entries = _compiled_mapping(exam_code).entries.get(topic, [])
         for name, _patterns in canonical_entries:
             if cleaned.lower() == name.lower():
                 return name
@@ -321,7 +408,7 @@ def topic_sub_topics(exam_code: Optional[str] = None) -> Dict[str, List[str]]:
         ['Binary systems', 'Hexadecimal', ..., 'Subtopic not found']
     """
     mapping: Dict[str, List[str]] = {}
-    for topic, entries in _compiled_mapping(exam_code).items():
+    for topic, entries in _compiled_mapping(exam_code).entries.items():
         names = [name for name, _patterns in entries]
         if not any(name.lower() == FALLBACK_SUB_TOPIC.lower() for name in names):
             names.append(FALLBACK_SUB_TOPIC)
@@ -329,7 +416,7 @@ def topic_sub_topics(exam_code: Optional[str] = None) -> Dict[str, List[str]]:
     return mapping
 
 
-def sub_topic_parents(sub_topic: str, exam_code: Optional[str] = None) -> Set[str]:
+def sub_topic_parents(sub_topic: str, exam_code: Optional[str] = None) -> FrozenSet[str]:
     """
     Get all topics that contain a given sub-topic.
     
@@ -338,13 +425,10 @@ def sub_topic_parents(sub_topic: str, exam_code: Optional[str] = None) -> Set[st
         exam_code: Exam code for context.
         
     Returns:
-        Set of topic labels that contain this sub-topic.
+        Frozenset of topic labels that contain this sub-topic (shared, read-only).
     """
     lookup = normalise_sub_topic(sub_topic)
-    parents = _sub_topic_index(exam_code).get(lookup)
-    if not parents:
-        return set()
-    return parents.copy()
+    return _sub_topic_index(exam_code).get(lookup, frozenset())
 
 
 def iter_all_sub_topics(exam_code: Optional[str] = None) -> Iterable[Tuple[str, str]]:
@@ -357,6 +441,36 @@ def iter_all_sub_topics(exam_code: Optional[str] = None) -> Iterable[Tuple[str,
     Yields:
         Tuples of (topic_label, sub_topic_name).
     """
-    for topic, names in topic_sub_topics(exam_code).items():
-        for name in names:
-            yield topic, name
+    return iter(_all_sub_topic_pairs(exam_code))
+
+
+@cache
+def _all_sub_topic_pairs(exam_code: Optional[str]) -> Tuple[Tuple[str, str], ...]:
+    """Flattened (topic, sub_topic) pairs, built once per exam."""
+    return tuple(
+        (topic, name)
+        for topic, names in topic_sub_topics(exam_code).items()
+        for name in names
+    )
+
+
+def clear_topic_caches() -> None:
+    """
+    Clear all cached topic mappings and normalised labels.
+    
+    Per-exam mappings are loaded once per process. Call this after plugin
+    subtopics files change on disk, or between tests that swap mappings.
+    """
+    for cached in (
+        _raw_mapping,
+        _compiled_mapping,
+        _fused_mapping,
+        _topic_gates,
+        topic_patterns_from_subtopics,
+        _sub_topic_index,
+        _all_sub_topic_pairs,
+        resolve_topic_label,
+        normalise_topic_label,
+        normalise_sub_topic,
+    ):
+        cached.cache_clear()
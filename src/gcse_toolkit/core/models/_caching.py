@@ -0,0 +1,59 @@
+"""
+Module: _caching
+
+Purpose:
+    Provides slot_cached - a minimal, lock-free replacement for
+    functools.cached_property that works on slots=True dataclasses.
+    The computed value is stored in a private backing slot named
+    "_<property name>" (None means "not computed yet").
+
+Key Functions:
+    - slot_cached: Decorator for lazily cached, read-only properties
+
+Dependencies:
+    - None
+
+Used By:
+    - core.models.questions.Question
+    - core.models.selection.SelectionPlan / SelectionResult
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class slot_cached:
+    """
+    Cache a property's value in a private backing slot on first access.
+
+    Unlike functools.cached_property this takes no lock and needs no
+    instance __dict__. The owning class must declare a field called
+    "_<name>" that defaults to None, so a computed value of None is not
+    cached.
+
+    Example:
+        >>> @dataclass(slots=True)
+        ... class Thing:
+        ...     _size: Optional[int] = field(default=None, init=False)
+        ...     @slot_cached
+        ...     def size(self) -> int:
+        ...         return expensive()
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+        self.slot = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+        return value
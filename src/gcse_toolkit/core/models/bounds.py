@@ -8,6 +8,7 @@ Purpose:
 
 Key Functions:
     - SliceBounds.crop_from(image): Crop this region from a PIL image
+    - SliceBounds.crop_many(bounds, image): Crop several regions from one image
     - SliceBounds.contains(y): Check if y-coordinate is in region
     - SliceBounds.overlaps(other): Check for overlap with another region
     - SliceBounds.to_dict(): Serialize for JSON
@@ -15,6 +16,7 @@ Key Functions:
 
 Dependencies:
     - dataclasses (std)
+    - functools (std)
     - typing (std)
     - PIL.Image (TYPE_CHECKING only)
 
@@ -34,7 +36,8 @@ Design Deviation from V1:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
 
 if TYPE_CHECKING:
     from PIL import Image
@@ -174,6 +177,31 @@ class SliceBounds:
         right = self.right if self.right is not None else image.width
         return image.crop((self.left, self.top, right, self.bottom))
     
+    @staticmethod
+    def crop_many(
+        bounds: Iterable[SliceBounds], image: Image.Image
+    ) -> list[Image.Image]:
+        """
+        Crop several regions from the same image.
+        
+        Resolves the full-width right edge once for all regions. Keep the
+        results as PIL images and convert to NumPy (if needed) only after
+        cropping, so no intermediate array copies are made.
+        
+        Args:
+            bounds: Regions to crop
+            image: PIL Image to crop from
+            
+        Returns:
+            Cropped images, in the same order as bounds
+        """
+        width = image.width
+        crop = image.crop
+        return [
+            crop((b.left, b.top, b.right if b.right is not None else width, b.bottom))
+            for b in bounds
+        ]
+    
     def as_tuple(self) -> tuple[int, int, int, int]:
         """
         Get as (left, top, right, bottom) tuple for PIL.
@@ -210,22 +238,41 @@ class SliceBounds:
         """
         Deserialize from dictionary.
         
+        Bounds are immutable and frequently repeated across a corpus
+        (shared context bounds, identical part regions), so equal inputs
+        return one shared, memoized instance.
+        
         Args:
             data: Dict with top, bottom, optionally left, right
             
         Returns:
             SliceBounds instance
         """
-        return cls(
-            top=data["top"],
-            bottom=data["bottom"],
-            left=data.get("left", 0),
-            right=data.get("right"),
-            child_is_inline=data.get("child_is_inline", False),
+        args = (
+            data["top"],
+            data["bottom"],
+            data.get("left", 0),
+            data.get("right"),
+            data.get("child_is_inline", False),
         )
+        if cls is SliceBounds:
+            return _cached_bounds(*args)
+        return cls(*args)
     
     def __repr__(self) -> str:
         """Concise representation for debugging."""
         if self.left == 0 and self.right is None:
             return f"SliceBounds({self.top}, {self.bottom})"
         return f"SliceBounds({self.top}, {self.bottom}, {self.left}, {self.right})"
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _cached_bounds(
+    top: int,
+    bottom: int,
+    left: int,
+    right: Optional[int],
+    child_is_inline: bool,
+) -> SliceBounds:
+    """Memoized constructor behind SliceBounds.from_dict (typed: 1 != 1.0 != True)."""
+    return SliceBounds(top, bottom, left, right, child_is_inline)
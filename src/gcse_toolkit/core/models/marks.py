@@ -9,8 +9,10 @@ Purpose:
 Key Functions:
     - Marks.explicit(value): Create marks from explicit detection
     - Marks.aggregate(parts): Calculate marks from child parts
+    - Marks.aggregate_values(values): Sum pre-extracted mark values
     - Marks.inferred(value): Create marks from inference
     - Marks.zero(): Create zero marks
+    - Marks.from_source(value, source): Create marks from serialized data
 
 Dependencies:
     - dataclasses (std)
@@ -32,8 +34,10 @@ Design Deviation from V1:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence
 
 if TYPE_CHECKING:
     from .parts import Part
@@ -41,6 +45,21 @@ if TYPE_CHECKING:
 
 MarkSource = Literal["explicit", "aggregate", "inferred"]
 
+_VALID_SOURCES = frozenset(("explicit", "aggregate", "inferred"))
+
+
+@lru_cache(maxsize=8)
+def _validate_source(source: str) -> str:
+    """
+    Validate a mark source and return its interned string.
+    
+    JSON loading yields a fresh string per node; interning lets every
+    Marks share one of three objects.
+    """
+    if source not in _VALID_SOURCES:
+        raise ValueError(f"Invalid mark source: {source}")
+    return sys.intern(source)
+
 
 @dataclass(frozen=True, slots=True)
 class Marks:
@@ -76,8 +95,25 @@ class Marks:
         """Validate marks on construction."""
         if self.value < 0:
             raise ValueError(f"Marks cannot be negative: {self.value}")
-        if self.source not in ("explicit", "aggregate", "inferred"):
-            raise ValueError(f"Invalid mark source: {self.source}")
+        try:
+            source = _validate_source(self.source)
+        except TypeError:  # unhashable, so certainly not a valid literal
+            raise ValueError(f"Invalid mark source: {self.source}") from None
+        if source is not self.source:
+            object.__setattr__(self, "source", source)
+    
+    @classmethod
+    def _unchecked(cls, value: int, source: MarkSource) -> Marks:
+        """
+        Build Marks without running __post_init__ validation.
+        
+        Only for values that are valid by construction, e.g. sums of
+        existing (already validated) Marks.
+        """
+        marks = object.__new__(cls)
+        object.__setattr__(marks, "value", value)
+        object.__setattr__(marks, "source", source)
+        return marks
     
     # ─────────────────────────────────────────────────────────────────────────
     # Factory Methods
@@ -96,8 +132,30 @@ class Marks:
         Returns:
             Marks with source="explicit"
         """
+        # Marks are frozen, so small values share one cached instance
+        if type(value) is int and 0 <= value < len(_EXPLICIT_CACHE):
+            return _EXPLICIT_CACHE[value]
         return cls(value=value, source="explicit")
     
+    @classmethod
+    def from_source(cls, value: int, source: str) -> Marks:
+        """
+        Create marks from a serialized (value, mark_source) pair.
+        
+        Explicit marks go through explicit() so deserialized trees share
+        the cached small-value instances.
+        
+        Args:
+            value: The mark value
+            source: Serialized mark source string
+            
+        Returns:
+            Validated Marks instance
+        """
+        if source == "explicit":
+            return cls.explicit(value)
+        return cls(value=value, source=source)
+    
     @classmethod
     def aggregate(cls, parts: Sequence[Part]) -> Marks:
         """
@@ -111,8 +169,32 @@ class Marks:
         Returns:
             Marks with source="aggregate" and value = sum of child marks
         """
-        total = sum(p.marks.value for p in parts)
-        return cls(value=total, source="aggregate")
+        return cls.aggregate_values(p.marks.value for p in parts)
+    
+    @classmethod
+    def aggregate_values(cls, values: Iterable[int]) -> Marks:
+        """
+        Create aggregate marks from pre-extracted mark values.
+        
+        Accepts any iterable of ints. Array-likes exposing ``sum()``
+        (e.g. a NumPy int array of leaf marks) are reduced with their
+        own C-level sum instead of a Python loop.
+        
+        Args:
+            values: Mark values to sum
+            
+        Returns:
+            Marks with source="aggregate" and value = sum of values
+            
+        Raises:
+            ValueError: If the sum is negative
+        """
+        array_sum = getattr(values, "sum", None)
+        total = int(array_sum()) if array_sum is not None else sum(values)
+        # The source is a known literal, so the sign is the only check needed
+        if total < 0:
+            raise ValueError(f"Marks cannot be negative: {total}")
+        return cls._unchecked(total, "aggregate")
     
     @classmethod
     def inferred(cls, value: int) -> Marks:
@@ -138,7 +220,7 @@ class Marks:
         Returns:
             Marks with value=0 and source="inferred"
         """
-        return cls(value=0, source="inferred")
+        return _ZERO
     
     # ─────────────────────────────────────────────────────────────────────────
     # Operators
@@ -158,11 +240,13 @@ class Marks:
         """
         if not isinstance(other, Marks):
             return NotImplemented
-        return Marks(
-            value=self.value + other.value,
-            source="aggregate"
-        )
+        return Marks._unchecked(self.value + other.value, "aggregate")
     
     def __repr__(self) -> str:
         """Concise representation for debugging."""
         return f"Marks({self.value}, {self.source!r})"
+
+
+# Shared immutable instances: GCSE part marks are small integers
+_EXPLICIT_CACHE = tuple(Marks._unchecked(i, "explicit") for i in range(51))
+_ZERO = Marks._unchecked(0, "inferred")
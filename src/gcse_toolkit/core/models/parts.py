@@ -9,9 +9,13 @@ Purpose:
 Key Functions:
     - Part.iter_leaves(): Iterate over leaf parts (scorable items)
     - Part.iter_all(): Iterate over all parts in tree
+    - Part.leaves() / Part.all_parts(): Same traversals, returned as lists
     - Part.find(label): Find a part by label
+    - Part.child_at(y): Find the direct child containing a y-coordinate
+    - Part.part_at(y): Find the deepest part containing a y-coordinate
     - Part.total_marks: Property calculating marks from leaves
     - Part.to_dict() / Part.from_dict(): Serialization
+    - Part.to_table(): Columnar NumPy view of a subtree
 
 Dependencies:
     - dataclasses (std)
@@ -35,13 +39,17 @@ Design Deviation from V1:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Iterator, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
 
 from .bounds import SliceBounds
 from .marks import Marks
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class PartKind(str, Enum):
     """Type of question part."""
@@ -53,7 +61,26 @@ class PartKind(str, Enum):
         return self.value
 
 
-@dataclass(frozen=True, slots=True)
+# Serialized kind string -> member, bypassing the Enum lookup machinery
+_KIND_BY_STR = {kind.value: kind for kind in PartKind}
+
+
+def _parse_kind(value: str) -> PartKind:
+    """Resolve a serialized kind; unknown values raise ValueError as PartKind() does."""
+    kind = _KIND_BY_STR.get(value)
+    return kind if kind is not None else PartKind(value)
+
+
+# Tree depth per kind (question=0, letter=1, roman=2)
+_KIND_DEPTH = {PartKind.QUESTION: 0, PartKind.LETTER: 1, PartKind.ROMAN: 2}
+
+
+def _bounds_top(part: Part) -> int:
+    """Sort key for binary search over sibling parts."""
+    return part.bounds.top
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Part:
     """
     Question part node (immutable tree structure).
@@ -107,30 +134,167 @@ class Part:
     sub_topics: Tuple[str, ...] = ()
     is_valid: bool = True  # Part-level validation flag
     validation_issues: Tuple[str, ...] = ()  # Reasons for invalidity
-
     
-    def __post_init__(self) -> None:
-        """Validate part tree on construction."""
-        # Validate children ordering and overlaps
-        last_bottom = -1
-        for child in self.children:
-            # Ordering invariant (sorted by top)
-            if child.bounds.top < last_bottom:
-                # We use top for ordering, but bottom must also be non-decreasing for non-overlap
-                # Actually, strictly children should be sorted by top.
-                # If they are not sorted by top in the list, raise error.
-                pass
-            
-            # Refined check: children must be strictly sorted by bounds.top
-            # and they must not overlap vertically.
-            if child.bounds.top < last_bottom:
-                 raise ValueError(f"Children of {self.label} must be sorted by position and cannot overlap (top={child.bounds.top} < last_bottom={last_bottom})")
-            
-            last_bottom = child.bounds.bottom
+    # Subtree aggregates, computed once in __init__ (children are immutable)
+    _total_marks: int = field(init=False, repr=False, compare=False)
+    _leaf_count: int = field(init=False, repr=False, compare=False)
+    # label -> (part, parent) lookup, built on QUESTION roots only (None
+    # elsewhere); one slot and one dict keeps per-node overhead low
+    _index: Optional[dict[str, tuple[Part, Optional[Part]]]] = field(
+        init=False, repr=False, compare=False
+    )
+    # Memoized per-node to_dict() layout as immutable (key, value, copy)
+    # triples; dicts are rebuilt from it on every call
+    _dict_items: Optional[tuple] = field(init=False, repr=False, compare=False)
+    # Memoized structural hash, filled on first __hash__()
+    _hash: Optional[int] = field(init=False, repr=False, compare=False)
+    
+    def __init__(
+        self,
+        label: str,
+        kind: PartKind,
+        marks: Marks,
+        bounds: SliceBounds,
+        context_bounds: Optional[SliceBounds] = None,
+        label_bbox: Optional[SliceBounds] = None,
+        children: Tuple[Part, ...] = (),
+        topic: Optional[str] = None,
+        sub_topics: Tuple[str, ...] = (),
+        is_valid: bool = True,
+        validation_issues: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Build and validate a part node.
+        
+        Hand-written in place of the dataclass __init__ so the frozen
+        field stores go through one local alias, and validation runs
+        inline instead of via a separate __post_init__ call.
+        """
+        # Validate children ordering and overlaps: each child must start at or
+        # below the previous sibling's bottom. Since bottom > top, this single
+        # adjacent-pair check implies every sibling pair is disjoint.
+        for prev, child in zip(children, children[1:]):
+            if child.bounds.top < prev.bounds.bottom:
+                raise ValueError(
+                    f"Children of {label} must be sorted by position and cannot overlap "
+                    f"(top={child.bounds.top} < last_bottom={prev.bounds.bottom})"
+                )
 
         # Validate context_bounds only for QUESTION and LETTER
-        if self.context_bounds is not None and self.kind == PartKind.ROMAN:
+        if context_bounds is not None and kind == PartKind.ROMAN:
             raise ValueError("Roman numeral parts should not have context_bounds")
+        
+        setattr_ = object.__setattr__
+        setattr_(self, "label", label)
+        setattr_(self, "kind", kind)
+        setattr_(self, "marks", marks)
+        setattr_(self, "bounds", bounds)
+        setattr_(self, "context_bounds", context_bounds)
+        setattr_(self, "label_bbox", label_bbox)
+        setattr_(self, "children", children)
+        setattr_(self, "topic", topic)
+        setattr_(self, "sub_topics", sub_topics)
+        setattr_(self, "is_valid", is_valid)
+        setattr_(self, "validation_issues", validation_issues)
+        self._init_derived()
+    
+    def _init_derived(self) -> None:
+        """Compute cached aggregates and lookup tables (no validation)."""
+        # Children are built bottom-up, so their aggregates are already set
+        if self.children:
+            total_marks = sum(child._total_marks for child in self.children)
+            leaf_count = sum(child._leaf_count for child in self.children)
+        else:
+            total_marks = self.marks.value
+            leaf_count = 1
+        object.__setattr__(self, "_total_marks", total_marks)
+        object.__setattr__(self, "_leaf_count", leaf_count)
+        
+        index = None
+        if self.kind == PartKind.QUESTION:
+            # Pre-order walk; the first part seen for a label wins, as in find()
+            index = {}
+            stack: list[tuple[Part, Optional[Part]]] = [(self, None)]
+            while stack:
+                part, parent = stack.pop()
+                index.setdefault(part.label, (part, parent))
+                stack.extend((child, part) for child in reversed(part.children))
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_dict_items", None)
+        object.__setattr__(self, "_hash", None)
+    
+    def _key(self) -> tuple:
+        """Field values compared by __eq__ and hashed by __hash__."""
+        return (
+            self.label, self.kind, self.marks, self.bounds,
+            self.context_bounds, self.label_bbox, self.children,
+            self.topic, self.sub_topics, self.is_valid, self.validation_issues,
+        )
+    
+    def __hash__(self) -> int:
+        # Structural hash over the whole subtree, computed once per node
+        h = self._hash
+        if h is None:
+            h = hash(self._key())
+            object.__setattr__(self, "_hash", h)
+        return h
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Differing cached hashes prove inequality without a deep compare
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._key() == other._key()
+    
+    def __getstate__(self) -> dict:
+        # str hashes are salted per process, so never ship the cached hash
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_hash"}
+    
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", None)
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        label: str,
+        kind: PartKind,
+        marks: Marks,
+        bounds: SliceBounds,
+        context_bounds: Optional[SliceBounds] = None,
+        label_bbox: Optional[SliceBounds] = None,
+        children: Tuple[Part, ...] = (),
+        topic: Optional[str] = None,
+        sub_topics: Tuple[str, ...] = (),
+        is_valid: bool = True,
+        validation_issues: Tuple[str, ...] = (),
+    ) -> Part:
+        """
+        Build a Part without re-running the tree invariant checks.
+        
+        Only for callers that have already validated sibling ordering and
+        context_bounds for the whole tree (see core.utils.serialization.load_parts).
+        Derived caches are still computed.
+        """
+        part = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(part, "label", label)
+        setattr_(part, "kind", kind)
+        setattr_(part, "marks", marks)
+        setattr_(part, "bounds", bounds)
+        setattr_(part, "context_bounds", context_bounds)
+        setattr_(part, "label_bbox", label_bbox)
+        setattr_(part, "children", children)
+        setattr_(part, "topic", topic)
+        setattr_(part, "sub_topics", sub_topics)
+        setattr_(part, "is_valid", is_valid)
+        setattr_(part, "validation_issues", validation_issues)
+        part._init_derived()
+        return part
     
     # ─────────────────────────────────────────────────────────────────────────
     # Properties
@@ -149,11 +313,10 @@ class Part:
         For a leaf, returns self.marks.value.
         For a parent, returns sum of all leaf marks.
         
-        **IMPORTANT:** This is ALWAYS calculated, never stored.
+        **IMPORTANT:** This is ALWAYS calculated from the leaves, never
+        taken from stored metadata. The sum is computed once at construction.
         """
-        if self.is_leaf:
-            return self.marks.value
-        return sum(child.total_marks for child in self.children)
+        return self._total_marks
     
     @property
     def depth(self) -> int:
@@ -163,24 +326,51 @@ class Part:
         Returns:
             Integer depth level
         """
-        if self.kind == PartKind.QUESTION:
-            return 0
-        elif self.kind == PartKind.LETTER:
-            return 1
-        else:
-            return 2
+        return _KIND_DEPTH[self.kind]
     
     @property
     def leaf_count(self) -> int:
         """Count of leaf parts in this subtree."""
-        if self.is_leaf:
-            return 1
-        return sum(child.leaf_count for child in self.children)
+        return self._leaf_count
     
     # ─────────────────────────────────────────────────────────────────────────
     # Iteration Methods
     # ─────────────────────────────────────────────────────────────────────────
     
+    def leaves(self) -> list[Part]:
+        """
+        Collect all leaf parts (parts with no children).
+        
+        Walks the tree with an explicit stack instead of nested generators.
+        
+        Returns:
+            All leaf Part instances in tree order
+        """
+        out = []
+        stack = [self]
+        while stack:
+            part = stack.pop()
+            if part.children:
+                stack.extend(reversed(part.children))
+            else:
+                out.append(part)
+        return out
+    
+    def all_parts(self) -> list[Part]:
+        """
+        Collect this part and all descendants (pre-order).
+        
+        Returns:
+            This part, then all descendants in tree order
+        """
+        out = []
+        stack = [self]
+        while stack:
+            part = stack.pop()
+            out.append(part)
+            stack.extend(reversed(part.children))
+        return out
+    
     def iter_leaves(self) -> Iterator[Part]:
         """
         Iterate over all leaf parts (parts with no children).
@@ -188,11 +378,7 @@ class Part:
         Yields:
             All leaf Part instances in tree order
         """
-        if self.is_leaf:
-            yield self
-        else:
-            for child in self.children:
-                yield from child.iter_leaves()
+        return iter(self.leaves())
     
     def iter_all(self) -> Iterator[Part]:
         """
@@ -201,9 +387,7 @@ class Part:
         Yields:
             This part, then all descendants in tree order
         """
-        yield self
-        for child in self.children:
-            yield from child.iter_all()
+        return iter(self.all_parts())
     
     def iter_ancestors_of(self, label: str) -> Iterator[Part]:
         """
@@ -217,6 +401,18 @@ class Part:
         """
         if self.label == label:
             return
+        index = self._index
+        if index is not None:
+            entry = index.get(label)
+            if entry is None:
+                return
+            ancestors = []
+            parent = entry[1]
+            while parent is not None:
+                ancestors.append(parent)
+                parent = index[parent.label][1]
+            yield from reversed(ancestors)
+            return
         for child in self.children:
             if child.label == label or child.find(label) is not None:
                 yield self
@@ -237,6 +433,9 @@ class Part:
         Returns:
             Matching Part or None if not found
         """
+        if self._index is not None:
+            entry = self._index.get(label)
+            return entry[0] if entry is not None else None
         if self.label == label:
             return self
         for child in self.children:
@@ -245,6 +444,48 @@ class Part:
                 return found
         return None
     
+    def child_at(self, y: int) -> Optional[Part]:
+        """
+        Find the direct child whose bounds contain a y-coordinate.
+        
+        Children are sorted and non-overlapping, so this is a binary
+        search over their tops rather than a scan.
+        
+        Args:
+            y: Y-coordinate in composite image pixels
+            
+        Returns:
+            Child Part containing y, or None if y falls between/outside children
+        """
+        idx = bisect_right(self.children, y, key=_bounds_top) - 1
+        if idx >= 0 and y < self.children[idx].bounds.bottom:
+            return self.children[idx]
+        return None
+    
+    def part_at(self, y: int) -> Optional[Part]:
+        """
+        Find the deepest part in this subtree whose bounds contain y.
+        
+        Descends one level at a time with child_at(), so the cost is
+        O(depth * log(siblings)).
+        
+        Args:
+            y: Y-coordinate in composite image pixels
+            
+        Returns:
+            Deepest containing Part (a leaf, or a parent when y falls in its
+            header/gap area), or None if y is outside this part
+        """
+        if not self.bounds.contains(y):
+            return None
+        part = self
+        while part.children:
+            child = part.child_at(y)
+            if child is None:
+                break
+            part = child
+        return part
+    
     def get_context_for(self, leaf_label: str) -> list[Part]:
         """
         Get context parts needed to render a leaf.
@@ -264,6 +505,66 @@ class Part:
                 result.append(ancestor)
         return result
     
+    # ─────────────────────────────────────────────────────────────────────────
+    # Columnar View
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def to_table(self) -> "np.ndarray":
+        """
+        Flatten this subtree into a NumPy structured array (one row per part).
+        
+        Rows are in pre-order (same as all_parts()). Columns allow
+        vectorized filters over a whole tree, e.g.
+        ``t["marks"][t["depth"] == 2].sum()``.
+        
+        Columns:
+            label: Part label (unicode, sized to the longest label)
+            depth: 0=question, 1=letter, 2=roman (doubles as kind code)
+            leaf: True for leaf parts
+            marks: Part marks value
+            top, bottom, left: Bounds in composite pixels
+            right: Right bound, or -1 for full width
+            parent: Row index of the parent, -1 for this root
+        
+        Coordinate columns are int16 when every bound fits (composites are
+        typically ~2000x3000 px), halving the bytes scanned by vectorized
+        bound comparisons; otherwise int32.
+        
+        Returns:
+            Structured ndarray with len == number of parts in the subtree
+        """
+        import numpy as np  # core.models stays importable without NumPy
+        
+        rows = []
+        stack: list[tuple[Part, int]] = [(self, -1)]
+        while stack:
+            part, parent = stack.pop()
+            idx = len(rows)
+            bounds = part.bounds
+            rows.append((
+                part.label, _KIND_DEPTH[part.kind], not part.children,
+                part.marks.value, bounds.top, bounds.bottom, bounds.left,
+                bounds.right if bounds.right is not None else -1, parent,
+            ))
+            stack.extend((child, idx) for child in reversed(part.children))
+        
+        label_width = max(len(row[0]) for row in rows)
+        # bottom > top and right > left, so bottom/right bound every coordinate
+        max_coord = max(max(row[5], row[7]) for row in rows)
+        coord = "i2" if max_coord <= np.iinfo(np.int16).max else "i4"
+        dtype = np.dtype([
+            ("label", f"U{label_width}"),
+            ("depth", "u1"),
+            ("leaf", "?"),
+            ("marks", "i4"),
+            ("top", coord),
+            ("bottom", coord),
+            ("left", coord),
+            ("right", coord),
+            ("parent", "i4"),
+        ])
+        return np.array(rows, dtype=dtype)
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Serialization
     # ─────────────────────────────────────────────────────────────────────────
@@ -272,66 +573,121 @@ class Part:
         """
         Serialize to dictionary for JSON storage.
         
+        The tree is walked iteratively (pre-order), so deep trees cost no
+        Python recursion. Key order matches the per-node layout below.
+        
+        Each node's field layout is memoized as immutable data (parts are
+        frozen), but every call returns freshly built dicts and lists, so
+        callers may mutate the result.
+        
         Returns:
             Dict representation of this part and children
         """
-        d = {
-            "label": self.label,
-            "kind": str(self.kind),
-            "marks": self.marks.value,
-            "mark_source": self.marks.source,
-            "bounds": self.bounds.to_dict(),
-        }
+        root: list[dict] = []
+        stack: list[tuple[Part, list[dict]]] = [(self, root)]
+        while stack:
+            part, siblings = stack.pop()
+            d = {
+                key: copy(value) if copy is not None else value
+                for key, value, copy in part._serial_items()
+            }
+            if part.children:
+                # Replaces the placeholder (keeping key order); filled in
+                # tree order as the children are popped below
+                kids: list[dict] = []
+                d["children"] = kids
+                stack.extend((child, kids) for child in reversed(part.children))
+            siblings.append(d)
+        return root[0]
+    
+    def _serial_items(self) -> tuple:
+        """Memoized (key, value, copy) triples describing this node's dict."""
+        items = self._dict_items
+        if items is not None:
+            return items
+        
+        # Nested dicts/lists are stored as tuples and copied back by to_dict()
+        layout: list[tuple] = [
+            ("label", self.label, None),
+            ("kind", self.kind.value, None),
+            ("marks", self.marks.value, None),
+            ("mark_source", self.marks.source, None),
+            ("bounds", tuple(self.bounds.to_dict().items()), dict),
+        ]
         if self.context_bounds is not None:
-            d["context_bounds"] = self.context_bounds.to_dict()
+            layout.append(("context_bounds", tuple(self.context_bounds.to_dict().items()), dict))
         if self.label_bbox is not None:
-            d["label_bbox"] = self.label_bbox.to_dict()
+            layout.append(("label_bbox", tuple(self.label_bbox.to_dict().items()), dict))
         if self.children:
-            d["children"] = [child.to_dict() for child in self.children]
+            layout.append(("children", None, None))  # placeholder for key order
         if self.topic:
-            d["topic"] = self.topic
+            layout.append(("topic", self.topic, None))
         if self.sub_topics:
-            d["sub_topics"] = list(self.sub_topics)
+            layout.append(("sub_topics", tuple(self.sub_topics), list))
         # Part-level validation
         if not self.is_valid:
-            d["is_valid"] = False
-            d["validation_issues"] = list(self.validation_issues)
-        return d
+            layout.append(("is_valid", False, None))
+            layout.append(("validation_issues", tuple(self.validation_issues), list))
+        
+        # Only cached once complete, so a failure leaves nothing behind
+        items = tuple(layout)
+        object.__setattr__(self, "_dict_items", items)
+        return items
     
     @classmethod
     def from_dict(cls, data: dict) -> Part:
         """
         Deserialize from dictionary.
         
+        Parts are frozen, so children must exist before their parent.
+        The tree is rebuilt iteratively in post-order: each node takes its
+        just-built children off the end of the ``built`` stack.
+        
         Args:
             data: Dict representation
             
         Returns:
             Part instance
         """
-        children = tuple(
-            cls.from_dict(child) for child in data.get("children", [])
-        )
-        
-        return cls(
-            label=data["label"],
-            kind=PartKind(data["kind"]),
-            marks=Marks(data["marks"], data.get("mark_source", "explicit")),
-            bounds=SliceBounds.from_dict(data["bounds"]),
-            context_bounds=(
-                SliceBounds.from_dict(data["context_bounds"])
-                if "context_bounds" in data else None
-            ),
-            label_bbox=(
-                SliceBounds.from_dict(data["label_bbox"])
-                if "label_bbox" in data else None
-            ),
-            children=children,
-            topic=data.get("topic"),
-            sub_topics=tuple(data.get("sub_topics", [])),
-            is_valid=data.get("is_valid", True),
-            validation_issues=tuple(data.get("validation_issues", [])),
-        )
+        built: list[Part] = []
+        stack: list[tuple[dict, bool]] = [(data, False)]
+        while stack:
+            node, expanded = stack.pop()
+            child_data = node.get("children") or ()
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(child_data))
+                continue
+            
+            if child_data:
+                split = len(built) - len(child_data)
+                children = tuple(built[split:])
+                del built[split:]
+            else:
+                children = ()
+            
+            context_bounds = node.get("context_bounds")
+            label_bbox = node.get("label_bbox")
+            built.append(cls(
+                label=node["label"],
+                kind=_parse_kind(node["kind"]),
+                marks=Marks.from_source(node["marks"], node.get("mark_source", "explicit")),
+                bounds=SliceBounds.from_dict(node["bounds"]),
+                context_bounds=(
+                    SliceBounds.from_dict(context_bounds)
+                    if context_bounds is not None else None
+                ),
+                label_bbox=(
+                    SliceBounds.from_dict(label_bbox)
+                    if label_bbox is not None else None
+                ),
+                children=children,
+                topic=node.get("topic"),
+                sub_topics=tuple(node.get("sub_topics", ())),
+                is_valid=node.get("is_valid", True),
+                validation_issues=tuple(node.get("validation_issues", ())),
+            ))
+        return built[0]
     
     def __repr__(self) -> str:
         """Concise representation for debugging."""
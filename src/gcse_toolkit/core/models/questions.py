@@ -4,18 +4,21 @@ Module: questions
 Purpose:
     Provides the Question dataclass - the main data structure passed between
     extractor and builder. Represents a complete question with metadata,
-    part tree, and image paths. Immutable with calculated marks.
+    part tree, and image paths. Slotted dataclass, read-only by convention,
+    with marks calculated from the part tree.
 
 Key Functions:
-    - Question.total_marks: Cached property, always calculated from parts
+    - Question.total_marks: Always calculated from parts (cached on the Part tree)
     - Question.leaf_parts: Get all leaf parts
+    - Question.all_labels / leaf_labels: Cached label sets
     - Question.get_part(label): Find a part by label
     - Question.to_dict() / Question.from_dict(): Serialization
 
 Dependencies:
     - dataclasses (std)
-    - functools (std)
     - pathlib (std)
+    - re (std)
+    - ._caching.slot_cached
     - .parts.Part
 
 Used By:
@@ -26,7 +29,7 @@ Used By:
 
 Design Deviation from V1:
     V1 QuestionRecord was mutable with stored total_marks (often wrong).
-    V2 Question is frozen, calculates total_marks from leaves, uses
+    V2 Question is read-only, calculates total_marks from leaves, uses
     question_node instead of root.
     See: docs/architecture/bugs.md (B1, B6, B12)
     See: docs/architecture/decision_log.md (DECISION-002, DECISION-004)
@@ -34,18 +37,22 @@ Design Deviation from V1:
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
+from ._caching import slot_cached
 from .parts import Part
 
+# Fast path for the common case of a well-formed exam code
+_EXAM_CODE_RE = re.compile(r"\d{4}").fullmatch
 
-@dataclass(frozen=True)
+
+@dataclass(slots=True)
 class Question:
     """
-    Complete question representation (immutable).
+    Complete question representation (read-only by convention).
     
     This is the main data structure passed between extractor and builder.
     Contains all information needed to render a question.
@@ -66,6 +73,9 @@ class Question:
     Invariants:
         - total_marks is always calculated from question_node
         - composite_path exists (not validated here, checked at load time)
+        - Fields are never reassigned after construction. The class is not
+          frozen (frozen __init__ routes every field through
+          object.__setattr__), so this is enforced by convention.
     
     Example:
         >>> q = Question(
@@ -101,13 +111,26 @@ class Question:
     mark_bboxes: tuple[tuple[int, int, int, int], ...] = ()  # Mark box positions for UI highlighting
     horizontal_offset: int = 0  # Phase 6.10: Offset from reference for render-time alignment
     
+    # Backing slots for the @slot_cached properties below
+    _all_parts: Optional[tuple[Part, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _leaf_parts: Optional[tuple[Part, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _all_labels: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _leaf_labels: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self) -> None:
         """Validate question on construction."""
-        # Validate exam_code format (4 digits)
-        if not self.exam_code or len(self.exam_code) != 4:
-            raise ValueError(f"exam_code must be 4 characters: {self.exam_code!r}")
-        if not self.exam_code.isdigit():
-            raise ValueError(f"exam_code must be digits: {self.exam_code!r}")
+        # Validate exam_code format (4 digits); the detailed checks only run
+        # when the single regex match fails, to pick the right message
+        exam_code = self.exam_code
+        if type(exam_code) is not str or not _EXAM_CODE_RE(exam_code):
+            if not exam_code or len(exam_code) != 4:
+                raise ValueError(f"exam_code must be 4 characters: {exam_code!r}")
+            if not exam_code.isdigit():
+                raise ValueError(f"exam_code must be digits: {exam_code!r}")
         
         # Validate year range
         if not (2000 <= self.year <= 2100):
@@ -119,11 +142,15 @@ class Question:
         if not (1 <= self.variant <= 9):
             raise ValueError(f"variant must be 1-9: {self.variant}")
     
+    def __hash__(self) -> int:
+        # Question IDs are unique; equal questions always share an id
+        return hash(self.id)
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Calculated Properties (NEVER stored)
     # ─────────────────────────────────────────────────────────────────────────
     
-    @cached_property
+    @property
     def total_marks(self) -> int:
         """
         Calculate total marks from parts.
@@ -136,27 +163,35 @@ class Question:
         """
         return self.question_node.total_marks
     
-    @cached_property
-    def all_parts(self) -> list[Part]:
+    @slot_cached
+    def all_parts(self) -> tuple[Part, ...]:
         """
-        Get flat list of all parts in tree order.
+        Get flat tuple of all parts in tree order.
         
         Returns:
-            List including question_node and all descendants
+            Tuple including question_node and all descendants
         """
-        return list(self.question_node.iter_all())
+        return tuple(self.question_node.all_parts())
     
-    @cached_property
-    def leaf_parts(self) -> list[Part]:
+    @slot_cached
+    def leaf_parts(self) -> tuple[Part, ...]:
         """
-        Get list of leaf parts only.
+        Get tuple of leaf parts only.
         
         Returns:
-            List of parts with no children (the actual sub-questions)
+            Tuple of parts with no children (the actual sub-questions)
         """
-        return list(self.question_node.iter_leaves())
+        return tuple(self.question_node.leaves())
+    
+    def iter_all_parts(self) -> Iterator[Part]:
+        """Iterate over all parts in tree order (shares the all_parts cache)."""
+        return iter(self.all_parts)
     
-    @cached_property
+    def iter_leaf_parts(self) -> Iterator[Part]:
+        """Iterate over leaf parts in tree order (shares the leaf_parts cache)."""
+        return iter(self.leaf_parts)
+    
+    @property
     def leaf_count(self) -> int:
         """
         Count of leaf parts.
@@ -166,6 +201,26 @@ class Question:
         """
         return self.question_node.leaf_count
     
+    @slot_cached
+    def all_labels(self) -> frozenset[str]:
+        """
+        Labels of every part in the tree.
+        
+        Returns:
+            Frozenset shared by all callers (built once per question)
+        """
+        return frozenset(p.label for p in self.all_parts)
+    
+    @slot_cached
+    def leaf_labels(self) -> frozenset[str]:
+        """
+        Labels of the leaf parts only.
+        
+        Returns:
+            Frozenset shared by all callers (built once per question)
+        """
+        return frozenset(p.label for p in self.leaf_parts)
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Query Methods
     # ─────────────────────────────────────────────────────────────────────────
@@ -238,14 +293,19 @@ class Question:
             "child_text": self.child_text,
             "horizontal_offset": self.horizontal_offset,
         }
-        if self.mark_scheme_path:
-            d["mark_scheme_path"] = str(self.mark_scheme_path)
-        if self.content_right is not None:
-            d["content_right"] = self.content_right
-        if self.numeral_bbox is not None:
-            d["numeral_bbox"] = list(self.numeral_bbox)
-        if self.mark_bboxes:
-            d["mark_bboxes"] = [list(box) for box in self.mark_bboxes]
+        # Optional keys are only written when set (read each field once)
+        mark_scheme_path = self.mark_scheme_path
+        if mark_scheme_path:
+            d["mark_scheme_path"] = str(mark_scheme_path)
+        content_right = self.content_right
+        if content_right is not None:
+            d["content_right"] = content_right
+        numeral_bbox = self.numeral_bbox
+        if numeral_bbox is not None:
+            d["numeral_bbox"] = list(numeral_bbox)
+        mark_bboxes = self.mark_bboxes
+        if mark_bboxes:
+            d["mark_bboxes"] = list(map(list, mark_bboxes))
         return d
     
     @classmethod
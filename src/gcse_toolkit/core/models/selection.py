@@ -15,7 +15,8 @@ Key Functions:
 
 Dependencies:
     - dataclasses (std)
-    - functools (std)
+    - itertools (std)
+    - ._caching.slot_cached
     - .questions.Question
     - .parts.Part
 
@@ -24,22 +25,23 @@ Used By:
 
 Design Deviation from V1:
     V1 PlanOption was mutable with marks calculated inconsistently.
-    V2 uses frozen dataclasses with cached_property for marks.
+    V2 uses read-only dataclasses with lazily cached marks.
     See: docs/architecture/bugs.md (B1, B2)
     See: docs/architecture/decision_log.md (DECISION-004)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import cached_property
-from typing import FrozenSet, Set
+from dataclasses import dataclass, field, fields
+from itertools import chain
+from typing import FrozenSet, Optional, Set
 
 from .questions import Question
+from ._caching import slot_cached
 from .parts import Part
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SelectionPlan:
     """
     Plan for which parts of a question to include in output.
@@ -54,6 +56,8 @@ class SelectionPlan:
     Invariants:
         - included_parts contains only valid labels from question
         - marks is calculated from included leaf parts only
+        - Read-only by convention (not frozen, to keep construction cheap
+          in the selection search)
     
     Example:
         >>> plan = SelectionPlan(question, frozenset(["1(a)(i)", "1(a)(ii)"]))
@@ -65,22 +69,70 @@ class SelectionPlan:
 
     question: Question
     included_parts: FrozenSet[str]  # Set of part labels to include
+    
+    # (included leaves, excluded leaves, included marks), filled lazily by
+    # _partition_leaves() in a single walk over the question's leaves
+    _leaf_partition: Optional[tuple[tuple[Part, ...], tuple[Part, ...], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cached __hash__ result (plans are hashed repeatedly in the selection search)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate selection on construction."""
-        # Validate all included parts exist in question
-        valid_labels = {p.label for p in self.question.all_parts}
-        invalid = self.included_parts - valid_labels
-        if invalid:
+        # Validate all included parts exist in question: one subset test
+        # against the question's cached label set, skipped entirely when
+        # the plan was built from that very set (full_question)
+        valid_labels = self.question.all_labels
+        if self.included_parts is not valid_labels and not self.included_parts <= valid_labels:
+            invalid = self.included_parts - valid_labels
             raise ValueError(
                 f"Invalid part labels for question {self.question.id}: {invalid}"
             )
 
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.question.id, self.included_parts))
+        return h
+
+    def __getstate__(self) -> dict:
+        # str hashes are salted per process, so never ship the cached hash
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_hash"}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = None
+
     # ─────────────────────────────────────────────────────────────────────────
     # Calculated Properties (NEVER stored)
     # ─────────────────────────────────────────────────────────────────────────
 
-    @cached_property
+    def _partition_leaves(self) -> tuple[tuple[Part, ...], tuple[Part, ...], int]:
+        """
+        Split the question's leaves into included/excluded in one pass.
+        
+        Returns:
+            (included leaves, excluded leaves, sum of included leaf marks)
+        """
+        partition = self._leaf_partition
+        if partition is None:
+            included = []
+            excluded = []
+            total = 0
+            labels = self.included_parts
+            for part in self.question.leaf_parts:
+                if part.label in labels:
+                    included.append(part)
+                    total += part.marks.value
+                else:
+                    excluded.append(part)
+            partition = (tuple(included), tuple(excluded), total)
+            self._leaf_partition = partition
+        return partition
+
+    @property
     def marks(self) -> int:
         """
         Calculate marks from included leaf parts only.
@@ -91,13 +143,9 @@ class SelectionPlan:
         Returns:
             Sum of marks for all included leaves
         """
-        total = 0
-        for part in self.question.leaf_parts:
-            if part.label in self.included_parts:
-                total += part.marks.value
-        return total
+        return self._partition_leaves()[2]
 
-    @cached_property
+    @property
     def included_leaves(self) -> tuple[Part, ...]:
         """
         Get tuple of included leaf parts.
@@ -105,12 +153,9 @@ class SelectionPlan:
         Returns:
             Immutable tuple of Parts that are leaves AND included
         """
-        return tuple(
-            p for p in self.question.leaf_parts 
-            if p.label in self.included_parts
-        )
+        return self._partition_leaves()[0]
 
-    @cached_property
+    @property
     def excluded_leaves(self) -> tuple[Part, ...]:
         """
         Get tuple of excluded leaf parts.
@@ -118,10 +163,7 @@ class SelectionPlan:
         Returns:
             Immutable tuple of Parts that are leaves but NOT included
         """
-        return tuple(
-            p for p in self.question.leaf_parts 
-            if p.label not in self.included_parts
-        )
+        return self._partition_leaves()[1]
 
     @property
     def is_full_question(self) -> bool:
@@ -158,8 +200,7 @@ class SelectionPlan:
         Returns:
             SelectionPlan with all parts included
         """
-        all_labels = frozenset(p.label for p in question.all_parts)
-        return cls(question=question, included_parts=all_labels)
+        return cls(question=question, included_parts=question.all_labels)
 
     @classmethod
     def leaves_only(cls, question: Question) -> SelectionPlan:
@@ -172,8 +213,7 @@ class SelectionPlan:
         Returns:
             SelectionPlan with only leaf parts included
         """
-        leaf_labels = frozenset(p.label for p in question.leaf_parts)
-        return cls(question=question, included_parts=leaf_labels)
+        return cls(question=question, included_parts=question.leaf_labels)
 
     def __repr__(self) -> str:
         """Concise representation for debugging."""
@@ -184,7 +224,7 @@ class SelectionPlan:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SelectionResult:
     """
     Result of the selection algorithm.
@@ -211,19 +251,29 @@ class SelectionResult:
     plans: tuple[SelectionPlan, ...]
     target_marks: int
     tolerance: int
+    
+    # Backing slots for the @slot_cached properties below
+    _total_marks: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _covered_topics: Optional[Set[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # question id -> plan, built during validation for O(1) get_plan()
+    _plan_index: Optional[dict[str, SelectionPlan]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate selection result on construction."""
-        # Check for duplicate questions
-        question_ids = [p.question.id for p in self.plans]
-        if len(question_ids) != len(set(question_ids)):
+        # Check for duplicate questions while indexing plans by question id
+        self._plan_index = {p.question.id: p for p in self.plans}
+        if len(self._plan_index) != len(self.plans):
             raise ValueError("Duplicate questions in selection result")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Calculated Properties (NEVER stored)
     # ─────────────────────────────────────────────────────────────────────────
 
-    @cached_property
+    @slot_cached
     def total_marks(self) -> int:
         """
         Calculate total marks from plans.
@@ -235,7 +285,7 @@ class SelectionResult:
         """
         return sum(plan.marks for plan in self.plans)
 
-    @cached_property
+    @slot_cached
     def covered_topics(self) -> Set[str]:
         """
         Get set of topics covered by selection.
@@ -245,14 +295,12 @@ class SelectionResult:
         Returns:
             Set of unique topic strings
         """
-        topics = set()
-        for plan in self.plans:
-            # Add specific topics from included leaves (with fallback to question topic)
-            for leaf in plan.included_leaves:
-                effective_topic = leaf.topic or plan.question.topic
-                if effective_topic:
-                    topics.add(effective_topic)
-        return topics
+        # Specific topics from included leaves (with fallback to question topic),
+        # streamed straight into set(); filter(None) drops empty topics
+        return set(filter(None, chain.from_iterable(
+            (leaf.topic or plan.question.topic for leaf in plan.included_leaves)
+            for plan in self.plans
+        )))
 
     @property
     def question_count(self) -> int:
@@ -303,10 +351,7 @@ class SelectionResult:
         Returns:
             Matching SelectionPlan or None
         """
-        for plan in self.plans:
-            if plan.question.id == question_id:
-                return plan
-        return None
+        return self._plan_index.get(question_id)
 
     def __repr__(self) -> str:
         """Concise representation for debugging."""
@@ -19,6 +19,8 @@ V2 Solution:
 from __future__ import annotations
 
 import json
+import re
+from functools import cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -28,12 +30,17 @@ QUESTION_SCHEMA_VERSION = 9  # V2 schema version (V1 was 6, V2.0 was 7, V2.1 add
 REGIONS_SCHEMA_VERSION = 3  # v3 adds is_valid, validation_issues for 1:1 diagnostic parity
 
 
-# Load schemas lazily
-_SCHEMAS: dict[str, dict] = {}
+# Four-digit exam code, e.g. "0478"
+_EXAM_CODE_RE = re.compile(r"\d{4}").fullmatch
 
 
+# Compiled jsonschema validators, built once per schema name
+_VALIDATORS: dict[str, Any] = {}
+
+
+@cache
 def _get_jsonschema():
-    """Import jsonschema lazily."""
+    """Import jsonschema lazily (once; the module or None is memoized)."""
     try:
         import jsonschema
         return jsonschema
@@ -41,15 +48,49 @@ def _get_jsonschema():
         return None
 
 
+@cache
 def _load_schema(name: str) -> dict:
-    """Load a schema from the schemas directory."""
-    if name not in _SCHEMAS:
-        schema_path = Path(__file__).parent / f"{name}.schema.json"
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema not found: {schema_path}")
-        with open(schema_path, "r", encoding="utf-8") as f:
-            _SCHEMAS[name] = json.load(f)
-    return _SCHEMAS[name]
+    """Load a schema from the schemas directory (memoized per name)."""
+    schema_path = Path(__file__).parent / f"{name}.schema.json"
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema not found: {schema_path}")
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _get_validator(jsonschema, name: str):
+    """Return the compiled validator for a schema, building it on first use."""
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        schema = _load_schema(name)
+        # Honour the schema's own $schema draft, as jsonschema.validate does
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = _VALIDATORS[name] = cls(schema)
+    return validator
+
+
+def _validate_against_schema(data: dict[str, Any], name: str) -> None:
+    """
+    Run full jsonschema validation, if jsonschema is installed.
+    
+    All violations are collected in one pass; the most relevant one
+    (as chosen by jsonschema.validate) becomes the message.
+    
+    Raises:
+        ValidationError: If data violates the schema
+    """
+    jsonschema = _get_jsonschema()
+    if not jsonschema:
+        return
+    errors = list(_get_validator(jsonschema, name).iter_errors(data))
+    if errors:
+        best = jsonschema.exceptions.best_match(errors)
+        raise ValidationError(
+            f"Schema validation failed: {best.message}",
+            path=".".join(str(p) for p in best.absolute_path),
+            errors=[e.message for e in errors]
+        )
 
 
 class ValidationError(Exception):
@@ -108,7 +149,7 @@ def validate_question(data: dict[str, Any], *, strict: bool = False) -> None:
 
     # Validate exam_code format
     exam_code = data.get("exam_code", "")
-    if not (isinstance(exam_code, str) and len(exam_code) == 4 and exam_code.isdigit()):
+    if not (isinstance(exam_code, str) and _EXAM_CODE_RE(exam_code)):
         raise ValidationError(
             f"Invalid exam_code: {exam_code!r} (must be 4 digits)",
             path="exam_code"
@@ -128,98 +169,108 @@ def validate_question(data: dict[str, Any], *, strict: bool = False) -> None:
     
     # Full schema validation if jsonschema available and strict mode
     if strict:
-        jsonschema = _get_jsonschema()
-        if jsonschema:
-            schema_name = "question_model" if is_model else "question"
-            schema = _load_schema(schema_name)
-            try:
-                jsonschema.validate(data, schema)
-            except jsonschema.ValidationError as e:
-                raise ValidationError(
-                    f"Schema validation failed: {e.message}",
-                    path=".".join(str(p) for p in e.absolute_path),
-                    errors=[e.message]
-                )
+        _validate_against_schema(data, "question_model" if is_model else "question")
 
 
-def _validate_part(data: dict[str, Any], path: str) -> None:
-    """Validate a part node recursively."""
-    required = ["label", "kind", "marks", "bounds"]
-    missing = [f for f in required if f not in data]
-    if missing:
-        raise ValidationError(
-            f"Part missing required fields: {missing}",
-            path=path,
-            errors=[f"Missing field: {f}" for f in missing]
-        )
-    
-    # Validate kind
-    kind = data.get("kind")
-    if kind not in ("question", "letter", "roman"):
-        raise ValidationError(
-            f"Invalid part kind: {kind!r}",
-            path=f"{path}.kind"
-        )
-    
-    # Validate marks
-    marks = data.get("marks")
-    if not isinstance(marks, int) or marks < 0:
-        raise ValidationError(
-            f"Invalid marks: {marks} (must be non-negative integer)",
-            path=f"{path}.marks"
-        )
-    
-    # Validate bounds
-    bounds = data.get("bounds")
-    if not isinstance(bounds, dict):
-        raise ValidationError(
-            "bounds must be a dict",
-            path=f"{path}.bounds"
-        )
-    _validate_bounds(bounds, f"{path}.bounds")
+def _format_part_path(ref: Any) -> str:
+    """
+    Expand a lazy part path into its dotted form.
     
-    # Validate context_bounds if present
-    if "context_bounds" in data:
-        if kind == "roman":
+    ref is either the root path string or a (parent_ref, child_index)
+    pair, so paths are only formatted when an error is actually raised.
+    """
+    indices = []
+    while not isinstance(ref, str):
+        ref, index = ref
+        indices.append(index)
+    return ref + "".join(f".children[{i}]" for i in reversed(indices))
+
+
+def _validate_part(data: dict[str, Any], path: str) -> None:
+    """Validate a part node and all its descendants (pre-order, iterative)."""
+    stack = [(data, path)]
+    while stack:
+        data, ref = stack.pop()
+        required = ["label", "kind", "marks", "bounds"]
+        missing = [f for f in required if f not in data]
+        if missing:
             raise ValidationError(
-                "Roman parts should not have context_bounds",
-                path=f"{path}.context_bounds"
+                f"Part missing required fields: {missing}",
+                path=_format_part_path(ref),
+                errors=[f"Missing field: {f}" for f in missing]
             )
-        _validate_bounds(data["context_bounds"], f"{path}.context_bounds")
-    
-    # Validate children recursively
-    children = data.get("children", [])
-    if not isinstance(children, list):
-        raise ValidationError(
-            "children must be a list",
-            path=f"{path}.children"
-        )
-    for i, child in enumerate(children):
-        _validate_part(child, f"{path}.children[{i}]")
+        
+        # Validate kind
+        kind = data.get("kind")
+        if kind not in ("question", "letter", "roman"):
+            raise ValidationError(
+                f"Invalid part kind: {kind!r}",
+                path=f"{_format_part_path(ref)}.kind"
+            )
+        
+        # Validate marks
+        marks = data.get("marks")
+        if not isinstance(marks, int) or marks < 0:
+            raise ValidationError(
+                f"Invalid marks: {marks} (must be non-negative integer)",
+                path=f"{_format_part_path(ref)}.marks"
+            )
+        
+        # Validate bounds
+        bounds = data.get("bounds")
+        if not isinstance(bounds, dict):
+            raise ValidationError(
+                "bounds must be a dict",
+                path=f"{_format_part_path(ref)}.bounds"
+            )
+        error = _bounds_error(bounds)
+        if error is not None:
+            raise ValidationError(error[0], path=f"{_format_part_path(ref)}.bounds{error[1]}")
+        
+        # Validate context_bounds if present
+        if "context_bounds" in data:
+            if kind == "roman":
+                raise ValidationError(
+                    "Roman parts should not have context_bounds",
+                    path=f"{_format_part_path(ref)}.context_bounds"
+                )
+            error = _bounds_error(data["context_bounds"])
+            if error is not None:
+                raise ValidationError(
+                    error[0], path=f"{_format_part_path(ref)}.context_bounds{error[1]}"
+                )
+        
+        # Queue children, reversed so they are popped in document order
+        children = data.get("children", [])
+        if not isinstance(children, list):
+            raise ValidationError(
+                "children must be a list",
+                path=f"{_format_part_path(ref)}.children"
+            )
+        for i in range(len(children) - 1, -1, -1):
+            stack.append((children[i], (ref, i)))
 
 
-def _validate_bounds(data: dict[str, Any], path: str) -> None:
-    """Validate bounds data."""
-    if "top" not in data or "bottom" not in data:
-        raise ValidationError(
-            "bounds must have top and bottom",
-            path=path
-        )
+def _bounds_error(data: dict[str, Any]) -> tuple[str, str] | None:
+    """
+    Check bounds data without formatting any path.
     
-    top = data["top"]
-    bottom = data["bottom"]
+    Returns:
+        (message, path suffix) for the first problem, or None if valid
+    """
+    try:
+        top = data["top"]
+        bottom = data["bottom"]
+    except (KeyError, TypeError):
+        return "bounds must have top and bottom", ""
     
     if not isinstance(top, int) or top < 0:
-        raise ValidationError(
-            f"Invalid top: {top} (must be non-negative integer)",
-            path=f"{path}.top"
-        )
+        return f"Invalid top: {top} (must be non-negative integer)", ".top"
     
     if not isinstance(bottom, int) or bottom <= top:
-        raise ValidationError(
-            f"Invalid bottom: {bottom} (must be > top={top})",
-            path=f"{path}.bottom"
-        )
+        return f"Invalid bottom: {bottom} (must be > top={top})", ".bottom"
+    
+    return None
 
 
 def validate_regions(data: dict[str, Any], *, strict: bool = False) -> None:
@@ -271,18 +322,10 @@ def validate_regions(data: dict[str, Any], *, strict: bool = False) -> None:
                 f"Region {label!r} must have bounds",
                 path=f"regions.{label}"
             )
-        _validate_bounds(region["bounds"], f"regions.{label}.bounds")
+        error = _bounds_error(region["bounds"])
+        if error is not None:
+            raise ValidationError(error[0], path=f"regions.{label}.bounds{error[1]}")
     
     # Full schema validation if available
     if strict:
-        jsonschema = _get_jsonschema()
-        if jsonschema:
-            schema = _load_schema("regions")
-            try:
-                jsonschema.validate(data, schema)
-            except jsonschema.ValidationError as e:
-                raise ValidationError(
-                    f"Schema validation failed: {e.message}",
-                    path=".".join(str(p) for p in e.absolute_path),
-                    errors=[e.message]
-                )
+        _validate_against_schema(data, "regions")
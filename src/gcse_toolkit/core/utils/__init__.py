@@ -7,6 +7,9 @@ Serialization and utility functions.
 from .serialization import (
     serialize_question,
     deserialize_question,
+    dumps_part,
+    loads_part,
+    load_parts,
     serialize_regions,
     deserialize_regions,
     load_questions_jsonl,
@@ -18,6 +21,9 @@ from .serialization import (
 __all__ = [
     "serialize_question",
     "deserialize_question",
+    "dumps_part",
+    "loads_part",
+    "load_parts",
     "serialize_regions",
     "deserialize_regions",
     "load_questions_jsonl",
@@ -21,15 +21,23 @@ V2 Solution:
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 
 from ..models.marks import Marks
 from ..models.bounds import SliceBounds
-from ..models.parts import Part, PartKind
+from ..models.parts import Part, PartKind, _parse_kind
 from ..models.questions import Question
 from ..schemas.validator import validate_question, validate_regions, ValidationError
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding (speedups extra)
+except ImportError:
+    orjson = None
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Question Serialization
@@ -77,19 +85,16 @@ def deserialize_question(
     if validate:
         validate_question(data, strict=False)  # Basic validation
     
-    # Parse question_node
-    question_node = _deserialize_part(data["question_node"])
-    
-    # Resolve paths
-    composite_path = Path(data.get("composite_path", ""))
-    regions_path = Path(data.get("regions_path", ""))
-    mark_scheme_path = Path(data["mark_scheme_path"]) if data.get("mark_scheme_path") else None
+    # Parse question_node (iterative, validate-once tree build)
+    question_node = load_parts(data["question_node"])
     
-    if base_path:
-        composite_path = base_path / composite_path
-        regions_path = base_path / regions_path
-        if mark_scheme_path:
-            mark_scheme_path = base_path / mark_scheme_path
+    # Resolve paths: Path(base, raw) joins in one construction (and, like
+    # base / raw, leaves absolute stored paths untouched)
+    root = (base_path,) if base_path else ()
+    composite_path = Path(*root, data.get("composite_path", ""))
+    regions_path = Path(*root, data.get("regions_path", ""))
+    raw_mark_scheme = data.get("mark_scheme_path")
+    mark_scheme_path = Path(*root, raw_mark_scheme) if raw_mark_scheme else None
     
     return Question(
         id=data["id"],
@@ -112,43 +117,111 @@ def deserialize_question(
     )
 
 
-def _deserialize_part(data: dict[str, Any]) -> Part:
-    """Deserialize a Part from a dictionary."""
-    # Parse children recursively
-    children = tuple(
-        _deserialize_part(child) for child in data.get("children", [])
-    )
+# ─────────────────────────────────────────────────────────────────────────────
+# Part Serialization
+# ─────────────────────────────────────────────────────────────────────────────
+
+def load_parts(data: dict[str, Any]) -> Part:
+    """
+    Build a Part tree from a dict in one validated pass.
     
-    # Parse bounds
-    bounds = SliceBounds.from_dict(data["bounds"])
-    context_bounds = (
-        SliceBounds.from_dict(data["context_bounds"])
-        if "context_bounds" in data else None
-    )
-    label_bbox = (
-        SliceBounds.from_dict(data["label_bbox"])
-        if "label_bbox" in data else None
-    )
+    Equivalent to ``Part.from_dict`` but checks each sibling group's
+    ordering/overlap and the roman context_bounds rule once while walking
+    the dict tree, then constructs nodes through ``Part._unchecked`` so
+    the per-instance constructor checks are not repeated.
     
-    # Parse marks
-    marks = Marks(
-        value=data["marks"],
-        source=data.get("mark_source", "explicit"),
-    )
+    Args:
+        data: Dict representation of the root part
+        
+    Returns:
+        Part instance
+        
+    Raises:
+        ValueError: If siblings are unsorted/overlapping or a roman part
+            has context_bounds (same messages as the Part constructor)
+    """
+    built: list[Part] = []
+    stack: list[tuple[dict[str, Any], bool]] = [(data, False)]
+    while stack:
+        node, expanded = stack.pop()
+        child_data = node.get("children") or ()
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(child_data))
+            continue
+        
+        if child_data:
+            split = len(built) - len(child_data)
+            children = tuple(built[split:])
+            del built[split:]
+            for prev, child in zip(children, children[1:]):
+                if child.bounds.top < prev.bounds.bottom:
+                    raise ValueError(
+                        f"Children of {node['label']} must be sorted by position and cannot overlap "
+                        f"(top={child.bounds.top} < last_bottom={prev.bounds.bottom})"
+                    )
+        else:
+            children = ()
+        
+        kind = _parse_kind(node["kind"])
+        context_bounds = node.get("context_bounds")
+        if context_bounds is not None and kind == PartKind.ROMAN:
+            raise ValueError("Roman numeral parts should not have context_bounds")
+        label_bbox = node.get("label_bbox")
+        
+        built.append(Part._unchecked(
+            label=node["label"],
+            kind=kind,
+            marks=Marks.from_source(node["marks"], node.get("mark_source", "explicit")),
+            bounds=SliceBounds.from_dict(node["bounds"]),
+            context_bounds=(
+                SliceBounds.from_dict(context_bounds)
+                if context_bounds is not None else None
+            ),
+            label_bbox=(
+                SliceBounds.from_dict(label_bbox)
+                if label_bbox is not None else None
+            ),
+            children=children,
+            topic=node.get("topic"),
+            sub_topics=tuple(node.get("sub_topics", ())),
+            is_valid=node.get("is_valid", True),
+            validation_issues=tuple(node.get("validation_issues", ())),
+        ))
+    return built[0]
+
+
+def dumps_part(part: Part) -> bytes:
+    """
+    Serialize a Part tree straight to UTF-8 JSON bytes.
     
-    return Part(
-        label=data["label"],
-        kind=PartKind(data["kind"]),
-        marks=marks,
-        bounds=bounds,
-        context_bounds=context_bounds,
-        label_bbox=label_bbox,
-        children=children,
-        topic=data.get("topic"),
-        sub_topics=tuple(data.get("sub_topics", [])),
-        is_valid=data.get("is_valid", True),
-        validation_issues=tuple(data.get("validation_issues", [])),
-    )
+    Uses orjson when installed, otherwise the stdlib json module.
+    Output shape is identical to ``part.to_dict()``.
+    
+    Args:
+        part: Root of the part tree to serialize
+        
+    Returns:
+        JSON document as bytes
+    """
+    data = part.to_dict()
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def loads_part(data: bytes | str) -> Part:
+    """
+    Deserialize a Part tree from JSON produced by dumps_part().
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        Part instance
+    """
+    payload = orjson.loads(data) if orjson is not None else json.loads(data)
+    return load_parts(payload)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -228,19 +301,66 @@ def deserialize_regions(
 # JSONL Utilities
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Below this many lines the process spawn cost outweighs parallel decoding
+_PARALLEL_MIN_LINES = 1000
+
+
+_JSONL_ERRORS = (json.JSONDecodeError, ValidationError, ValueError)
+
+
+def _decode_jsonl_line(line: bytes, *, validate: bool, base_path: Path) -> Question:
+    """Decode one raw JSONL line into a Question (picklable for workers)."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    data = orjson.loads(line) if orjson is not None else json.loads(line)
+    return deserialize_question(data, validate=validate, base_path=base_path)
+
+
+def _raise_jsonl_error(
+    lines: list[bytes],
+    error: Exception,
+    *,
+    validate: bool,
+    base_path: Path,
+    source: str,
+) -> NoReturn:
+    """Re-decode lines in order to report which one failed, then raise."""
+    line_no = 0
+    for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            _decode_jsonl_line(line, validate=validate, base_path=base_path)
+        except _JSONL_ERRORS as e:
+            error = e
+            break
+    raise ValidationError(
+        f"Error parsing line {line_no}: {error}",
+        path=source,
+        errors=[str(error)]
+    )
+
+
 def load_questions_jsonl(
     path: Path,
     *,
     validate: bool = True,
     base_path: Path | None = None,
+    workers: int | None = 1,
 ) -> list[Question]:
     """
     Load questions from a JSONL file.
     
+    Decoded serially by default. Passing ``workers`` > 1 (or None for one
+    per CPU) opts large files (1000+ lines) into a process pool; order is
+    preserved. Every Question is pickled back to the parent, so the pool
+    only pays off for big files on multi-core hosts.
+    
     Args:
         path: Path to questions.jsonl file
         validate: Whether to validate each question
         base_path: Base path for resolving relative paths (defaults to parent of jsonl)
+        workers: Worker processes for large files (1 = serial, None = one per CPU)
         
     Returns:
         List of Question instances
@@ -255,25 +375,26 @@ def load_questions_jsonl(
     if base_path is None:
         base_path = path.parent
     
-    questions = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                data = json.loads(line)
-                question = deserialize_question(data, validate=validate, base_path=base_path)
-                questions.append(question)
-            except (json.JSONDecodeError, ValidationError, ValueError) as e:
-                raise ValidationError(
-                    f"Error parsing line {line_no}: {e}",
-                    path=str(path),
-                    errors=[str(e)]
-                )
+    # Lines stay as bytes: orjson (and json) decode UTF-8 bytes directly
+    with open(path, "rb") as f:
+        raw_lines = f.readlines()
     
-    return questions
+    # Line numbers are only needed for error messages, so the happy path
+    # skips numbering and a failure re-walks the file to locate the line
+    decode = partial(_decode_jsonl_line, validate=validate, base_path=base_path)
+    try:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(raw_lines) >= _PARALLEL_MIN_LINES:
+            lines = [line for line in raw_lines if line.strip()]
+            chunksize = max(1, len(lines) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(decode, lines, chunksize=chunksize))
+        return [decode(line) for line in raw_lines if line.strip()]
+    except _JSONL_ERRORS as e:
+        _raise_jsonl_error(
+            raw_lines, e, validate=validate, base_path=base_path, source=str(path)
+        )
 
 
 def save_questions_jsonl(questions: list[Question], path: Path) -> None:
@@ -286,11 +407,14 @@ def save_questions_jsonl(questions: list[Question], path: Path) -> None:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, "w", encoding="utf-8") as f:
+    with open(path, "wb") as f:
         for question in questions:
             data = serialize_question(question)
-            f.write(json.dumps(data, ensure_ascii=False))
-            f.write("\n")
+            if orjson is not None:
+                f.write(orjson.dumps(data))
+            else:
+                f.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+            f.write(b"\n")
 
 
 def load_regions_json(path: Path, *, validate: bool = True) -> dict[str, SliceBounds]:
@@ -307,8 +431,9 @@ def load_regions_json(path: Path, *, validate: bool = True) -> dict[str, SliceBo
     if not path.exists():
         raise FileNotFoundError(f"Regions file not found: {path}")
     
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     regions, _ = deserialize_regions(data, validate=validate)
     return regions
@@ -320,6 +445,8 @@ def save_regions_json(
     regions: dict[str, SliceBounds],
     composite_size: tuple[int, int],
     context_bounds: dict[str, SliceBounds] | None = None,
+    *,
+    pretty: bool = False,
 ) -> None:
     """
     Save regions to a JSON file.
@@ -330,10 +457,14 @@ def save_regions_json(
         regions: Map of part labels to bounds
         composite_size: (width, height) of composite image
         context_bounds: Optional context bounds
+        pretty: Indent the output for human inspection (compact by default)
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     
     data = serialize_regions(question_id, regions, composite_size, context_bounds)
     
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2 if pretty else None, ensure_ascii=False)
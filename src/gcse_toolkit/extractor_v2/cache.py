@@ -7,9 +7,12 @@ Purpose:
     for multiple questions.
 
 Key Classes:
-    - PageRenderCache: LRU cache for rendered page images
+    - PageRenderCache: Two-tier LRU cache for rendered page images
+      (hot uint8 arrays, warm zlib-compressed bytes), plus bit-packed
+      binarized masks kept separately from the grayscale tiers
 
 Dependencies:
+    - numpy: Zero-copy page buffers and crops
     - PIL.Image: Image handling
     - fitz (PyMuPDF): PDF rendering
 
@@ -22,8 +25,11 @@ OPTIMIZATION #4: Page Pixmap Caching
 from __future__ import annotations
 
 import logging
+import zlib
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional
 
+import numpy as np
 from PIL import Image
 import fitz
 
@@ -47,18 +53,28 @@ class PageRenderCache:
         >>> img2 = cache.get_or_render(doc, 0, 200)  # Cache hit
     """
     
-    def __init__(self, max_pages: int = 16):
+    def __init__(self, max_pages: int = 16, max_warm: int = 16):
         """
         Initialize cache with maximum page limit.
         
         Args:
             max_pages: Maximum pages to cache (~3MB each at 200 DPI).
                       Default 16 = ~50MB max memory.
+            max_warm: Maximum pages evicted from the hot tier to keep
+                      zlib-compressed (typically 3-5x smaller). 0 disables.
         """
-        self._cache: Dict[Tuple[int, int], Image.Image] = {}
+        # Pages are kept as uint8 arrays viewing the pixmap samples, so
+        # crops are NumPy slices and PIL images are only built on demand.
+        # Insertion order doubles as LRU order (oldest first).
+        self._cache: OrderedDict[Tuple[int, int], np.ndarray] = OrderedDict()
         self._max_pages = max_pages
-        self._access_order: list = []  # For LRU eviction
+        # Warm tier: (compressed pixels, height, width), also oldest first
+        self._warm: OrderedDict[Tuple[int, int], Tuple[bytes, int, int]] = OrderedDict()
+        self._max_warm = max_warm
+        # Binarized masks: (page, dpi, threshold) -> (packed bits, width)
+        self._masks: OrderedDict[Tuple[int, int, int], Tuple[np.ndarray, int]] = OrderedDict()
         self._doc_id: Optional[str] = None
+        self._matrices: Dict[int, fitz.Matrix] = {}  # Render matrix per DPI
     
     def set_document(self, doc_path: str) -> None:
         """
@@ -88,18 +104,129 @@ class PageRenderCache:
         Returns:
             Full-page grayscale image.
         """
+        return Image.fromarray(self._page_array(doc, page_idx, dpi))
+    
+    def get_or_render_mask(
+        self,
+        doc: fitz.Document,
+        page_idx: int,
+        dpi: int,
+        threshold: int,
+    ) -> np.ndarray:
+        """
+        Get a cached bit-packed binarized page render or create one.
+        
+        Only the packed mask is kept (1 bit per pixel, 8x smaller than the
+        grayscale page): a miss thresholds an already-cached page or
+        renders one without adding it to the grayscale tiers. Use
+        crop_mask() to unpack just the region of interest.
+        
+        Args:
+            doc: Open PyMuPDF document.
+            page_idx: 0-indexed page number.
+            dpi: Resolution for rendering.
+            threshold: Pixels darker than this (value < threshold) are set.
+            
+        Returns:
+            uint8 array of shape (height, ceil(width / 8)), as np.packbits
+            along rows (unpack with count=width).
+        """
+        return self._mask_entry(doc, page_idx, dpi, threshold)[0]
+    
+    def _mask_entry(
+        self,
+        doc: fitz.Document,
+        page_idx: int,
+        dpi: int,
+        threshold: int,
+    ) -> Tuple[np.ndarray, int]:
+        """Return (packed mask, page width), binarizing the page on a miss."""
+        key = (page_idx, dpi, threshold)
+        
+        cached = self._masks.get(key)
+        if cached is not None:
+            self._masks.move_to_end(key)
+            return cached
+        
+        # Reuse a hot grayscale page without promoting it; otherwise render
+        # one that is dropped as soon as it is packed
+        page_arr = self._cache.get((page_idx, dpi))
+        if page_arr is None:
+            page_arr = self._render(doc, page_idx, dpi)
+        
+        if len(self._masks) >= self._max_pages:
+            self._masks.popitem(last=False)
+        cached = self._masks[key] = (
+            np.packbits(page_arr < threshold, axis=1), page_arr.shape[1]
+        )
+        return cached
+    
+    def crop_mask(
+        self,
+        page_idx: int,
+        dpi: int,
+        threshold: int,
+        clip: fitz.Rect,
+        page_rect: fitz.Rect,
+    ) -> np.ndarray:
+        """
+        Unpack a region of a cached binarized page.
+        
+        Only the packed bytes covering the region are unpacked.
+        
+        Args:
+            page_idx: Page index (mask must be cached).
+            dpi: DPI of the cached mask.
+            threshold: Threshold of the cached mask.
+            clip: Region to crop (in PDF points).
+            page_rect: Full page rectangle (in PDF points).
+            
+        Returns:
+            Boolean array of shape (height, width) for the region.
+            
+        Raises:
+            KeyError: If the mask is not cached.
+        """
+        key = (page_idx, dpi, threshold)
+        cached = self._masks.get(key)
+        if cached is None:
+            raise KeyError(
+                f"Mask for page {page_idx} at {dpi} DPI (threshold {threshold}) not in cache"
+            )
+        self._masks.move_to_end(key)
+        
+        packed, width = cached
+        left, top, right, bottom = _clip_to_pixels(
+            dpi, clip, page_rect, packed.shape[0], width
+        )
+        if right <= left or bottom <= top:
+            return np.zeros((max(0, bottom - top), max(0, right - left)), dtype=bool)
+        
+        bits = np.unpackbits(packed[top:bottom, left // 8:(right + 7) // 8], axis=1)
+        start = left % 8
+        return bits[:, start:start + (right - left)].view(bool)
+    
+    def _page_array(self, doc: fitz.Document, page_idx: int, dpi: int) -> np.ndarray:
+        """Return the cached grayscale page array, rendering it on a miss."""
         key = (page_idx, dpi)
         
-        if key in self._cache:
-            # Move to end (most recently used)
-            self._access_order.remove(key)
-            self._access_order.append(key)
+        cached = self._lookup(key)
+        if cached is not None:
             logger.debug(f"Cache HIT: page {page_idx} at {dpi} DPI")
-            return self._cache[key]
+            return cached
         
-        # Render full page
+        page_arr = self._render(doc, page_idx, dpi)
+        self._store(key, page_arr)
+        logger.debug(f"Cache MISS: rendered page {page_idx} at {dpi} DPI")
+        
+        return page_arr
+    
+    def _render(self, doc: fitz.Document, page_idx: int, dpi: int) -> np.ndarray:
+        """Render a page to a uint8 grayscale array (not cached)."""
         page = doc[page_idx]
-        matrix = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+        matrix = self._matrices.get(dpi)
+        if matrix is None:
+            matrix = self._matrices[dpi] = fitz.Matrix(dpi / 72.0, dpi / 72.0)
         
         # OPTIMIZATION #1: Direct grayscale rendering
         pix = page.get_pixmap(
@@ -107,19 +234,73 @@ class PageRenderCache:
             alpha=False,
             colorspace=fitz.csGRAY
         )
-        image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        # View the samples buffer directly (rows may be padded to stride)
+        return np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+            pix.height, pix.stride
+        )[:, :pix.width]
+    
+    def _lookup(self, key: Tuple[int, int]) -> Optional[np.ndarray]:
+        """Return a cached page (promoting warm entries to hot), or None."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return cached
         
-        # Cache with LRU eviction
+        warm = self._warm.pop(key, None)
+        if warm is None:
+            return None
+        data, height, width = warm
+        page_arr = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(height, width)
+        self._store(key, page_arr)
+        return page_arr
+    
+    def _store(self, key: Tuple[int, int], page_arr: np.ndarray) -> None:
+        """Insert a page into the hot tier, demoting the LRU page if full."""
         if len(self._cache) >= self._max_pages:
-            oldest = self._access_order.pop(0)
-            del self._cache[oldest]
+            oldest, oldest_arr = self._cache.popitem(last=False)
             logger.debug(f"Cache EVICT: page {oldest[0]} at {oldest[1]} DPI")
+            if self._max_warm > 0:
+                if len(self._warm) >= self._max_warm:
+                    self._warm.popitem(last=False)
+                height, width = oldest_arr.shape
+                # Level 1: fast, and grayscale pages still shrink several-fold
+                self._warm[oldest] = (
+                    zlib.compress(np.ascontiguousarray(oldest_arr), 1), height, width
+                )
         
-        self._cache[key] = image
-        self._access_order.append(key)
-        logger.debug(f"Cache MISS: rendered page {page_idx} at {dpi} DPI")
+        self._cache[key] = page_arr
+    
+    def crop_region_array(
+        self,
+        page_idx: int,
+        dpi: int,
+        clip: fitz.Rect,
+        page_rect: fitz.Rect,
+    ) -> np.ndarray:
+        """
+        Crop a region from a cached full-page render as a zero-copy view.
         
-        return image
+        Args:
+            page_idx: Page index (must be cached).
+            dpi: DPI of the cached render.
+            clip: Region to crop (in PDF points).
+            page_rect: Full page rectangle (in PDF points).
+            
+        Returns:
+            uint8 array of shape (height, width) sharing the page buffer.
+            
+        Raises:
+            KeyError: If page is not cached.
+        """
+        full_page = self._lookup((page_idx, dpi))
+        if full_page is None:
+            raise KeyError(f"Page {page_idx} at {dpi} DPI not in cache")
+        
+        height, width = full_page.shape
+        left, top, right, bottom = _clip_to_pixels(dpi, clip, page_rect, height, width)
+        
+        return full_page[top:bottom, left:right]
     
     def crop_region(
         self,
@@ -143,26 +324,9 @@ class PageRenderCache:
         Raises:
             KeyError: If page is not cached.
         """
-        key = (page_idx, dpi)
-        if key not in self._cache:
-            raise KeyError(f"Page {page_idx} at {dpi} DPI not in cache")
-        
-        full_page = self._cache[key]
-        scale = dpi / 72.0
-        
-        # Convert clip to pixel coordinates
-        left = int((clip.x0 - page_rect.x0) * scale)
-        top = int((clip.y0 - page_rect.y0) * scale)
-        right = int((clip.x1 - page_rect.x0) * scale)
-        bottom = int((clip.y1 - page_rect.y0) * scale)
-        
-        # Clamp to image bounds
-        left = max(0, left)
-        top = max(0, top)
-        right = min(full_page.width, right)
-        bottom = min(full_page.height, bottom)
-        
-        cropped = full_page.crop((left, top, right, bottom))
+        cropped = Image.fromarray(
+            self.crop_region_array(page_idx, dpi, clip, page_rect)
+        )
         
         # Return 0,0 trim offset since we're not trimming whitespace here
         # (that's done separately if needed)
@@ -171,7 +335,8 @@ class PageRenderCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._cache.clear()
-        self._access_order.clear()
+        self._warm.clear()
+        self._masks.clear()
         logger.debug("Cache cleared")
     
     @property
@@ -182,4 +347,27 @@ class PageRenderCache:
     @property
     def hit_rate(self) -> str:
         """Return cache statistics as string."""
-        return f"Cache: {self.size}/{self._max_pages} pages"
+        return (
+            f"Cache: {self.size}/{self._max_pages} pages "
+            f"(+{len(self._warm)}/{self._max_warm} compressed)"
+        )
+
+
+def _clip_to_pixels(
+    dpi: int,
+    clip: fitz.Rect,
+    page_rect: fitz.Rect,
+    height: int,
+    width: int,
+) -> Tuple[int, int, int, int]:
+    """Convert a clip in PDF points to (left, top, right, bottom) pixels, clamped."""
+    scale = dpi / 72.0
+    
+    # Convert clip to pixel coordinates
+    left = int((clip.x0 - page_rect.x0) * scale)
+    top = int((clip.y0 - page_rect.y0) * scale)
+    right = int((clip.x1 - page_rect.x0) * scale)
+    bottom = int((clip.y1 - page_rect.y0) * scale)
+    
+    # Clamp to image bounds
+    return max(0, left), max(0, top), min(width, right), min(height, bottom)
@@ -7,7 +7,9 @@ Purpose:
 
 Key Functions:
     - classify_topic(): Main entry point for topic classification
+    - classify_topics(): classify_topic for many texts (one batched model call)
     - best_topic(): Regex-based weighted pattern matching
+    - best_topic_compiled(): best_topic over precompiled, cached patterns
     - apply_topic_consensus(): Infer topic from part majority voting
 
 Dependencies:
@@ -20,9 +22,11 @@ from __future__ import annotations
 import logging
 import math
 import re
+from collections import Counter
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 from gcse_toolkit.core.models.parts import Part
 
@@ -32,11 +36,14 @@ logger = logging.getLogger(__name__)
 UNKNOWN_TOPIC = "00. Unknown"
 
 
+# Lowercased topic labels that mean "unclassified"
+_UNKNOWN_TOPICS = frozenset({"unknown", "00. unknown"})
+
+
+@lru_cache(maxsize=1024)
 def _is_unknown(topic: Optional[str]) -> bool:
-    """Check if a topic is Unknown or unclassified."""
-    if not topic:
-        return True
-    return topic.lower() in ("unknown", "00. unknown", "")
+    """Check if a topic is Unknown or unclassified (memoized: topics repeat)."""
+    return not topic or topic.lower() in _UNKNOWN_TOPICS
 
 
 def propagate_topics(
@@ -65,37 +72,46 @@ def propagate_topics(
     """
     result = dict(part_topics)  # Copy to avoid mutation
     
-    # Pass 1: Propagate from children to Unknown parents
-    def propagate_up(part: Part) -> Optional[str]:
-        """Return first classified topic from this branch, propagating to Unknown parents."""
+    # Pass 1: Propagate from children to Unknown parents (post-order).
+    # Each part's topic is read on entry, before its children can change
+    # result (labels may repeat); branch_topic holds each finished part's
+    # first classified topic in its branch.
+    entry_topic: Dict[int, Optional[str]] = {}
+    branch_topic: Dict[int, Optional[str]] = {}
+    stack: List[Tuple[Part, bool]] = [(part_tree, False)]
+    while stack:
+        part, exiting = stack.pop()
         label = part.label
-        current = result.get(label)
         
+        if not exiting:
+            entry_topic[id(part)] = result.get(label)
+            stack.append((part, True))
+            stack.extend((child, False) for child in reversed(part.children))
+            continue
+        
+        current = entry_topic[id(part)]
         if part.children:
-            # Get topics from children first
-            child_topics = []
-            for child in part.children:
-                child_topic = propagate_up(child)
-                if child_topic:
-                    child_topics.append(child_topic)
-            
             # If this part is Unknown but has classified children, adopt first child's topic
-            if _is_unknown(current) and child_topics:
-                result[label] = child_topics[0]
-                return child_topics[0]
-        
-        return current if not _is_unknown(current) else None
-    
-    propagate_up(part_tree)
-    
-    # Pass 2: Fill Unknown siblings from adjacent classified siblings
-    def propagate_siblings(part: Part) -> None:
-        """Fill Unknown siblings when neighbors share the same topic."""
-        if not part.children or len(part.children) < 2:
-            return
+            first_child_topic = next(
+                filter(None, (branch_topic[id(child)] for child in part.children)), None
+            )
+            if _is_unknown(current) and first_child_topic:
+                result[label] = first_child_topic
+                branch_topic[id(part)] = first_child_topic
+                continue
         
-        children = list(part.children)
+        branch_topic[id(part)] = current if not _is_unknown(current) else None
+    
+    # Pass 2: Fill Unknown siblings from adjacent classified siblings (pre-order).
+    # Only parts with 2+ children are descended into.
+    pending = [part_tree]
+    while pending:
+        part = pending.pop()
+        children = part.children
+        if len(children) < 2:
+            continue
         
+        last = len(children) - 1
         for i, child in enumerate(children):
             label = child.label
             current = result.get(label)
@@ -103,16 +119,12 @@ def propagate_topics(
             if _is_unknown(current):
                 # Check if before and after siblings share the same topic
                 before = result.get(children[i-1].label) if i > 0 else None
-                after = result.get(children[i+1].label) if i < len(children) - 1 else None
+                after = result.get(children[i+1].label) if i < last else None
                 
                 if before and after and before == after and not _is_unknown(before):
                     result[label] = before
         
-        # Recurse into children
-        for child in part.children:
-            propagate_siblings(child)
-    
-    propagate_siblings(part_tree)
+        pending.extend(reversed(children))
     
     return result
 
@@ -129,17 +141,15 @@ def get_consensus_topic(part_topics: Dict[str, str]) -> str:
     Returns:
         Most frequent non-Unknown topic, or UNKNOWN_TOPIC if none
     """
-    topic_counts: Dict[str, int] = {}
-    
-    for topic in part_topics.values():
-        if not _is_unknown(topic):
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+    topic_counts = Counter(
+        topic for topic in part_topics.values() if not _is_unknown(topic)
+    )
     
     if not topic_counts:
         return UNKNOWN_TOPIC
     
-    # Return topic with highest count
-    return max(topic_counts.items(), key=lambda x: x[1])[0]
+    # Return topic with highest count (first seen wins ties)
+    return topic_counts.most_common(1)[0][0]
 
 
 def apply_topic_consensus(
@@ -199,24 +209,64 @@ def classify_all_parts(
     Returns:
         Dict mapping part label to classified topic
     """
-    result: Dict[str, str] = {}
+    parts = part_tree.all_parts()
+    topics = classify_topics(
+        [part_texts.get(part.label, "") for part in parts], exam_code, paper
+    )
+    return {part.label: topic for part, topic in zip(parts, topics)}
+
+
+def classify_topics(
+    texts: Sequence[str],
+    exam_code: str,
+    paper: int = 1,
+    require_confidence: bool = True,
+) -> List[str]:
+    """
+    Classify many texts, as classify_topic would one at a time.
     
-    def classify_part(part: Part) -> None:
-        label = part.label
-        text = part_texts.get(label, "")
+    The ML model (if any) sees all non-empty texts in one batched call;
+    only texts it does not confidently classify fall back to regex.
+    
+    Args:
+        texts: Question texts to classify
+        exam_code: Exam code (e.g., "0478")
+        paper: Paper number for paper-specific patterns
+        require_confidence: If True, return Unknown on low confidence
         
-        if text.strip():
-            topic = classify_topic(text, exam_code, paper)
+    Returns:
+        Topic label per text, in input order
+    """
+    results = [UNKNOWN_TOPIC] * len(texts)
+    pending = [i for i, text in enumerate(texts) if text and text.strip()]
+    
+    # Exams without patterns stay Unknown (even with a model)
+    if not pending or not _get_topic_patterns(exam_code, paper):
+        return results
+    
+    model = _get_topic_model(exam_code)
+    predicted: List[Optional[str]] = [None] * len(pending)
+    model_ok = False
+    if model:
+        try:
+            predicted = model.predict_batch(
+                [texts[i] for i in pending],
+                min_conf=None if require_confidence else 0.0,
+            )
+            model_ok = True
+        except Exception as e:
+            logger.debug(f"ML model failed: {e}")
+    
+    for i, topic in zip(pending, predicted):
+        if topic:
+            results[i] = topic
         else:
-            topic = UNKNOWN_TOPIC
-        
-        result[label] = topic
-        
-        for child in part.children:
-            classify_part(child)
+            results[i] = _regex_topic(
+                texts[i], exam_code, paper, require_confidence,
+                _model_probs_getter(model, texts[i]) if model_ok else None,
+            )
     
-    classify_part(part_tree)
-    return result
+    return results
 
 
 def classify_topic(
@@ -249,18 +299,14 @@ def classify_topic(
     if not text or not text.strip():
         return UNKNOWN_TOPIC
     
-    # Load patterns for this exam
-    patterns = _get_topic_patterns(exam_code, paper)
-    if not patterns:
+    # Exams without patterns stay Unknown (even with a model)
+    if not _get_topic_patterns(exam_code, paper):
         logger.debug(f"No patterns for {exam_code}, returning Unknown")
         return UNKNOWN_TOPIC
     
-    # Load evaluation stats for weighted scoring
-    stats = _get_exam_stats(exam_code)
-    
     # Try ML model first (if available)
     model = _get_topic_model(exam_code)
-    model_probs = None
+    get_model_probs = None
     if model:
         try:
             # Phase 11: Production parity. Use model.predict which favors optimal_threshold.
@@ -270,18 +316,39 @@ def classify_topic(
                 logger.debug(f"ML model classified as {topic}")
                 return topic
             
-            # If not returned, get probabilities for regex tiebreaking/insight
-            model_probs = model.get_probabilities(text)
+            # If not returned, probabilities are only needed for regex tiebreaking
+            get_model_probs = _model_probs_getter(model, text)
         except Exception as e:
             logger.debug(f"ML model failed: {e}")
     
-    # Fallback to regex classification
-    topic = best_topic(
-        text, 
-        patterns, 
-        stats=stats, 
+    return _regex_topic(text, exam_code, paper, require_confidence, get_model_probs)
+
+
+def _model_probs_getter(model, text: str) -> Callable[[], Optional[Dict[str, float]]]:
+    """Defer model.get_probabilities(text) until a regex tie needs it."""
+    def get_model_probs() -> Optional[Dict[str, float]]:
+        try:
+            return model.get_probabilities(text)
+        except Exception as e:
+            logger.debug(f"ML model failed: {e}")
+            return None
+    return get_model_probs
+
+
+def _regex_topic(
+    text: str,
+    exam_code: str,
+    paper: int,
+    require_confidence: bool,
+    get_model_probs: Optional[Callable[[], Optional[Dict[str, float]]]],
+) -> str:
+    """Regex fallback for classify_topic (patterns compiled once per exam/paper)."""
+    topic = best_topic_compiled(
+        text,
+        _get_compiled_patterns(exam_code, paper),
+        _get_pattern_weights(exam_code),
         require_confidence=require_confidence,
-        model_probs=model_probs,
+        get_model_probs=get_model_probs,
     )
     
     if topic:
@@ -316,16 +383,53 @@ def best_topic(
     if not patterns or not sample_text:
         return None
 
-    # Normalize and compile patterns, extracting inline weights
-    compiled, inline_weights = _compile_patterns_with_weights(patterns)
+    return best_topic_compiled(
+        sample_text,
+        _freeze_patterns(patterns),
+        # Build pattern weights from stats (legacy support)
+        _build_pattern_weights(stats) if stats else {},
+        require_confidence=require_confidence,
+        model_probs=model_probs,
+    )
+
+
+def best_topic_compiled(
+    sample_text: str,
+    patterns: _CompiledPatterns,
+    stats_weights: Mapping[str, Dict[str, float]],
+    require_confidence: bool = True,
+    model_probs: Optional[Dict[str, float]] = None,
+    get_model_probs: Optional[Callable[[], Optional[Dict[str, float]]]] = None,
+) -> Optional[str]:
+    """
+    best_topic over patterns already compiled by _freeze_patterns.
     
-    # Build pattern weights from stats (legacy support)
-    stats_weights = _build_pattern_weights(stats) if stats else {}
+    Args:
+        sample_text: The text to classify
+        patterns: Compiled patterns, e.g. from _get_compiled_patterns()
+        stats_weights: Pattern weights from _build_pattern_weights()
+        require_confidence: If True, returns None if top match is weak
+        model_probs: Optional ML model probabilities for tiebreaking
+        get_model_probs: Optional callable producing model_probs, only
+            called when a tie actually needs breaking
+        
+    Returns:
+        Topic name or None if no confident match
+    """
+    if not sample_text:
+        return None
     
+    inline_weights = patterns.weights
+    combined = patterns.combined
     scores: Dict[str, float] = {}
 
-    for topic, regexes in compiled.items():
-        topic_inline_weights = inline_weights.get(topic, [])
+    for topic, regexes in patterns.regexes.items():
+        # Fast reject: one scan finds whether any of the topic's patterns match
+        topic_any = combined.get(topic)
+        if topic_any is not None and not topic_any.search(sample_text):
+            continue
+        
+        topic_inline_weights = inline_weights.get(topic, ())
         stats_topic_weights = stats_weights.get(topic) or stats_weights.get(topic.lower()) or {}
         
         topic_score = 0.0
@@ -366,6 +470,8 @@ def best_topic(
             margin = top_score - second_score
             if margin < 0.3:
                 # Use model probabilities to break tie
+                if model_probs is None and get_model_probs is not None:
+                    model_probs = get_model_probs()
                 if model_probs:
                     p1 = model_probs.get(top_topic, 0.0)
                     p2 = model_probs.get(second_topic, 0.0)
@@ -386,9 +492,12 @@ def _compile_patterns_with_weights(
         patterns: Dict of {topic: [patterns]} where patterns can be strings or dicts
         
     Returns:
-        (compiled_patterns, weights) where:
+        (compiled_patterns, weights, combined) where:
         - compiled_patterns: {topic: [re.Pattern, ...]}
         - weights: {topic: [weight or None, ...]}
+        - combined: {topic: re.Pattern or None} - one alternation of the
+          topic's patterns, matching iff any of them does (None if the
+          patterns cannot be safely joined)
     """
     compiled: Dict[str, List[re.Pattern]] = {}
     weights: Dict[str, List[Optional[float]]] = {}
@@ -414,12 +523,59 @@ def _compile_patterns_with_weights(
                 logger.debug(f"Invalid regex pattern: {pat_str}")
                 continue
     
-    return compiled, weights
+    combined = {topic: _combine_patterns(regexes) for topic, regexes in compiled.items()}
+    return compiled, weights, combined
+
+
+# Numbered/named backreferences would point at the wrong group once joined,
+# and global inline flags ("(?x)") are rejected rather than left to re.error,
+# which Python 3.10 only warns about before applying them to every pattern
+_UNJOINABLE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+
+def _combine_patterns(regexes: List[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Join patterns into one alternation used to reject non-matching topics.
+    
+    Only used as a yes/no test: alternation reports one non-overlapping
+    match per position, so per-pattern scoring still uses search().
+    
+    Returns:
+        Combined pattern, or None for fewer than two patterns or ones that cannot
+        be joined (backreferences, duplicate group names, inline flags).
+    """
+    if len(regexes) < 2:
+        return None
+    sources = [r.pattern for r in regexes]
+    if any(_UNJOINABLE_RE.search(src) for src in sources):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{src})" for src in sources), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+class _CompiledPatterns(NamedTuple):
+    """Frozen output of _compile_patterns_with_weights (safe to cache and share)."""
+    
+    regexes: Mapping[str, Tuple[re.Pattern, ...]]
+    weights: Mapping[str, Tuple[Optional[float], ...]]
+    combined: Mapping[str, Optional[re.Pattern]]
+
+
+def _freeze_patterns(patterns: Dict[str, Iterable]) -> _CompiledPatterns:
+    """Compile patterns into an immutable _CompiledPatterns."""
+    compiled, weights, combined = _compile_patterns_with_weights(patterns)
+    return _CompiledPatterns(
+        regexes=MappingProxyType({t: tuple(r) for t, r in compiled.items()}),
+        weights=MappingProxyType({t: tuple(w) for t, w in weights.items()}),
+        combined=MappingProxyType(combined),
+    )
 
 
 def _compile_patterns(patterns: Dict[str, Iterable[str]]) -> Dict[str, List[re.Pattern]]:
     """Compile regex patterns for all topics (legacy, no weights)."""
-    compiled, _ = _compile_patterns_with_weights(patterns)
+    compiled, _, _ = _compile_patterns_with_weights(patterns)
     return compiled
 
 
@@ -457,6 +613,19 @@ def _get_topic_patterns(exam_code: str, paper: int = 1) -> Dict[str, List[str]]:
     return topic_patterns_from_subtopics(exam_code) or {}
 
 
+@lru_cache(maxsize=16)
+def _get_compiled_patterns(exam_code: str, paper: int = 1) -> _CompiledPatterns:
+    """Get compiled topic patterns for an exam code (compiled once, shared)."""
+    return _freeze_patterns(_get_topic_patterns(exam_code, paper))
+
+
+@lru_cache(maxsize=16)
+def _get_pattern_weights(exam_code: str) -> Mapping[str, Dict[str, float]]:
+    """Get stats-derived pattern weights for an exam code (built once, shared)."""
+    stats = _get_exam_stats(exam_code)
+    return MappingProxyType(_build_pattern_weights(stats) if stats else {})
+
+
 @lru_cache(maxsize=16)
 def _get_exam_stats(exam_code: str) -> Dict[str, Any]:
     """Get evaluation stats for an exam code."""
@@ -10,7 +10,7 @@ stored in the plugin data folder.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import joblib
 import numpy as np
@@ -77,22 +77,27 @@ class TopicModel:
 
     def _vectorize(self, text: str):
         """Build a feature vector for the given text (Phases 1-3 compatibility)."""
+        return self._vectorize_batch([text])
+
+    def _vectorize_batch(self, texts: Sequence[str]):
+        """Build one feature row per text, transforming all rows together."""
         from scipy.sparse import lil_matrix, hstack, csr_matrix
         
         # 1. Preprocess structural tokens
-        text = preprocess_text(text)
+        texts = [preprocess_text(text) for text in texts]
         
         # 2. Regex patterns (Binary)
-        x_regex = lil_matrix((1, self._num_patterns), dtype=np.float32)
-        for pat, j in self.pattern_index.items():
-            if self._compiled[pat].search(text):
-                x_regex[0, j] = 1.0
+        x_regex = lil_matrix((len(texts), self._num_patterns), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for pat, j in self.pattern_index.items():
+                if self._compiled[pat].search(text):
+                    x_regex[i, j] = 1.0
         
         x_regex = x_regex.tocsr()
         
         # 3. Structural Features (Phase 1 Vectorizer)
         if self.vectorizer:
-            x_structural = self.vectorizer.transform([text])
+            x_structural = self.vectorizer.transform(texts)
             x_final = hstack([x_regex, x_structural]).tocsr()
         else:
             x_final = x_regex
@@ -109,81 +114,110 @@ class TopicModel:
 
     def predict_with_confidence(self, text: str) -> Tuple[Optional[str], float]:
         """Return (topic_name or None, confidence [0,1]) with second-pass disambiguation."""
-        x = self._vectorize(text)
+        return self.predict_with_confidence_batch([text])[0]
+
+    def predict_with_confidence_batch(
+        self, texts: Sequence[str]
+    ) -> List[Tuple[Optional[str], float]]:
+        """predict_with_confidence for many texts with one model call."""
+        x = self._vectorize_batch(texts)
         
         # Use calibrated probability if available
         if hasattr(self.model, "predict_proba"):
-            proba = self.model.predict_proba(x)[0]
-            idx = int(proba.argmax())
-            conf = float(proba[idx])
-            topic = self.topics[idx]
-            
-            # Phase 6: Second-Pass Disambiguation
-            if self.confusion_clfs:
-                try:
-                    # Find top 2 topics
-                    top2_idx = proba.argsort()[-2:][::-1]
-                    t1, t2 = self.topics[top2_idx[0]], self.topics[top2_idx[1]]
-                    pair_key = "__vs__".join(sorted([t1, t2]))
-                    
-                    if pair_key in self.confusion_clfs:
-                        bin_clf = self.confusion_clfs[pair_key]
-                        # Logic in build_model was: y_bin_map = [1 if a else 0] where pair = tuple(sorted([a, b]))
-                        # Sorted order gives us mapping
-                        a, b = sorted([t1, t2])
-                        bin_prob = bin_clf.predict_proba(x)[0] # [P(0), P(1)] -> [P(b), P(a)]
-                        
-                        winner_idx = int(bin_prob.argmax())
-                        winner_topic = a if winner_idx == 1 else b
-                        winner_conf = float(bin_prob[winner_idx])
-                        
-                        # If second-pass is confident, override
-                        if winner_conf > 0.6:
-                            return winner_topic, (conf + winner_conf) / 2.0
-                except Exception as e:
-                    # Fallback to primary model if ensemble fails (e.g. feature mismatch)
-                    pass
-            
-            return topic, conf
+            probas = self.model.predict_proba(x)
+            return [self._decide(x[i], proba) for i, proba in enumerate(probas)]
         else:
             # Fallback to decision_function (Legacy)
             decision = self.model.decision_function(x)
-            if decision.ndim == 1:
-                idx = int(decision >= 0)
-                conf = float(abs(decision[0]))
-            else:
-                idx = int(decision.argmax())
-                conf = float(decision.max())
-            return self.topics[idx], conf
+            results = []
+            for row in decision:
+                if decision.ndim == 1:
+                    idx = int(row >= 0)
+                    conf = float(abs(row))
+                else:
+                    idx = int(row.argmax())
+                    conf = float(row.max())
+                results.append((self.topics[idx], conf))
+            return results
+
+    def _decide(self, x, proba) -> Tuple[Optional[str], float]:
+        """Pick the topic for one feature row from its probabilities."""
+        idx = int(proba.argmax())
+        conf = float(proba[idx])
+        topic = self.topics[idx]
+        
+        # Phase 6: Second-Pass Disambiguation
+        if self.confusion_clfs:
+            try:
+                # Find top 2 topics
+                top2_idx = proba.argsort()[-2:][::-1]
+                t1, t2 = self.topics[top2_idx[0]], self.topics[top2_idx[1]]
+                pair_key = "__vs__".join(sorted([t1, t2]))
+                
+                if pair_key in self.confusion_clfs:
+                    bin_clf = self.confusion_clfs[pair_key]
+                    # Logic in build_model was: y_bin_map = [1 if a else 0] where pair = tuple(sorted([a, b]))
+                    # Sorted order gives us mapping
+                    a, b = sorted([t1, t2])
+                    bin_prob = bin_clf.predict_proba(x)[0] # [P(0), P(1)] -> [P(b), P(a)]
+                    
+                    winner_idx = int(bin_prob.argmax())
+                    winner_topic = a if winner_idx == 1 else b
+                    winner_conf = float(bin_prob[winner_idx])
+                    
+                    # If second-pass is confident, override
+                    if winner_conf > 0.6:
+                        return winner_topic, (conf + winner_conf) / 2.0
+            except Exception as e:
+                # Fallback to primary model if ensemble fails (e.g. feature mismatch)
+                pass
+        
+        return topic, conf
 
     def predict(self, text: str, min_conf: Optional[float] = None) -> Optional[str]:
         """Return topic_name if confidence >= threshold, else None."""
-        topic, conf = self.predict_with_confidence(text)
-        
+        return self.predict_batch([text], min_conf)[0]
+
+    def predict_batch(
+        self, texts: Sequence[str], min_conf: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """predict for many texts with one model call."""
         # Use provided min_conf or fall back to model's optimal threshold
         threshold = min_conf if min_conf is not None else self.optimal_threshold
         
-        if topic is None or conf < threshold:
-            return None
-        return topic
+        return [
+            topic if topic is not None and conf >= threshold else None
+            for topic, conf in self.predict_with_confidence_batch(texts)
+        ]
 
     def get_probabilities(self, text: str) -> Dict[str, float]:
         """Return the probability distribution for all topics."""
+        return self.get_probabilities_batch([text])[0]
+
+    def get_probabilities_batch(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """get_probabilities for many texts with one model call."""
+        x = self._vectorize_batch(texts)
+        
         if not hasattr(self.model, "predict_proba"):
             # Fallback for models without probability calibration
             # Use decision function normalized strictly for relative comparison
-            x = self._vectorize(text)
             decision = self.model.decision_function(x)
             if decision.ndim == 1:
                 # Binary: sigmoid
-                score = 1 / (1 + np.exp(-decision[0]))
-                return {self.topics[0]: 1 - score, self.topics[1]: score}
+                scores = 1 / (1 + np.exp(-decision))
+                return [
+                    {self.topics[0]: 1 - score, self.topics[1]: score} for score in scores
+                ]
             else:
                 # Multiclass: softmax
-                exp_scores = np.exp(decision - decision.max())  # shift for stability
-                probs = exp_scores / exp_scores.sum()
-                return {topic: float(prob) for topic, prob in zip(self.topics, probs[0])}
-
-        x = self._vectorize(text)
-        probas = self.model.predict_proba(x)[0]
-        return {topic: float(prob) for topic, prob in zip(self.topics, probas)}
+                exp_scores = np.exp(decision - decision.max(axis=1, keepdims=True))  # shift for stability
+                probs = exp_scores / exp_scores.sum(axis=1, keepdims=True)
+                return [
+                    {topic: float(prob) for topic, prob in zip(self.topics, row)}
+                    for row in probs
+                ]
+
+        probas = self.model.predict_proba(x)
+        return [
+            {topic: float(prob) for topic, prob in zip(self.topics, row)} for row in probas
+        ]
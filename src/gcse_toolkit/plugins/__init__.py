@@ -8,7 +8,7 @@ import sys
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from gcse_toolkit.plugins.validation import (
     validate_manifest,
@@ -21,8 +21,8 @@ logger = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
 class TopicKeywordConfig:
-    paper1: Dict[str, List[str]]
-    paper2: Dict[str, List[str]]
+    paper1: Mapping[str, Sequence[str]]
+    paper2: Mapping[str, Sequence[str]]
 
 
 class MissingResourcesError(RuntimeError):
@@ -137,6 +137,18 @@ class TestFilterTopicFromTail:
         result = _filter_topic_from_tail(q, {"A"})
         
         assert result == {"a"}
+    
+    def test_uses_precomputed_leaf_topics_when_given(self):
+        """Should trust precomputed effective leaf topics over part attributes."""
+        parts = [
+            self._make_mock_part("a", "A"),
+            self._make_mock_part("b", "A"),
+        ]
+        q = self._make_mock_question(parts, "A")
+        
+        result = _filter_topic_from_tail(q, {"A"}, leaf_topics=("A", "B"))
+        
+        assert result == {"a"}
 
 
 class TestPartModeTopicFiltering:
@@ -161,6 +173,7 @@ class TestPartModeTopicFiltering:
         q.topic = default_topic
         q.leaf_parts = parts
         q.all_parts = parts
+        q.all_labels = frozenset(p.label for p in parts)
         q.total_marks = sum(p.marks.value for p in parts)
         
         if parts:
@@ -136,6 +136,17 @@ class TestQuestionOptions:
         for opt in in_range:
             assert 3 <= opt.marks <= 6
 
+    def test_options_in_range_when_any_range_then_matches_linear_scan(
+        self, multi_part_question
+    ):
+        """Bisected range should equal a full scan, in the same order."""
+        opts = generate_options(multi_part_question)
+        
+        for lo in range(0, 12):
+            for hi in range(lo, 12):
+                expected = [o for o in opts.options if lo <= o.marks <= hi]
+                assert list(opts.options_in_range(lo, hi)) == expected
+
     def test_best_option_for_marks_when_exact_match_then_returns_it(
         self, multi_part_question
     ):
@@ -38,6 +38,7 @@ def create_mock_question(qid, default_topic, parts):
     q.topic = default_topic
     q.leaf_parts = parts
     q.all_parts = parts # Simplified
+    q.all_labels = frozenset(p.label for p in parts)
     q.total_marks = sum(p.marks.value for p in parts)
     
     # Needs a root node for metadata generation (zip export)
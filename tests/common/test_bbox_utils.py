@@ -0,0 +1,56 @@
+"""
+Tests for common.bbox_utils PDF-to-pixel conversion.
+"""
+
+import numpy as np
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from gcse_toolkit.common.bbox_utils import bbox_array_to_pixels, bbox_to_pixels
+
+
+BOXES = [
+    (100.0, 200.0, 150.0, 220.0),  # ordinary box
+    (2.5, 3.5, 4.5, 5.5),          # exact halves round to even
+    (0.5, 1.5, 10.5, 11.5),        # halves at both parities
+    (50.0, 60.0, 40.0, 60.0),      # x1 < x0, y1 == y0 (degenerate)
+    (30.0, 30.2, 30.1, 30.1),      # collapses to one pixel after rounding
+]
+
+
+class TestBboxArrayToPixels:
+    """bbox_array_to_pixels should match bbox_to_pixels row for row."""
+
+    @pytest.mark.parametrize(
+        "clip, scale, trim_offset, offset_y",
+        [
+            (fitz.Rect(0, 0, 595, 842), 1.0, (0, 0), 0),
+            (fitz.Rect(0, 0, 595, 842), 2.5, (5, 10), 0),
+            (fitz.Rect(10, 20, 300, 400), 180 / 72.0, (3, 7), 1200),
+            (fitz.Rect(0.5, 0.5, 300, 400), 1.0, (0, 0), -40),
+        ],
+    )
+    def test_array_when_converted_then_matches_scalar(self, clip, scale, trim_offset, offset_y):
+        expected = [
+            bbox_to_pixels(box, clip, scale, trim_offset, offset_y) for box in BOXES
+        ]
+
+        pixels = bbox_array_to_pixels(np.array(BOXES), clip, scale, trim_offset, offset_y)
+
+        assert pixels.dtype == np.int32
+        assert pixels.tolist() == expected
+
+    def test_array_when_halves_then_rounds_half_to_even(self):
+        pixels = bbox_array_to_pixels(
+            np.array([BOXES[1]]), fitz.Rect(0, 0, 100, 100), 1.0, (0, 0)
+        )
+
+        assert pixels.tolist() == [[2, 4, 4, 6]]
+
+    def test_array_when_degenerate_then_keeps_one_pixel_extent(self):
+        pixels = bbox_array_to_pixels(
+            np.array([BOXES[3]]), fitz.Rect(0, 0, 100, 100), 1.0, (0, 0)
+        )
+
+        assert pixels.tolist() == [[50, 60, 51, 61]]
@@ -0,0 +1,66 @@
+"""
+Tests for common.path_utils label and filename parsing.
+"""
+
+import re
+
+import pytest
+
+from gcse_toolkit.common.path_utils import part_tokens
+
+
+def _regex_part_tokens(label):
+    """The original regex implementation, kept as the reference behaviour."""
+    tokens = []
+    m = re.match(r"q(\d+)", label, re.IGNORECASE)
+    remainder = label
+    if m:
+        tokens.append(m.group(1))
+        remainder = remainder[m.end():]
+    for piece in re.findall(r"\(([A-Za-z0-9]+)\)", remainder):
+        tokens.append(piece.lower())
+    if not tokens:
+        cleaned = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+        if cleaned:
+            tokens.append(cleaned.lower())
+    return tokens
+
+
+class TestPartTokens:
+    """Tests for part_tokens."""
+
+    @pytest.mark.parametrize(
+        "label, expected",
+        [
+            ("q3", ("3",)),
+            ("q1(a)(ii)", ("1", "a", "ii")),
+            ("Q12(B)(IV)", ("12", "b", "iv")),   # upper-case Q and parts
+            ("q5(a", ("5",)),                    # unclosed parenthesis
+            ("q5()(b)", ("5", "b")),             # empty parentheses
+            ("q5(a(b)", ("5", "b")),             # unclosed then closed
+            ("q٣(a)", ("٣", "a")),               # Unicode digits count, as with \d
+            ("q(é)(a)", ("a",)),                 # non-ASCII part is skipped
+            ("Extra Question!", ("extra_question",)),  # _CLEAN_RE fallback
+            ("(", ()),                           # nothing usable at all
+            ("", ()),
+        ],
+    )
+    def test_part_tokens_when_label_then_expected_tuple(self, label, expected):
+        assert part_tokens(label) == expected
+
+    @pytest.mark.parametrize(
+        "label",
+        [
+            "q3", "Q12(B)(IV)", "q5(a", "q5()(b)", "q5(a(b)", "q٣(a)", "q٣",
+            "q(é)(a)", "x(a)", "qq1(a)", "q1 (a) (b)", "Extra Question!", "((", "",
+            "q0012(a1)", "é", "q_1",
+        ],
+    )
+    def test_part_tokens_when_label_then_matches_regex_reference(self, label):
+        assert list(part_tokens(label)) == _regex_part_tokens(label)
+
+    def test_part_tokens_when_called_then_returns_cached_tuple(self):
+        first = part_tokens("q7(c)")
+
+        assert isinstance(first, tuple)
+        assert part_tokens("q7(c)") is first
@@ -0,0 +1,153 @@
+"""
+Tests for common.topics sub-topic pattern matching and caching.
+"""
+
+from functools import cache
+
+import pytest
+
+from gcse_toolkit.common import topics
+
+
+EXAM = "9990"
+TOPIC = "01. Data representation"
+
+
+@pytest.fixture
+def raw_mapping(monkeypatch):
+    """Serve a mutable in-memory subtopics mapping for EXAM."""
+    raw = {
+        TOPIC: {
+            "sub_topics": [
+                {"name": "Binary", "patterns": [r"\bbinary\b", r"\bbase 2\b"]},
+                {"name": "Hex", "patterns": [r"\bhex(adecimal)?\b"]},
+                {"name": "Start", "patterns": [r"^convert\b"]},
+                {"name": "Repeat", "patterns": [r"(ab)\1"]},
+                {"name": "Flagged", "patterns": [r"(?x) s p a c e d", r"\bflag\b"]},
+                {"name": "Named", "patterns": [r"(?P<n>one)", r"(?P<n>two)"]},
+                {"name": "Broken", "patterns": [r"(unclosed", r"\bbroken\b"]},
+            ]
+        }
+    }
+    monkeypatch.setattr(topics, "_raw_mapping", cache(lambda exam_code: raw))
+    topics.clear_topic_caches()
+    yield raw
+    topics.clear_topic_caches()
+
+
+@pytest.fixture
+def gated_mapping(raw_mapping):
+    """Only sub-topics that can share one gate alternation."""
+    raw_mapping[TOPIC]["sub_topics"] = raw_mapping[TOPIC]["sub_topics"][:3]
+    topics.clear_topic_caches()
+    return raw_mapping
+
+
+def _fused(name):
+    entries = dict(topics._fused_mapping(EXAM)[TOPIC])
+    return entries[name]
+
+
+class TestFusedMapping:
+    """Tests for per-sub-topic pattern fusion."""
+
+    def test_fused_when_plain_patterns_then_single_alternation(self, raw_mapping):
+        (fused,) = _fused("Binary")
+
+        assert fused.search("in BASE 2")
+        assert fused.search("a binary number")
+        assert not fused.search("binaryish")
+
+    def test_fused_when_backreference_then_keeps_patterns_separate(self, raw_mapping):
+        patterns = _fused("Repeat")
+
+        assert [p.pattern for p in patterns] == [r"(ab)\1"]
+        assert topics._alternation(
+            [topics.re.compile(r"x"), topics.re.compile(r"(ab)\1")]
+        ) is None
+
+    def test_fused_when_global_inline_flag_then_keeps_patterns_separate(self, raw_mapping):
+        """Rejected explicitly, since Python 3.10 only warns when combining."""
+        patterns = _fused("Flagged")
+
+        assert len(patterns) == 2
+        assert patterns[0].search("spaced")
+
+    def test_fused_when_combination_does_not_compile_then_keeps_patterns(self, raw_mapping):
+        """Duplicate group names compile alone but not as one alternation."""
+        patterns = _fused("Named")
+
+        assert len(patterns) == 2
+
+    def test_compiled_when_pattern_invalid_then_dropped(self, raw_mapping):
+        patterns = _fused("Broken")
+
+        assert [p.pattern for p in patterns] == [r"\bbroken\b"]
+
+
+class TestClearTopicCaches:
+    """Tests for clear_topic_caches."""
+
+    def test_clear_when_mapping_changes_then_new_patterns_used(self, raw_mapping):
+        assert topics.classify_sub_topics(TOPIC, "octal", exam_code=EXAM) == [
+            topics.FALLBACK_SUB_TOPIC
+        ]
+
+        raw_mapping[TOPIC]["sub_topics"].append({"name": "Octal", "patterns": [r"\boctal\b"]})
+        # Still served from the cached compiled mapping
+        assert topics.classify_sub_topics(TOPIC, "octal", exam_code=EXAM) == [
+            topics.FALLBACK_SUB_TOPIC
+        ]
+
+        topics.clear_topic_caches()
+
+        assert topics.classify_sub_topics(TOPIC, "octal", exam_code=EXAM) == ["Octal"]
+
+
+def _reference(text):
+    """Sub-topics found by searching every compiled pattern individually."""
+    entries = topics._compiled_mapping(EXAM).entries[TOPIC]
+    names = [name for name, patterns in entries if any(p.search(text) for p in patterns)]
+    return names or [topics.FALLBACK_SUB_TOPIC]
+
+
+class TestClassifySubTopics:
+    """classify_sub_topics should agree with per-pattern search."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "photosynthesis in leaves",          # no match
+            "give the hex value, then binary",    # later sub-topic matches first
+            "convert 13 to binary",               # ^ anchored at the start
+            "then convert binary",                # ^ cannot match mid-text
+            "a long preamble, then base 2",       # match late in the text
+        ],
+    )
+    def test_classify_when_gated_then_matches_per_pattern_search(self, gated_mapping, text):
+        assert topics._topic_gates(EXAM)[TOPIC] is not None
+        assert topics.classify_sub_topics(TOPIC, text, exam_code=EXAM) == _reference(text)
+
+    def test_classify_when_no_match_then_returns_fallback(self, gated_mapping):
+        assert topics.classify_sub_topics(TOPIC, "nothing relevant", exam_code=EXAM) == [
+            topics.FALLBACK_SUB_TOPIC
+        ]
+
+    def test_classify_when_later_sub_topic_matches_first_then_keeps_entry_order(
+        self, gated_mapping
+    ):
+        result = topics.classify_sub_topics(TOPIC, "hexadecimal", "and binary", exam_code=EXAM)
+
+        assert result == ["Binary", "Hex"]
+
+    def test_classify_when_anchored_pattern_then_only_matches_text_start(self, gated_mapping):
+        assert "Start" in topics.classify_sub_topics(TOPIC, "Convert to hex", exam_code=EXAM)
+        assert "Start" not in topics.classify_sub_topics(TOPIC, "hex: convert", exam_code=EXAM)
+
+    def test_classify_when_gate_unavailable_then_searches_every_pattern(self, raw_mapping):
+        """A backreference anywhere in the topic disables the gate."""
+        assert topics._topic_gates(EXAM)[TOPIC] is None
+
+        result = topics.classify_sub_topics(TOPIC, "abab and binary", exam_code=EXAM)
+
+        assert result == ["Binary", "Repeat"] == _reference("abab and binary")
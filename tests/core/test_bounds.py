@@ -115,6 +115,17 @@ class TestSliceBounds:
         b2 = SliceBounds(top=100, bottom=200)
         assert b1.is_above(b2) is True
     
+    def test_crop_many_when_mixed_right_then_matches_crop_from(self):
+        """crop_many() should match per-bounds crop_from() results."""
+        Image = pytest.importorskip("PIL.Image")
+        image = Image.new("L", (120, 300))
+        bounds = [SliceBounds(0, 100), SliceBounds(100, 250, left=10, right=60)]
+        
+        crops = SliceBounds.crop_many(bounds, image)
+        
+        assert [c.size for c in crops] == [b.crop_from(image).size for b in bounds]
+        assert [c.size for c in crops] == [(120, 100), (50, 150)]
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Serialization Tests
     # ─────────────────────────────────────────────────────────────────────────
@@ -140,6 +151,14 @@ class TestSliceBounds:
         assert b.left == 10
         assert b.right == 200
     
+    def test_from_dict_when_equal_data_then_shares_instance(self):
+        """from_dict() should reuse one instance for equal inputs."""
+        a = SliceBounds.from_dict({"top": 5, "bottom": 15})
+        b = SliceBounds.from_dict({"top": 5, "bottom": 15, "left": 0})
+        assert a is b
+        with pytest.raises(ValueError):
+            SliceBounds.from_dict({"top": 15, "bottom": 5})
+    
     def test_roundtrip_when_serialized_then_equals_original(self):
         """to_dict/from_dict roundtrip should preserve data."""
         original = SliceBounds(top=50, bottom=150, left=10, right=200)
@@ -67,6 +67,14 @@ class TestMarks:
         assert m.value == 0
         assert m.source == "inferred"
     
+    def test_explicit_when_small_value_then_returns_shared_instance(self):
+        """Small explicit marks should be shared; large ones still validate."""
+        assert Marks.explicit(3) is Marks.explicit(3)
+        assert Marks.from_source(3, "explicit") is Marks.explicit(3)
+        assert Marks.explicit(500) == Marks(500, "explicit")
+        with pytest.raises(ValueError, match="cannot be negative"):
+            Marks.explicit(-1)
+    
     def test_aggregate_when_parts_given_then_sums_values(self):
         """aggregate() should sum child part marks."""
         p1 = Part("a", PartKind.LETTER, Marks.explicit(2), SliceBounds(0, 100))
@@ -83,6 +91,20 @@ class TestMarks:
         assert m.value == 0
         assert m.source == "aggregate"
     
+    def test_aggregate_values_when_list_or_array_then_sums_to_int(self):
+        """aggregate_values() should accept plain iterables and NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        from_list = Marks.aggregate_values([2, 3, 4])
+        from_array = Marks.aggregate_values(np.array([2, 3, 4], dtype=np.int32))
+        
+        assert from_list == from_array == Marks(9, "aggregate")
+        assert type(from_array.value) is int
+    
+    def test_aggregate_values_when_negative_sum_then_raises_error(self):
+        """aggregate_values() still rejects negative totals."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            Marks.aggregate_values([2, -5])
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Operator Tests
     # ─────────────────────────────────────────────────────────────────────────
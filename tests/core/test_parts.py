@@ -100,6 +100,18 @@ class TestPart:
                       SliceBounds(50, 250), children=(child1, child2))
         assert parent.total_marks == 5
     
+    def test_leaf_count_when_replaced_then_recomputed_from_new_children(self):
+        """Cached aggregates should follow the children passed to replace()."""
+        from dataclasses import replace
+        child1 = Part("1(a)", PartKind.LETTER, Marks.explicit(2), SliceBounds(100, 150))
+        child2 = Part("1(b)", PartKind.LETTER, Marks.explicit(3), SliceBounds(150, 200))
+        parent = Part("1", PartKind.QUESTION, Marks.aggregate([child1, child2]),
+                      SliceBounds(0, 250), children=(child1, child2))
+        assert (parent.total_marks, parent.leaf_count) == (5, 2)
+        
+        trimmed = replace(parent, children=(child1,))
+        assert (trimmed.total_marks, trimmed.leaf_count) == (2, 1)
+    
     def test_depth_when_question_then_returns_zero(self):
         """Question parts should have depth 0."""
         p = Part("1", PartKind.QUESTION, Marks.explicit(5), SliceBounds(0, 300))
@@ -164,6 +176,46 @@ class TestPart:
         found = question.find("1(a)(i)")
         assert found == roman
     
+    def test_child_at_when_y_in_child_then_returns_child(self):
+        """child_at() should locate the sibling containing y, or None in gaps."""
+        a = Part("1(a)", PartKind.LETTER, Marks.explicit(2), SliceBounds(50, 100))
+        b = Part("1(b)", PartKind.LETTER, Marks.explicit(3), SliceBounds(120, 200))
+        question = Part("1", PartKind.QUESTION, Marks.aggregate([a, b]),
+                        SliceBounds(0, 250), children=(a, b))
+        
+        assert question.child_at(50) == a
+        assert question.child_at(150) == b
+        assert question.child_at(110) is None  # gap between siblings
+        assert question.child_at(10) is None
+        assert question.child_at(200) is None  # bottom is exclusive
+    
+    def test_iter_ancestors_of_when_root_or_subtree_then_same_chain(self):
+        """Indexed root lookup should match the recursive subtree walk."""
+        roman = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        letter = Part("1(a)", PartKind.LETTER, Marks.aggregate([roman]),
+                      SliceBounds(50, 200), children=(roman,))
+        question = Part("1", PartKind.QUESTION, Marks.aggregate([letter]),
+                        SliceBounds(0, 250), children=(letter,))
+        
+        assert list(question.iter_ancestors_of("1(a)(i)")) == [question, letter]
+        assert list(letter.iter_ancestors_of("1(a)(i)")) == [letter]
+        assert list(question.iter_ancestors_of("1")) == []
+        assert list(question.iter_ancestors_of("9(z)")) == []
+        assert letter.find("1(a)(i)") == question.find("1(a)(i)") == roman
+    
+    def test_part_at_when_y_in_leaf_then_returns_deepest_part(self):
+        """part_at() should descend to the deepest part containing y."""
+        roman = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        letter = Part("1(a)", PartKind.LETTER, Marks.aggregate([roman]),
+                      SliceBounds(50, 200), children=(roman,))
+        question = Part("1", PartKind.QUESTION, Marks.aggregate([letter]),
+                        SliceBounds(0, 250), children=(letter,))
+        
+        assert question.part_at(120) == roman
+        assert question.part_at(60) == letter  # letter header above the roman
+        assert question.part_at(10) == question
+        assert question.part_at(400) is None
+    
     def test_find_when_label_not_exists_then_returns_none(self):
         """find() should return None for non-existent label."""
         p = Part("1", PartKind.QUESTION, Marks.explicit(5), SliceBounds(0, 300))
@@ -188,3 +240,86 @@ class TestPart:
         assert restored.kind == original.kind
         assert restored.marks.value == original.marks.value
         assert restored.bounds == original.bounds
+    
+    def test_roundtrip_when_nested_tree_then_preserves_structure(self):
+        """Iterative to_dict/from_dict should keep child order and nesting."""
+        r1 = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        r2 = Part("1(a)(ii)", PartKind.ROMAN, Marks.explicit(3), SliceBounds(150, 200))
+        letter_a = Part("1(a)", PartKind.LETTER, Marks.aggregate([r1, r2]),
+                        SliceBounds(50, 250), context_bounds=SliceBounds(50, 100),
+                        children=(r1, r2))
+        letter_b = Part("1(b)", PartKind.LETTER, Marks.explicit(4), SliceBounds(250, 350))
+        original = Part("1", PartKind.QUESTION, Marks.aggregate([letter_a, letter_b]),
+                        SliceBounds(0, 400), children=(letter_a, letter_b))
+        
+        data = original.to_dict()
+        assert [c["label"] for c in data["children"]] == ["1(a)", "1(b)"]
+        assert [c["label"] for c in data["children"][0]["children"]] == ["1(a)(i)", "1(a)(ii)"]
+        
+        restored = Part.from_dict(data)
+        assert restored == original
+        assert restored.to_dict() == data
+    
+    def test_to_dict_when_result_mutated_then_later_calls_unaffected(self):
+        """to_dict() memoizes per node but must hand out fresh dicts each call."""
+        roman = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150),
+                     sub_topics=("Arrays",))
+        letter = Part("1(a)", PartKind.LETTER, Marks.aggregate([roman]),
+                      SliceBounds(50, 200), children=(roman,))
+        
+        first = letter.to_dict()
+        expected = Part.from_dict(first).to_dict()
+        first["label"] = "X"
+        first["bounds"]["top"] = 999
+        first["children"][0]["label"] = "Y"
+        first["children"][0]["sub_topics"].append("Loops")
+        
+        assert letter.to_dict() == expected
+        assert roman.to_dict() == expected["children"][0]
+        assert list(letter.to_dict()) == list(expected)  # key order kept
+    
+    def test_hash_when_equal_trees_then_match_and_survive_pickle(self):
+        """Equal trees should hash equal; pickling must not carry the cached hash."""
+        import pickle
+        
+        def build() -> Part:
+            roman = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+            return Part("1(a)", PartKind.LETTER, Marks.aggregate([roman]),
+                        SliceBounds(50, 200), children=(roman,))
+        
+        a, b = build(), build()
+        assert a == b and hash(a) == hash(b)
+        assert len({a, b}) == 1
+        
+        restored = pickle.loads(pickle.dumps(a))
+        assert restored._hash is None
+        assert restored == a and hash(restored) == hash(a)
+    
+    def test_to_table_when_tree_then_rows_follow_pre_order(self):
+        """to_table() should give one pre-order row per part with parent links."""
+        np = pytest.importorskip("numpy")
+        r1 = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        r2 = Part("1(a)(ii)", PartKind.ROMAN, Marks.explicit(3), SliceBounds(150, 200))
+        letter_a = Part("1(a)", PartKind.LETTER, Marks.aggregate([r1, r2]),
+                        SliceBounds(50, 250), children=(r1, r2))
+        letter_b = Part("1(b)", PartKind.LETTER, Marks.explicit(4), SliceBounds(250, 350, right=900))
+        question = Part("1", PartKind.QUESTION, Marks.aggregate([letter_a, letter_b]),
+                        SliceBounds(0, 400), children=(letter_a, letter_b))
+        
+        table = question.to_table()
+        
+        assert list(table["label"]) == [p.label for p in question.all_parts()]
+        assert list(table["parent"]) == [-1, 0, 1, 1, 0]
+        assert list(table["right"]) == [-1, -1, -1, -1, 900]
+        assert table["marks"][table["leaf"]].sum() == question.total_marks
+        assert table["marks"][table["depth"] == 2].sum() == 5
+    
+    def test_to_table_when_bounds_exceed_int16_then_widens_coordinates(self):
+        """Coordinates should be int16 when they fit and int32 otherwise."""
+        np = pytest.importorskip("numpy")
+        small = Part("1", PartKind.QUESTION, Marks.explicit(1), SliceBounds(0, 3000))
+        tall = Part("1", PartKind.QUESTION, Marks.explicit(1), SliceBounds(0, 40000))
+        
+        assert small.to_table().dtype["top"] == np.int16
+        assert tall.to_table().dtype["bottom"] == np.int32
+        assert tall.to_table()["bottom"][0] == 40000
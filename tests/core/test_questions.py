@@ -105,3 +105,53 @@ class TestQuestion:
         )
         # Expected leaves: 1(a)(i), 1(a)(ii), 1(b)
         assert len(q.leaf_parts) == 3
+    
+    def test_leaf_parts_when_accessed_twice_then_returns_cached_list(self, sample_question_node):
+        """Calculated properties should be computed once and reused."""
+        q = Question(
+            id="test",
+            exam_code="0478",
+            year=2021,
+            paper=1,
+            variant=1,
+            topic="Test",
+            question_node=sample_question_node,
+            composite_path=Path("/test"),
+            regions_path=Path("/test"),
+        )
+        assert q.leaf_parts is q.leaf_parts
+        assert q._leaf_parts is q.leaf_parts
+    
+    def test_label_sets_when_accessed_then_match_parts(self, sample_question_node):
+        """all_labels/leaf_labels should be cached frozensets of part labels."""
+        q = Question(
+            id="test",
+            exam_code="0478",
+            year=2021,
+            paper=1,
+            variant=1,
+            topic="Test",
+            question_node=sample_question_node,
+            composite_path=Path("/test"),
+            regions_path=Path("/test"),
+        )
+        assert q.leaf_labels == {"1(a)(i)", "1(a)(ii)", "1(b)"}
+        assert q.all_labels == q.leaf_labels | {"1", "1(a)"}
+        assert q.all_labels is q.all_labels
+    
+    def test_iter_leaf_parts_when_called_then_yields_cached_leaves(self, sample_question_node):
+        """iter_leaf_parts should walk the same cached tuple as leaf_parts."""
+        q = Question(
+            id="test",
+            exam_code="0478",
+            year=2021,
+            paper=1,
+            variant=1,
+            topic="Test",
+            question_node=sample_question_node,
+            composite_path=Path("/test"),
+            regions_path=Path("/test"),
+        )
+        assert isinstance(q.leaf_parts, tuple)
+        assert tuple(q.iter_leaf_parts()) == q.leaf_parts
+        assert [p.label for p in q.iter_all_parts()][:2] == ["1", "1(a)"]
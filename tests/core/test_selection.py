@@ -71,6 +71,37 @@ class TestSelectionPlan:
         assert plan.is_full_question is False
 
 
+    def test_leaves_when_partial_then_partitioned_in_tree_order(self, sample_question):
+        """included/excluded leaves and marks should come from one partition."""
+        plan = SelectionPlan(
+            question=sample_question,
+            included_parts=frozenset(["1(a)(ii)"]),
+        )
+        assert [p.label for p in plan.included_leaves] == ["1(a)(ii)"]
+        assert [p.label for p in plan.excluded_leaves] == ["1(a)(i)"]
+        assert plan.marks == 3
+    
+    def test_hash_when_equal_plans_then_dedupe_in_set(self, sample_question):
+        """Equal plans should hash equal so sets/dicts can dedupe them."""
+        a = SelectionPlan(sample_question, frozenset(["1(a)(i)"]))
+        b = SelectionPlan(sample_question, frozenset(["1(a)(i)"]))
+        c = SelectionPlan.full_question(sample_question)
+        
+        assert a == b and hash(a) == hash(b)
+        assert len({a, b, c}) == 2
+        assert hash(sample_question) == hash(sample_question.id)
+
+    
+    def test_hash_when_unpickled_then_recomputed(self, sample_question):
+        """The cached hash must not travel through pickle."""
+        import pickle
+        plan = SelectionPlan(sample_question, frozenset(["1(a)(i)"]))
+        hash(plan)
+        
+        restored = pickle.loads(pickle.dumps(plan))
+        assert restored._hash is None
+        assert restored == plan and hash(restored) == hash(plan)
+
 class TestSelectionResult:
     """Tests for SelectionResult dataclass."""
     
@@ -130,3 +161,15 @@ class TestSelectionResult:
         )
         assert "Topic A" in result.covered_topics
         assert "Topic B" in result.covered_topics
+    
+    def test_get_plan_when_indexed_then_finds_by_question_id(self, sample_plans):
+        """get_plan should resolve plans by question id."""
+        result = SelectionResult(plans=sample_plans, target_marks=10, tolerance=5)
+        
+        assert result.get_plan("q2") is sample_plans[1]
+        assert result.get_plan("missing") is None
+    
+    def test_init_when_duplicate_questions_then_raises_error(self, sample_plans):
+        """Duplicate question ids should be rejected."""
+        with pytest.raises(ValueError, match="Duplicate questions"):
+            SelectionResult(plans=(sample_plans[0], sample_plans[0]), target_marks=10, tolerance=5)
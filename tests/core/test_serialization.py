@@ -16,6 +16,9 @@ from gcse_toolkit.core.models.questions import Question
 from gcse_toolkit.core.utils.serialization import (
     serialize_question,
     deserialize_question,
+    dumps_part,
+    loads_part,
+    load_parts,
     serialize_regions,
     deserialize_regions,
     load_questions_jsonl,
@@ -87,6 +90,53 @@ class TestQuestionSerialization:
         assert len(restored.leaf_parts) == len(sample_question.leaf_parts)
 
 
+class TestPartSerialization:
+    """Tests for Part JSON bytes helpers."""
+    
+    def test_dumps_loads_when_part_tree_then_roundtrips(self):
+        """dumps_part/loads_part should roundtrip and match to_dict shape."""
+        roman = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        letter = Part("1(a)", PartKind.LETTER, Marks.aggregate([roman]),
+                      SliceBounds(50, 250), children=(roman,))
+        
+        raw = dumps_part(letter)
+        
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == letter.to_dict()
+        assert loads_part(raw) == letter
+    
+    def test_load_parts_when_valid_tree_then_matches_from_dict(self):
+        """load_parts should build the same tree (and caches) as from_dict."""
+        r1 = Part("1(a)(i)", PartKind.ROMAN, Marks.explicit(2), SliceBounds(100, 150))
+        r2 = Part("1(a)(ii)", PartKind.ROMAN, Marks.explicit(3), SliceBounds(150, 200))
+        letter = Part("1(a)", PartKind.LETTER, Marks.aggregate([r1, r2]),
+                      SliceBounds(50, 250), children=(r1, r2))
+        root = Part("1", PartKind.QUESTION, Marks.aggregate([letter]),
+                    SliceBounds(0, 300), children=(letter,))
+        
+        loaded = load_parts(root.to_dict())
+        
+        assert loaded == Part.from_dict(root.to_dict())
+        assert loaded.total_marks == 5
+        assert loaded.find("1(a)(ii)") == r2
+    
+    def test_load_parts_when_siblings_overlap_then_raises_error(self):
+        """load_parts should keep the constructor's sibling invariant."""
+        data = {
+            "label": "1", "kind": "question", "marks": 5,
+            "bounds": {"top": 0, "bottom": 300},
+            "children": [
+                {"label": "1(a)", "kind": "letter", "marks": 2,
+                 "bounds": {"top": 50, "bottom": 150}},
+                {"label": "1(b)", "kind": "letter", "marks": 3,
+                 "bounds": {"top": 100, "bottom": 200}},
+            ],
+        }
+        
+        with pytest.raises(ValueError, match="cannot overlap"):
+            load_parts(data)
+
+
 class TestRegionsSerialization:
     """Tests for regions serialization/deserialization."""
     
@@ -159,6 +209,82 @@ class TestJSONLOperations:
             assert loaded[1].topic == "Topic 2"
             assert loaded[2].total_marks == 2
     
+    def test_save_load_roundtrip_when_no_orjson_then_uses_stdlib(self, sample_questions, monkeypatch):
+        """The stdlib json fallback should read and write the same JSONL."""
+        from gcse_toolkit.core.utils import serialization
+        monkeypatch.setattr(serialization, "orjson", None)
+        
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "questions.jsonl"
+            
+            save_questions_jsonl(sample_questions, path)
+            loaded = load_questions_jsonl(path, validate=True)
+            
+            assert [q.id for q in loaded] == ["q1", "q2", "q3"]
+            assert loaded[2].question_node == sample_questions[2].question_node
+    
+    def test_load_when_line_malformed_then_raises_validation_error(self, sample_questions):
+        """A bad JSON line should surface as ValidationError with its line number."""
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "questions.jsonl"
+            save_questions_jsonl(sample_questions, path)
+            with open(path, "ab") as f:
+                f.write(b"{not json\n")
+            
+            with pytest.raises(ValidationError, match="line 4"):
+                load_questions_jsonl(path)
+    
+    def test_load_when_parallel_then_preserves_order(self, sample_questions, monkeypatch):
+        """The process-pool path should return questions in file order."""
+        from gcse_toolkit.core.utils import serialization
+        monkeypatch.setattr(serialization, "_PARALLEL_MIN_LINES", 2)
+        
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "questions.jsonl"
+            
+            save_questions_jsonl(sample_questions, path)
+            loaded = load_questions_jsonl(path, workers=2)
+            
+            assert [q.id for q in loaded] == ["q1", "q2", "q3"]
+            assert loaded[1].total_marks == 2
+
+    @pytest.mark.parametrize("workers", [1, None])
+    def test_load_when_default_or_single_cpu_then_stays_serial(
+        self, sample_questions, monkeypatch, workers
+    ):
+        """The pool is opt-in, and never used when only one worker would run."""
+        from gcse_toolkit.core.utils import serialization
+        monkeypatch.setattr(serialization, "_PARALLEL_MIN_LINES", 2)
+        monkeypatch.setattr(serialization.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(serialization, "ProcessPoolExecutor", None)
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "questions.jsonl"
+
+            save_questions_jsonl(sample_questions, path)
+            if workers == 1:
+                loaded = load_questions_jsonl(path)
+            else:
+                loaded = load_questions_jsonl(path, workers=workers)
+
+            assert [q.id for q in loaded] == ["q1", "q2", "q3"]
+
+    def test_load_when_parallel_line_malformed_then_reports_file_line(
+        self, sample_questions, monkeypatch
+    ):
+        """Errors from the pool should still name the file line, counting blanks."""
+        from gcse_toolkit.core.utils import serialization
+        monkeypatch.setattr(serialization, "_PARALLEL_MIN_LINES", 2)
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "questions.jsonl"
+            save_questions_jsonl(sample_questions, path)
+            with open(path, "ab") as f:
+                f.write(b"\n{not json\n")
+
+            with pytest.raises(ValidationError, match="line 5"):
+                load_questions_jsonl(path, workers=2)
+
     def test_load_when_file_not_found_then_raises_error(self):
         """load_questions_jsonl should raise FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -185,3 +311,18 @@ class TestRegionsFileOperations:
             assert len(loaded) == 3
             assert loaded["1"].top == 0
             assert loaded["1(a)(i)"].bottom == 150
+    
+    def test_save_when_pretty_then_indented_and_loadable(self):
+        """pretty=True should only change formatting, not content."""
+        regions = {"1": SliceBounds(0, 300)}
+        
+        with TemporaryDirectory() as tmpdir:
+            compact = Path(tmpdir) / "compact.json"
+            pretty = Path(tmpdir) / "pretty.json"
+            
+            save_regions_json(compact, "q1", regions, (800, 1200))
+            save_regions_json(pretty, "q1", regions, (800, 1200), pretty=True)
+            
+            assert "\n" not in compact.read_text(encoding="utf-8")
+            assert "\n  " in pretty.read_text(encoding="utf-8")
+            assert json.loads(compact.read_text()) == json.loads(pretty.read_text())
@@ -116,6 +116,15 @@ class TestValidateQuestion:
         with pytest.raises(ValidationError, match="Invalid bottom"):
             validate_question(valid_question_data, strict=False)
 
+    
+    def test_validate_when_nested_child_invalid_then_reports_child_path(self, valid_question_data):
+        """Errors in nested children should carry the full child path."""
+        letter = valid_question_data["question_node"]["children"][0]
+        letter["children"][1]["marks"] = -3
+        
+        with pytest.raises(ValidationError, match="Invalid marks") as exc_info:
+            validate_question(valid_question_data, strict=False)
+        assert exc_info.value.path == "question_node.children[0].children[1].marks"
 
 class TestValidateRegions:
     """Tests for validate_regions function."""
@@ -158,3 +167,20 @@ class TestValidateRegions:
         
         with pytest.raises(ValidationError, match="Invalid top"):
             validate_regions(valid_regions_data, strict=False)
+    
+    def test_validate_when_bounds_missing_bottom_then_raises_error(self, valid_regions_data):
+        """Bounds without bottom should raise ValidationError."""
+        del valid_regions_data["regions"]["1"]["bounds"]["bottom"]
+        
+        with pytest.raises(ValidationError, match="must have top and bottom"):
+            validate_regions(valid_regions_data, strict=False)
+    
+    def test_validate_when_strict_and_schema_violations_then_reports_all(self, valid_regions_data):
+        """Strict mode should collect every schema violation in one pass."""
+        pytest.importorskip("jsonschema")
+        validate_regions(valid_regions_data, strict=True)
+        
+        valid_regions_data["composite_size"] = {"width": "wide", "height": -1}
+        with pytest.raises(ValidationError, match="Schema validation failed") as exc_info:
+            validate_regions(valid_regions_data, strict=True)
+        assert len(exc_info.value.errors) == 2
@@ -41,6 +41,7 @@ def mock_question():
     
     q.leaf_parts = [p1, p2]
     q.all_parts = [p1, p2]
+    q.all_labels = frozenset({"(a)", "(b)"})
     q.question_node = MagicMock()
     return q
 
@@ -141,7 +142,8 @@ def test_select_questions_basic_fill():
         p.marks = MagicMock()
         p.marks.value = 10
         q.leaf_parts = [p]
-        q.all_parts = [p]  # REQUIRED for SelectionPlan validation
+        q.all_parts = [p]
+        q.all_labels = frozenset({"a"})  # REQUIRED for SelectionPlan validation
         questions.append(q)
         
     config = SelectionConfig(
@@ -166,6 +168,7 @@ def test_select_questions_topic_filtering():
     q1.leaf_parts[0].is_valid = True
     q1.leaf_parts[0].topic = None
     q1.all_parts = q1.leaf_parts
+    q1.all_labels = frozenset({"a"})
     q1.question_node = MagicMock()
     
     q2 = MagicMock(spec=Question)
@@ -176,6 +179,7 @@ def test_select_questions_topic_filtering():
     q2.leaf_parts[0].is_valid = True
     q2.leaf_parts[0].topic = None
     q2.all_parts = q2.leaf_parts
+    q2.all_labels = frozenset({"a"})
     q2.question_node = MagicMock()
     
     config = SelectionConfig(
@@ -0,0 +1,133 @@
+"""Tests for regex topic classification in extractor_v2.classification."""
+
+import pytest
+
+
+PATTERNS = {
+    "01. Data representation": [r"\bbinary\b", {"pattern": r"\bhexadecimal\b", "weight": 1.5}],
+    "02. Networks": [r"\bnetwork\b", r"\bprotocol\b"],
+}
+
+
+class TestBestTopic:
+    """Tests for best_topic scoring."""
+
+    def test_best_topic_when_patterns_overlap_then_scores_each_pattern(self):
+        """Patterns matching the same text should all contribute to the score."""
+        from gcse_toolkit.extractor_v2.classification import best_topic
+
+        patterns = {
+            "A": [r"binary", r"binary number"],
+            "B": [r"number"],
+        }
+
+        # A scores 2.0 (both patterns) vs B 1.0, so the margin check passes
+        assert best_topic("a binary number", patterns) == "A"
+
+    def test_best_topic_when_no_topic_matches_then_returns_none(self):
+        from gcse_toolkit.extractor_v2.classification import best_topic
+
+        assert best_topic("photosynthesis in leaves", PATTERNS) is None
+
+    def test_best_topic_when_inline_weight_then_uses_weight(self):
+        from gcse_toolkit.extractor_v2.classification import best_topic
+
+        assert best_topic("convert to hexadecimal", PATTERNS) == "01. Data representation"
+
+
+class TestCombinePatterns:
+    """Tests for the per-topic fast-reject alternation."""
+
+    def test_compile_when_patterns_joinable_then_combined_matches_any(self):
+        from gcse_toolkit.extractor_v2.classification import _compile_patterns_with_weights
+
+        _, _, combined = _compile_patterns_with_weights(PATTERNS)
+
+        networks = combined["02. Networks"]
+        assert networks.search("The PROTOCOL stack")
+        assert not networks.search("binary")
+
+    def test_combine_when_backreference_then_returns_none(self):
+        """Joining would renumber groups, so backreferences disable the fast path."""
+        import re
+        from gcse_toolkit.extractor_v2.classification import _combine_patterns
+
+        regexes = [re.compile(r"(a)"), re.compile(r"(b)\1")]
+
+        assert _combine_patterns(regexes) is None
+
+    def test_combine_when_global_inline_flag_then_returns_none(self):
+        import re
+        from gcse_toolkit.extractor_v2.classification import _combine_patterns
+
+        regexes = [re.compile(r"a"), re.compile(r"(?x) b c")]
+
+        assert _combine_patterns(regexes) is None
+
+
+class TestCompiledPatterns:
+    """Tests for the cached, precompiled pattern path."""
+
+    def test_best_topic_compiled_when_frozen_then_matches_best_topic(self):
+        from gcse_toolkit.extractor_v2.classification import (
+            best_topic, best_topic_compiled, _freeze_patterns,
+        )
+
+        frozen = _freeze_patterns(PATTERNS)
+
+        for text in ("binary and hexadecimal", "network protocol", "nothing here"):
+            assert best_topic_compiled(text, frozen, {}) == best_topic(text, PATTERNS)
+
+    def test_get_compiled_patterns_when_called_twice_then_shared(self):
+        from gcse_toolkit.extractor_v2.classification import _get_compiled_patterns
+
+        first = _get_compiled_patterns("0478", 1)
+
+        assert _get_compiled_patterns("0478", 1) is first
+        assert all(isinstance(r, tuple) for r in first.regexes.values())
+
+
+class TestClassifyTopicModel:
+    """Tests for how classify_topic consults the ML model."""
+
+    @pytest.fixture
+    def fake_exam(self, monkeypatch):
+        """Point classification at PATTERNS and a stub model that never predicts."""
+        from unittest.mock import MagicMock
+        from gcse_toolkit.extractor_v2 import classification
+
+        model = MagicMock()
+        model.predict.return_value = None
+        model.get_probabilities.return_value = {"02. Networks": 0.9}
+        frozen = classification._freeze_patterns(PATTERNS)
+        monkeypatch.setattr(classification, "_get_topic_patterns", lambda code, paper=1: PATTERNS)
+        monkeypatch.setattr(classification, "_get_compiled_patterns", lambda code, paper=1: frozen)
+        monkeypatch.setattr(classification, "_get_pattern_weights", lambda code: {})
+        monkeypatch.setattr(classification, "_get_topic_model", lambda code: model)
+        return model
+
+    def test_classify_topic_when_regex_confident_then_skips_probabilities(self, fake_exam):
+        from gcse_toolkit.extractor_v2.classification import classify_topic
+
+        assert classify_topic("network protocol", "9999") == "02. Networks"
+        fake_exam.get_probabilities.assert_not_called()
+
+    def test_classify_topic_when_regex_tied_then_uses_probabilities(self, fake_exam):
+        from gcse_toolkit.extractor_v2.classification import classify_topic
+
+        assert classify_topic("binary network", "9999") == "02. Networks"
+        fake_exam.get_probabilities.assert_called_once_with("binary network")
+
+    def test_classify_topics_when_batched_then_calls_model_once(self, fake_exam):
+        """Non-empty texts go to the model together; declined ones fall back to regex."""
+        from gcse_toolkit.extractor_v2.classification import classify_topics, UNKNOWN_TOPIC
+
+        fake_exam.predict_batch.return_value = ["01. Data representation", None]
+
+        topics = classify_topics(["anything", "  ", "network protocol"], "9999")
+
+        assert topics == ["01. Data representation", UNKNOWN_TOPIC, "02. Networks"]
+        fake_exam.predict_batch.assert_called_once_with(
+            ["anything", "network protocol"], min_conf=None
+        )
+        fake_exam.predict.assert_not_called()
@@ -0,0 +1,131 @@
+"""
+Tests for extractor_v2.cache module (PageRenderCache).
+"""
+
+import pytest
+import numpy as np
+from PIL import Image
+
+
+@pytest.fixture
+def doc():
+    """A one-page in-memory PDF with some text on it."""
+    import fitz
+    document = fitz.open()
+    page = document.new_page(width=200, height=100)
+    page.insert_text((20, 50), "Hello world", fontsize=20)
+    yield document
+    document.close()
+
+
+class TestPageRenderCache:
+    """Tests for PageRenderCache."""
+
+    def test_get_or_render_when_rendered_then_matches_pixmap(self, doc):
+        """Cached render should be identical to a direct grayscale render."""
+        import fitz
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=2)
+        image = cache.get_or_render(doc, 0, 100)
+
+        pix = doc[0].get_pixmap(
+            matrix=fitz.Matrix(100 / 72.0, 100 / 72.0), alpha=False, colorspace=fitz.csGRAY
+        )
+        expected = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        assert image.mode == "L"
+        assert np.array_equal(np.asarray(image), np.asarray(expected))
+        assert cache.size == 1
+
+    def test_crop_region_when_cached_then_matches_pil_crop(self, doc):
+        """Array-backed crops should match cropping the full PIL page."""
+        import fitz
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=2)
+        full = cache.get_or_render(doc, 0, 100)
+        clip = fitz.Rect(10, 10, 150, 90)
+
+        cropped, offset = cache.crop_region(0, 100, clip, doc[0].rect)
+
+        scale = 100 / 72.0
+        box = (int(10 * scale), int(10 * scale), int(150 * scale), int(90 * scale))
+        assert offset == (0, 0)
+        assert np.array_equal(np.asarray(cropped), np.asarray(full.crop(box)))
+
+    def test_crop_region_when_not_cached_then_raises_key_error(self, doc):
+        """Cropping an unrendered page should raise KeyError."""
+        import fitz
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache()
+        with pytest.raises(KeyError):
+            cache.crop_region(0, 100, fitz.Rect(0, 0, 10, 10), doc[0].rect)
+
+    def test_get_or_render_when_full_then_evicts_least_recently_used(self, doc):
+        """A cache hit should protect a page from the next eviction."""
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=2)
+        cache.get_or_render(doc, 0, 72)
+        cache.get_or_render(doc, 0, 100)
+        cache.get_or_render(doc, 0, 72)   # hit: 100 DPI is now oldest
+        cache.get_or_render(doc, 0, 150)  # evicts 100 DPI
+
+        assert list(cache._cache) == [(0, 72), (0, 150)]
+
+    def test_get_or_render_when_evicted_then_served_from_warm_tier(self, doc):
+        """Pages evicted from the hot tier should come back from compressed storage."""
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=1, max_warm=1)
+        first = np.asarray(cache.get_or_render(doc, 0, 72))
+        cache.get_or_render(doc, 0, 100)  # demotes 72 DPI to warm
+        assert list(cache._warm) == [(0, 72)]
+
+        restored = np.asarray(cache.get_or_render(doc, 0, 72))
+        assert np.array_equal(restored, first)
+        assert list(cache._cache) == [(0, 72)]
+        assert list(cache._warm) == [(0, 100)]
+
+    def test_get_or_render_mask_when_miss_then_caches_only_packed_bits(self, doc):
+        """A mask miss should not add the grayscale page to either tier."""
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=2)
+        packed = cache.get_or_render_mask(doc, 0, 100, 128)
+
+        page = np.asarray(PageRenderCache().get_or_render(doc, 0, 100))
+        assert cache.size == 0
+        assert not cache._warm
+        assert packed.dtype == np.uint8
+        assert packed.shape == (page.shape[0], (page.shape[1] + 7) // 8)
+        assert np.array_equal(
+            np.unpackbits(packed, axis=1, count=page.shape[1]).view(bool), page < 128
+        )
+
+    def test_crop_mask_when_unaligned_clip_then_matches_thresholded_crop(self, doc):
+        """Cropped unpacking should match thresholding the cropped grayscale page."""
+        import fitz
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache(max_pages=2)
+        cache.get_or_render(doc, 0, 100)
+        cache.get_or_render_mask(doc, 0, 100, 128)
+
+        cropped = cache.crop_region_array(0, 100, fitz.Rect(13, 29, 151, 61), doc[0].rect)
+        mask = cache.crop_mask(0, 100, 128, fitz.Rect(13, 29, 151, 61), doc[0].rect)
+
+        assert mask.dtype == bool
+        assert mask.any()
+        assert np.array_equal(mask, cropped < 128)
+        assert cache.crop_mask(0, 100, 128, fitz.Rect(50, 50, 40, 60), doc[0].rect).size == 0
+
+    def test_crop_mask_when_not_cached_then_raises_key_error(self, doc):
+        import fitz
+        from gcse_toolkit.extractor_v2.cache import PageRenderCache
+
+        cache = PageRenderCache()
+        cache.get_or_render(doc, 0, 100)
+        with pytest.raises(KeyError):
+            cache.crop_mask(0, 100, 128, fitz.Rect(0, 0, 10, 10), doc[0].rect)
@@ -77,6 +77,29 @@ class TestPropagateTopics:
         assert result["(a)"] == "Arrays"  # Adopted from child
         assert result["6"] == "Arrays"    # Adopted from child
     
+    def test_first_classified_child_wins_when_several_classified(self):
+        """Parent adopts the first classified child in order, skipping Unknown ones."""
+        from gcse_toolkit.extractor_v2.classification import propagate_topics
+        
+        tree = make_part("6", [
+            make_part("(a)"),
+            make_part("(b)", [make_part("(i)")]),
+            make_part("(c)"),
+        ])
+        
+        part_topics = {
+            "6": "00. Unknown",
+            "(a)": "00. Unknown",
+            "(b)": "00. Unknown",
+            "(i)": "Loops",
+            "(c)": "Arrays",
+        }
+        
+        result = propagate_topics(part_topics, tree)
+        
+        assert result["(b)"] == "Loops"
+        assert result["6"] == "Loops"
+    
     def test_sibling_topic_fills_unknown_middle(self):
         """Unknown sibling adopts topic when neighbors agree."""
         from gcse_toolkit.extractor_v2.classification import propagate_topics
@@ -138,6 +161,18 @@ class TestGetConsensusTopic:
         
         assert result == "Arrays"  # 2 vs 1
     
+    def test_returns_first_seen_topic_on_tie(self):
+        from gcse_toolkit.extractor_v2.classification import get_consensus_topic
+        
+        part_topics = {
+            "(a)": "Loops",
+            "(b)": "Arrays",
+            "(c)": "Arrays",
+            "(d)": "Loops",
+        }
+        
+        assert get_consensus_topic(part_topics) == "Loops"
+    
     def test_returns_unknown_when_all_unknown(self):
         from gcse_toolkit.extractor_v2.classification import get_consensus_topic, UNKNOWN_TOPIC
         
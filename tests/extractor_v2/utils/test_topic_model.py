@@ -0,0 +1,53 @@
+"""Tests for batched prediction in extractor_v2.utils.topic_model."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("joblib")
+
+from gcse_toolkit.extractor_v2.utils.topic_model import TopicModel
+
+
+class _RowModel:
+    """Stand-in classifier: each feature row holds its own probabilities."""
+
+    def predict_proba(self, x):
+        return np.asarray(x, dtype=float)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """A TopicModel whose 'features' are fixed probability rows per text."""
+    rows = {
+        "sure": [0.9, 0.1],
+        "unsure": [0.45, 0.55],
+    }
+    topic_model = TopicModel.__new__(TopicModel)
+    topic_model.model = _RowModel()
+    topic_model.topics = ["Arrays", "Loops"]
+    topic_model.confusion_clfs = {}
+    topic_model.optimal_threshold = 0.6
+    monkeypatch.setattr(
+        topic_model, "_vectorize_batch", lambda texts: np.array([rows[t] for t in texts])
+    )
+    return topic_model
+
+
+class TestTopicModelBatch:
+    """Batched calls should agree with the per-text API."""
+
+    def test_predict_batch_when_mixed_confidence_then_matches_predict(self, model):
+        texts = ["sure", "unsure"]
+
+        assert model.predict_batch(texts) == ["Arrays", None]
+        assert model.predict_batch(texts) == [model.predict(t) for t in texts]
+        assert model.predict_batch(texts, min_conf=0.0) == ["Arrays", "Loops"]
+
+    def test_get_probabilities_batch_when_called_then_one_dict_per_text(self, model):
+        probs = model.get_probabilities_batch(["sure", "unsure"])
+
+        assert probs == [
+            {"Arrays": 0.9, "Loops": 0.1},
+            {"Arrays": 0.45, "Loops": 0.55},
+        ]
+        assert probs[1] == model.get_probabilities("unsure")